@@ -0,0 +1,140 @@
+"""게시글 목록(GET /posts?limit=50) 응답 압축 비용/이득 비교
+
+게시글 50개(본문 최대 1500자, 한글 위주)로 실제 목록 응답과 같은 JSON 본문을 만들고
+util.compression.CompressionMiddleware를 거친 응답을 인코딩/레벨별로 비교한다.
+- 응답당 압축 CPU 시간 (미들웨어 포함, 압축 없이 보낼 때와의 차이)
+- 압축 후 크기와 절약한 바이트
+brotli는 설치되어 있을 때만 측정한다.
+ASGI 앱을 같은 프로세스에서 직접 호출하므로 네트워크 전송 시간은 포함되지 않는다.
+
+사용법 (저장소 루트에서):
+    python benchmark/compression.py [반복 횟수]
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from controller.posts import _augment_row, _format_counts
+from util import compression
+from util.compression import CompressionMiddleware
+from util.jsonResponse import FastJSONResponse
+
+PAGE_SIZE = 50
+# 본문 어휘: 자주 쓰는 음절로 만든 단어 400개 (실제 게시글처럼 반복되는 단어가 많지만 완전히 같은 문장은 드묾)
+_SYLLABLES = "가나다라마바사아자차카타파하개발서버배포질문답변성능캐시쿼리리뷰회고오늘정말그리고하지만프로젝트팀코드테스트"
+
+
+def _vocabulary(rng: random.Random) -> list:
+    words = ["FastAPI", "MySQL", "API", "DB", "PR", "CI", "1", "2", "3", "10", "100"]
+    while len(words) < 400:
+        words.append("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return words
+
+
+def _content(rng: random.Random, words: list) -> str:
+    target = rng.randint(200, 1500)
+    out = []
+    length = 0
+    while length < target:
+        word = rng.choice(words)
+        if rng.random() < 0.08:
+            word += rng.choice(".,?!")
+        out.append(word)
+        length += len(word) + 1
+    return " ".join(out)[:1500]
+
+
+def _make_body() -> dict:
+    rng = random.Random(42)
+    words = _vocabulary(rng)
+    base = datetime(2025, 9, 1, 9, 0, 0)
+    rows = []
+    for i in range(PAGE_SIZE):
+        profile = f"/public/image/profile/{rng.getrandbits(256):064x}.png"
+        rows.append(_augment_row({
+            "post_id": 10_000 - i,
+            "post_title": f"게시글 제목 {i}",
+            "post_content": _content(rng, words),
+            "user_id": rng.randint(1, 500),
+            "nickname": f"사용자{rng.randint(1, 500)}",
+            "file_id": i if i % 3 == 0 else None,
+            "created_at": base - timedelta(minutes=i * 7),
+            "updated_at": base - timedelta(minutes=i * 5),
+            "deleted_at": None,
+            "like": rng.randint(0, 3000),
+            "comment_count": rng.randint(0, 80),
+            "hits": rng.randint(0, 200_000),
+            "profile_image_path": profile,
+            "profileImageVariants": {"avatar": profile.replace(".png", "-avatar.webp")},
+        }))
+    _format_counts(rows)
+    return {"status_code": 200, "status_message": "get_post_list_success", "data": rows, "nextCursor": "eyJ4Ijox"}
+
+
+async def _request(app, accept_encoding: str) -> tuple:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/posts", "raw_path": b"/posts", "root_path": "",
+        "query_string": b"limit=50", "headers": [(b"accept-encoding", accept_encoding.encode())],
+        "client": ("127.0.0.1", 50000), "server": ("localhost", 8000),
+    }
+    size = 0
+    encoding = None
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size, encoding
+        if message["type"] == "http.response.start":
+            encoding = dict(message["headers"]).get(b"content-encoding")
+        elif message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size, encoding
+
+
+async def main(rounds: int):
+    body = _make_body()
+
+    # 엔드포인트: 미리 만든 본문을 매번 직렬화해서 응답 (압축 비용만 차이 나도록)
+    async def endpoint(scope, receive, send):
+        await FastJSONResponse(body)(scope, receive, send)
+
+    candidates = [("identity", "identity", {})]
+    for level in (1, 4, 6, 9):
+        candidates.append((f"gzip level {level}", "gzip", {"gzip_level": level}))
+    if compression.brotli is not None:
+        for quality in (1, 4, 6, 9):
+            candidates.append((f"br quality {quality}", "br", {"brotli_quality": quality}))
+    else:
+        print("brotli is not installed; only gzip is measured")
+
+    print(f"GET /posts?limit={PAGE_SIZE}, {rounds} rounds")
+    print(f"{'encoding':<18}{'ms/resp':>9}{'+cpu ms':>9}{'bytes':>9}{'saved':>9}{'ratio':>8}{'resp/s/core':>13}")
+    baseline_ms = baseline_size = None
+    for name, accept, options in candidates:
+        app = CompressionMiddleware(endpoint, **options)
+        await _request(app, accept)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            size, _ = await _request(app, accept)
+        per_ms = (time.perf_counter() - start) / rounds * 1000
+        if baseline_ms is None:
+            baseline_ms, baseline_size = per_ms, size
+        print(
+            f"{name:<18}{per_ms:>9.3f}{per_ms - baseline_ms:>9.3f}{size:>9}{baseline_size - size:>9}"
+            f"{size / baseline_size:>8.2f}{1000 / per_ms:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 300))
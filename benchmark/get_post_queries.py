@@ -0,0 +1,113 @@
+"""게시글 상세 조회 경로별 지연 비교 (MySQL 필요)
+
+- before: 기존 get_post 경로 (게시글+첨부파일 SELECT, 조회수 UPDATE+커밋, 작성자 file_id SELECT, 프로필 이미지 SELECT)
+- after: post_model의 단일 JOIN 쿼리 (조회수는 hit_buffer가 나중에 한 번에 반영하므로 요청 경로에 없음)
+캐시를 거치지 않고 DB 조회 경로만 반복 호출해 호출당 지연과 쿼리 수를 출력한다.
+before 경로의 조회수 UPDATE는 데이터가 바뀌지 않도록 커밋 대신 롤백한다 (왕복 횟수는 같음).
+
+측정 결과는 아직 없다 (MySQL이 있는 환경에서 실행해 본 적이 없음).
+확인된 것은 쿼리 수뿐이다: 가짜 커넥션으로 두 경로를 실행하면 before는 4개, after는 1개의 SQL을 실행한다.
+지연 개선 여부는 이 스크립트를 실제 DB에 실행해서 확인해야 한다.
+
+사용법 (저장소 루트에서, .env.dev의 DB 설정 사용):
+    python benchmark/get_post_queries.py <post_id> [반복 횟수]
+"""
+import os
+import sys
+import time
+from statistics import median
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from database.index import get_connection, init_pool, close_pool
+from database.instrumentation import RequestQueryStats, current_request_stats
+from model import post_model
+
+
+# 비교 기준: 교체되기 전 get_post의 쿼리 순서
+def legacy_get_post(post_id: int):
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT
+                post_table.post_id,
+                post_table.post_title,
+                post_table.post_content,
+                post_table.file_id,
+                post_table.user_id,
+                post_table.nickname,
+                post_table.created_at,
+                post_table.updated_at,
+                post_table.deleted_at,
+                post_table.`like`,
+                post_table.comment_count,
+                post_table.hits,
+                COALESCE(file_table.file_path, NULL) AS filePath
+            FROM post_table
+            LEFT JOIN file_table ON post_table.file_id = file_table.file_id
+            WHERE post_table.post_id = %s AND post_table.deleted_at IS NULL;
+            """,
+            (post_id,),
+        )
+        post_result = cur.fetchone()
+        if not post_result:
+            return None
+
+        cur.execute("UPDATE post_table SET hits = hits + 1 WHERE post_id = %s;", (post_id,))
+        conn.rollback()
+
+        cur.execute("SELECT file_id FROM user_table WHERE user_id = %s;", (post_result["user_id"],))
+        user_result = cur.fetchone()
+        if user_result:
+            cur.execute(
+                "SELECT file_path FROM file_table WHERE file_id = %s AND file_category = 1 AND user_id = %s;",
+                (user_result["file_id"], post_result["user_id"]),
+            )
+            profile_image_result = cur.fetchone()
+            if profile_image_result:
+                post_result["profileImage"] = profile_image_result["file_path"]
+        return post_result
+
+
+def _measure(func, post_id: int, count: int):
+    stats = RequestQueryStats()
+    token = current_request_stats.set(stats)
+    timings = []
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            func(post_id)
+            timings.append(time.perf_counter() - start)
+    finally:
+        current_request_stats.reset(token)
+    timings.sort()
+    return timings, stats.count / count
+
+
+def main(post_id: int, count: int):
+    init_pool()
+    # @db_task로 감싸기 전의 동기 함수
+    single_query = post_model._select_post.__wrapped__
+    if single_query(post_id) is None:
+        print(f"post {post_id} not found")
+        return
+    paths = [("4 round trips (before)", legacy_get_post), ("single join (after)", single_query)]
+    for _, func in paths:
+        _measure(func, post_id, min(count, 100))
+
+    print(f"{'path':<26}{'queries':>9}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, func in paths:
+        timings, queries = _measure(func, post_id, count)
+        mean = sum(timings) / len(timings)
+        p99 = timings[max(int(len(timings) * 0.99) - 1, 0)]
+        print(f"{name:<26}{queries:>9.1f}{mean * 1000:>10.3f}{median(timings) * 1000:>10.3f}{p99 * 1000:>10.3f}")
+    close_pool()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    main(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
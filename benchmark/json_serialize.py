@@ -0,0 +1,119 @@
+"""게시글 목록 한 페이지(100개) JSON 직렬화 비교
+
+DB에서 읽은 것과 같은 모양(datetime, Decimal 포함)의 게시글 100개를 만들어
+응답 본문 바이트를 만드는 데 걸리는 시간을 비교한다.
+- jsonable_encoder + JSONResponse: 엔드포인트가 dict를 반환할 때 FastAPI 기본 경로
+- pydantic TypeAdapter.dump_json: 응답 스키마(TypedDict)로 검증 후 직렬화
+- FastJSONResponse: util.jsonResponse (orjson이 있으면 orjson, 없으면 표준 json)
+- orjson: 설치되어 있을 때만
+
+사용법 (저장소 루트에서):
+    python benchmark/json_serialize.py [반복 횟수]
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional, TypedDict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from starlette.responses import JSONResponse
+
+from controller.posts import _augment_row
+from util import jsonResponse
+from util.jsonResponse import FastJSONResponse
+
+PAGE_SIZE = 100
+
+
+class PostItem(TypedDict):
+    post_id: int
+    post_title: str
+    post_content: str
+    user_id: int
+    nickname: str
+    file_id: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+    deleted_at: Optional[datetime]
+    like: Decimal
+    comment_count: Decimal
+    hits: Decimal
+    profileImagePath: Optional[str]
+    profileImageThumbnailPath: Optional[str]
+
+
+class PostListBody(TypedDict):
+    status_code: int
+    status_message: str
+    data: List[PostItem]
+
+
+def _make_page() -> dict:
+    base = datetime(2025, 9, 1, 9, 0, 0)
+    rows = []
+    for i in range(PAGE_SIZE):
+        profile = f"/public/image/profile/ab/cd/{i:064x}.png"
+        rows.append(_augment_row({
+            "post_id": 10_000 - i,
+            "post_title": f"게시글 제목 {i}",
+            "post_content": "본문 미리보기 " * 20,
+            "user_id": i % 37 + 1,
+            "nickname": f"사용자{i % 37}",
+            "file_id": i if i % 3 == 0 else None,
+            "created_at": base - timedelta(minutes=i * 7),
+            "updated_at": base - timedelta(minutes=i * 5),
+            "deleted_at": None,
+            # COUNT/SUM 집계 컬럼은 PyMySQL이 Decimal로 돌려줌
+            "like": Decimal(i * 3),
+            "comment_count": Decimal(i % 11),
+            "hits": Decimal(i * 41),
+            "profile_image_path": profile,
+            "profileImageVariants": {"avatar": profile.replace(".png", "-avatar.webp")},
+        }))
+    return {"status_code": 200, "status_message": "get_post_list_success", "data": rows}
+
+
+def _bench(name: str, fn, rounds: int, baseline: Optional[float]) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        body = fn()
+    per_call = (time.perf_counter() - start) / rounds
+    speedup = f"{baseline / per_call:>8.1f}x" if baseline else f"{'1.0x':>9}"
+    print(f"{name:<40}{per_call * 1e6:>10.0f} us{speedup}{len(body):>10}")
+    return per_call
+
+
+def main(rounds: int):
+    page = _make_page()
+    adapter = TypeAdapter(PostListBody)
+    candidates = [
+        ("jsonable_encoder + JSONResponse (before)", lambda: JSONResponse(jsonable_encoder(page)).body),
+        ("TypeAdapter.dump_json", lambda: adapter.dump_json(page)),
+        (f"FastJSONResponse ({'orjson' if jsonResponse.orjson else 'stdlib'})", lambda: FastJSONResponse(page).body),
+    ]
+    if jsonResponse.orjson is None:
+        try:
+            import orjson
+        except ImportError:
+            print("orjson is not installed; FastJSONResponse uses the stdlib fallback")
+        else:
+            candidates.append(("orjson.dumps", lambda: orjson.dumps(page, default=jsonResponse._default)))
+
+    print(f"page: {PAGE_SIZE} posts, {rounds} rounds")
+    print(f"{'serializer':<40}{'per page':>13}{'speedup':>9}{'bytes':>10}")
+    baseline = None
+    for name, fn in candidates:
+        per_call = _bench(name, fn, rounds, baseline)
+        baseline = baseline or per_call
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,114 @@
+"""인기 게시글 하나에 좋아요가 몰릴 때의 처리량 비교 (MySQL 필요)
+
+서로 다른 사용자 N명이 같은 게시글에 동시에 좋아요를 누르는 상황을 DB 스레드 여러 개로 재현한다.
+- row lock (before): 요청마다 post_like_table INSERT + post_table.like = like + 1 을 한 트랜잭션으로 커밋
+                     (모든 요청이 같은 post_table 행 잠금을 커밋할 때까지 잡으므로 순서대로 처리됨)
+- buffered (after): like_model 경로 (post_like_table INSERT만 커밋, 좋아요 수는 like_buffer에 모았다가 한 번에 반영)
+초당 처리 수, 요청 지연(p50/p99), InnoDB 행 잠금 대기 횟수, 마지막 반영 후 좋아요 수가 맞는지 출력한다.
+측정에 쓴 좋아요 행과 좋아요 수는 끝난 뒤 원래대로 되돌린다.
+
+사용법 (저장소 루트에서, .env.dev의 DB 설정 사용):
+    python benchmark/like_storm.py <post_id> [사용자 수] [동시 실행 수]
+"""
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from database.index import get_connection, init_pool, close_pool
+from model import like_model, post_model
+
+# 실제 사용자와 겹치지 않는 측정용 user_id 시작 값
+BENCH_USER_BASE = 900_000_000
+
+
+def _row_lock_like(post_id: int, user_id: int):
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("INSERT INTO post_like_table (post_id, user_id) VALUES (%s, %s)", (post_id, user_id))
+        cur.execute("UPDATE post_table SET `like` = `like` + 1 WHERE post_id = %s", (post_id,))
+        conn.commit()
+
+
+def _buffered_like(post_id: int, user_id: int):
+    # @db_task로 감싸기 전의 동기 함수 + like_model.like_post와 같은 버퍼 기록
+    inserted, _ = like_model._insert_like.__wrapped__(post_id, user_id)
+    if inserted:
+        post_model.like_buffer.add(post_id, 1)
+
+
+def _query_one(sql: str, args=()):
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, args)
+        return cur.fetchone()
+
+
+def _lock_waits() -> int:
+    row = _query_one("SHOW GLOBAL STATUS LIKE 'Innodb_row_lock_waits'")
+    return int(row["Value"]) if row else 0
+
+
+def _like_count(post_id: int) -> int:
+    return _query_one("SELECT `like` FROM post_table WHERE post_id = %s", (post_id,))["like"]
+
+
+def _reset(post_id: int, original_like: int):
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM post_like_table WHERE post_id = %s AND user_id >= %s", (post_id, BENCH_USER_BASE))
+        cur.execute("UPDATE post_table SET `like` = %s WHERE post_id = %s", (original_like, post_id))
+        conn.commit()
+
+
+def _run(func, post_id: int, users: int, concurrency: int):
+    latencies = []
+
+    def one(user_id: int):
+        start = time.perf_counter()
+        func(post_id, user_id)
+        latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(BENCH_USER_BASE, BENCH_USER_BASE + users)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return users / elapsed, latencies[len(latencies) // 2], latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+
+
+def main(post_id: int, users: int, concurrency: int):
+    init_pool()
+    original = _query_one("SELECT `like` FROM post_table WHERE post_id = %s AND deleted_at IS NULL", (post_id,))
+    if original is None:
+        print(f"post {post_id} not found")
+        close_pool()
+        return
+    original_like = original["like"]
+    print(f"post {post_id}: {users} users, {concurrency} concurrent")
+    print(f"{'path':<22}{'likes/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'lock waits':>12}{'count ok':>10}")
+    try:
+        for name, func in (("row lock (before)", _row_lock_like), ("buffered (after)", _buffered_like)):
+            _reset(post_id, original_like)
+            waits = _lock_waits()
+            rate, p50, p99 = _run(func, post_id, users, concurrency)
+            waits = _lock_waits() - waits
+            asyncio.run(post_model.like_buffer.flush())
+            ok = _like_count(post_id) == original_like + users
+            print(f"{name:<22}{rate:>10.0f}{p50 * 1000:>10.2f}{p99 * 1000:>10.2f}{waits:>12}{str(ok):>10}")
+    finally:
+        _reset(post_id, original_like)
+        close_pool()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    main(
+        int(sys.argv[1]),
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5000,
+        int(sys.argv[3]) if len(sys.argv) > 3 else int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+    )
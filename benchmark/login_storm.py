@@ -0,0 +1,106 @@
+"""로그인 폭주 중 다른 엔드포인트 지연 측정
+
+로그인 요청을 동시에 계속 보내면서 가벼운 엔드포인트(/ping)를 일정 간격으로 호출해
+로그인 처리량과 /ping 응답 지연(p50/p99)을 비교한다.
+- inline: bcrypt.checkpw를 이벤트 루프에서 바로 실행 (async def 안에서 동기 호출하던 방식)
+- hasher: util.passwordHasher의 전용 해싱 스레드풀에서 실행 (대기열이 가득 차면 503)
+DB 없이 비밀번호 검증 비용만 재현하며, ASGI 앱을 같은 프로세스에서 직접 호출한다.
+
+사용법 (저장소 루트에서):
+    python benchmark/login_storm.py [측정 시간(초)] [동시 로그인 수]
+"""
+import asyncio
+import os
+import sys
+import time
+from statistics import median
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import bcrypt
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from util.passwordHasher import SALT_ROUNDS, PasswordHasher, PasswordHasherBusyError
+
+PASSWORD = "Password1234!"
+HASHED = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(SALT_ROUNDS))
+
+
+def _build(hasher):
+    async def login(request):
+        if hasher is None:
+            ok = bcrypt.checkpw(PASSWORD.encode("utf-8"), HASHED)
+        else:
+            try:
+                ok = await hasher.verify(PASSWORD, HASHED)
+            except PasswordHasherBusyError:
+                return JSONResponse({"error": {"message": "server_busy", "data": None}}, status_code=503)
+        return JSONResponse({"message": "login_success", "data": {"ok": ok}})
+
+    async def ping(request):
+        return JSONResponse({"message": None, "data": None})
+
+    return Starlette(routes=[Route("/users/login", login, methods=["POST"]), Route("/ping", ping)])
+
+
+async def _storm(app, duration: float, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        deadline = time.perf_counter() + duration
+        statuses = {}
+        ping_timings = []
+
+        async def login_worker():
+            while time.perf_counter() < deadline:
+                response = await client.post("/users/login")
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code == 503:
+                    # 503이면 클라이언트처럼 잠시 쉬었다가 재시도
+                    await asyncio.sleep(0.01)
+
+        async def ping_worker():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                await client.get("/ping")
+                ping_timings.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(ping_worker(), *(login_worker() for _ in range(concurrency)))
+
+    ping_timings.sort()
+    return {
+        "logins": statuses.get(200, 0) / duration,
+        "rejected": statuses.get(503, 0),
+        "ping_p50": median(ping_timings),
+        "ping_p99": ping_timings[max(int(len(ping_timings) * 0.99) - 1, 0)],
+        "pings": len(ping_timings),
+    }
+
+
+async def main(duration: float, concurrency: int):
+    workers = os.cpu_count() or 1
+    modes = [
+        ("inline (before)", None),
+        (f"hasher {workers} threads (after)", PasswordHasher(workers=workers, max_pending=workers * 8)),
+    ]
+    print(f"{'mode':<30}{'login/s':>10}{'503s':>8}{'pings':>8}{'ping p50 ms':>14}{'ping p99 ms':>14}")
+    for name, hasher in modes:
+        result = await _storm(_build(hasher), duration, concurrency)
+        print(
+            f"{name:<30}{result['logins']:>10.1f}{result['rejected']:>8}{result['pings']:>8}"
+            f"{result['ping_p50'] * 1000:>14.2f}{result['ping_p99'] * 1000:>14.2f}"
+        )
+        if hasher is not None:
+            hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 5.0,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    ))
@@ -0,0 +1,135 @@
+"""미들웨어 스택의 요청당 오버헤드 측정
+
+BaseHTTPMiddleware 기반 기존 TimeoutMiddleware/RateLimitMiddleware 스택과
+main.py의 순수 ASGI 버전 스택을 같은 엔드포인트 앞에 두고 요청당 처리 시간을 비교한다.
+네트워크/서버 없이 ASGI 앱을 직접 호출하므로 미들웨어 자체 비용만 측정된다.
+
+사용법 (저장소 루트에서):
+    python benchmark/middleware_overhead.py [요청 수]
+"""
+import asyncio
+import os
+import sys
+import time
+from collections import deque
+from statistics import median
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from main import TimeoutMiddleware, RateLimitMiddleware, ALLOW_ORIGINS
+
+
+# 비교 기준: 기존 BaseHTTPMiddleware 구현 (main.py에서 교체되기 전 코드)
+class LegacyTimeoutMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, timeout: int = 10):
+        super().__init__(app)
+        self.timeout = timeout
+
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await asyncio.wait_for(call_next(request), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            return JSONResponse({"detail": "Request processing time exceeded limit"}, status_code=504)
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, requests_limit: int = 5, time_window: int = 10):
+        super().__init__(app)
+        self.requests_limit = requests_limit
+        self.time_window = time_window
+        self.data = {}
+
+    async def dispatch(self, request: Request, call_next):
+        client_ip = request.client.host if request.client else "unknown"
+        current_time = time.time()
+        timestamps = self.data.setdefault(client_ip, deque())
+        while timestamps and timestamps[0] < current_time - self.time_window:
+            timestamps.popleft()
+        if len(timestamps) >= self.requests_limit:
+            return JSONResponse({"detail": "Too Many Requests"}, status_code=429)
+        timestamps.append(current_time)
+        return await call_next(request)
+
+
+async def _endpoint(request):
+    return JSONResponse({"message": None, "data": {"post_id": 1}})
+
+
+def _build(timeout_cls, rate_limit_cls):
+    middleware = [
+        Middleware(SessionMiddleware, secret_key="bench"),
+        Middleware(CORSMiddleware, allow_origins=ALLOW_ORIGINS, allow_methods=["*"], allow_headers=["*"]),
+    ]
+    if rate_limit_cls is not None:
+        # 측정 중 429가 나지 않도록 한도를 충분히 크게 설정
+        middleware.append(Middleware(rate_limit_cls, requests_limit=10**9, time_window=10))
+    if timeout_cls is not None:
+        middleware.append(Middleware(timeout_cls, timeout=15))
+    # add_middleware와 같은 순서가 되도록 뒤집음 (마지막에 추가한 것이 가장 바깥)
+    return Starlette(routes=[Route("/posts/1", _endpoint)], middleware=list(reversed(middleware)))
+
+
+def _scope():
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/posts/1",
+        "raw_path": b"/posts/1",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost"), (b"origin", b"http://localhost:8080")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 8000),
+    }
+
+
+async def _run(app, count: int) -> list:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await app(_scope(), receive, send)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def main(count: int):
+    stacks = [
+        ("no custom middleware", _build(None, None)),
+        ("BaseHTTPMiddleware (before)", _build(LegacyTimeoutMiddleware, LegacyRateLimitMiddleware)),
+        ("pure ASGI (after)", _build(TimeoutMiddleware, RateLimitMiddleware)),
+    ]
+    # 워밍업
+    for _, app in stacks:
+        await _run(app, 200)
+
+    print(f"{'stack':<30}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'req/s':>12}")
+    for name, app in stacks:
+        timings = await _run(app, count)
+        timings.sort()
+        mean = sum(timings) / len(timings)
+        p99 = timings[int(len(timings) * 0.99) - 1]
+        print(f"{name:<30}{mean * 1e6:>10.1f}{median(timings) * 1e6:>10.1f}{p99 * 1e6:>10.1f}{1 / mean:>12.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,149 @@
+"""게시글 검색 지연 비교: LIKE '%검색어%' vs FULLTEXT ngram (MySQL 필요)
+
+별도 테이블(bench_post_search)에 게시글 제목/본문을 대량으로 넣고
+같은 검색어 집합으로 두 방식의 첫 페이지(11건) 조회 지연을 비교한다.
+- LIKE: post_title/post_content를 LIKE '%단어%'로 찾고 최신순 정렬 (테이블 전체를 훑음)
+- FULLTEXT: post_model.search_posts와 같은 검색식(BOOLEAN MODE 필수 구문)과 관련도 정렬
+검색어는 자주 나오는 단어/드문 단어/두 단어 조합을 섞어 쓴다.
+테이블은 측정이 끝나면 지운다 (--keep을 주면 남겨 두고 다음 실행에서 재사용).
+
+사용법 (저장소 루트에서, .env.dev의 DB 설정 사용):
+    python benchmark/post_search.py [게시글 수] [검색어당 반복 횟수] [--keep]
+"""
+import os
+import random
+import sys
+import time
+from statistics import median
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from database.index import get_connection, init_pool, close_pool
+from model.post_model import search_expression
+
+TABLE = "bench_post_search"
+BATCH = 2000
+_SYLLABLES = "가나다라마바사아자차카타파하개발서버배포질문답변성능캐시쿼리리뷰회고오늘정말그리고하지만프로젝트팀코드테스트"
+# 자주 나오는 단어 (코퍼스에 높은 빈도로 섞음)
+COMMON_WORDS = ("스타트업", "개발자", "회고", "질문", "배포")
+# 드물게 나오는 단어
+RARE_WORDS = ("쿠버네티스", "레디스클러스터", "샤딩")
+
+
+def _vocabulary(rng: random.Random) -> list:
+    words = ["FastAPI", "MySQL", "API", "DB"]
+    while len(words) < 3000:
+        words.append("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return words
+
+
+def _text(rng: random.Random, words: list, min_len: int, max_len: int) -> str:
+    target = rng.randint(min_len, max_len)
+    out = []
+    length = 0
+    while length < target:
+        roll = rng.random()
+        if roll < 0.03:
+            word = rng.choice(COMMON_WORDS)
+        elif roll < 0.0302:
+            word = rng.choice(RARE_WORDS)
+        else:
+            word = rng.choice(words)
+        out.append(word)
+        length += len(word) + 1
+    return " ".join(out)[:max_len]
+
+
+def _seed(cur, conn, count: int):
+    cur.execute(f"SELECT COUNT(*) AS n FROM {TABLE}")
+    existing = cur.fetchone()["n"]
+    if existing >= count:
+        return
+    rng = random.Random(existing)
+    words = _vocabulary(random.Random(0))
+    started = time.perf_counter()
+    for start in range(existing, count, BATCH):
+        rows = [
+            (_text(rng, words, 5, 26), _text(rng, words, 100, 1500))
+            for _ in range(min(BATCH, count - start))
+        ]
+        cur.executemany(f"INSERT INTO {TABLE} (post_title, post_content) VALUES (%s, %s)", rows)
+        conn.commit()
+    print(f"seeded {count - existing} posts in {time.perf_counter() - started:.1f}s")
+
+
+def _like(cur, query: str):
+    conditions = []
+    args = []
+    for word in query.split():
+        conditions.append("(post_title LIKE %s OR post_content LIKE %s)")
+        args.extend((f"%{word}%", f"%{word}%"))
+    cur.execute(
+        f"SELECT post_id FROM {TABLE} WHERE deleted_at IS NULL AND {' AND '.join(conditions)} "
+        "ORDER BY post_id DESC LIMIT 11",
+        args,
+    )
+    return cur.fetchall()
+
+
+def _fulltext(cur, query: str):
+    expression = search_expression(query)
+    cur.execute(
+        f"""
+        SELECT post_id, MATCH (post_title, post_content) AGAINST (%s IN BOOLEAN MODE) AS score
+        FROM {TABLE}
+        WHERE deleted_at IS NULL AND MATCH (post_title, post_content) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY score DESC, post_id DESC
+        LIMIT 11
+        """,
+        (expression, expression),
+    )
+    return cur.fetchall()
+
+
+def main(count: int, repeat: int, keep: bool):
+    init_pool()
+    queries = list(COMMON_WORDS[:3]) + list(RARE_WORDS[:2]) + [f"{COMMON_WORDS[0]} {COMMON_WORDS[2]}"]
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {TABLE} (
+                    post_id INT AUTO_INCREMENT PRIMARY KEY,
+                    post_title VARCHAR(100) NOT NULL,
+                    post_content TEXT NOT NULL,
+                    deleted_at DATETIME NULL,
+                    FULLTEXT INDEX ft_title_content (post_title, post_content) WITH PARSER ngram
+                )
+                """
+            )
+            _seed(cur, conn, count)
+
+            print(f"{count} posts, {repeat} runs per query")
+            print(f"{'query':<22}{'method':<10}{'rows':>6}{'p50 ms':>10}{'p95 ms':>10}")
+            for query in queries:
+                for name, func in (("LIKE", _like), ("FULLTEXT", _fulltext)):
+                    rows = func(cur, query)
+                    timings = []
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        func(cur, query)
+                        timings.append(time.perf_counter() - start)
+                    timings.sort()
+                    p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+                    print(f"{query:<22}{name:<10}{len(rows):>6}{median(timings) * 1000:>10.2f}{p95 * 1000:>10.2f}")
+            if not keep:
+                cur.execute(f"DROP TABLE {TABLE}")
+    finally:
+        close_pool()
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != "--keep"]
+    main(
+        int(args[0]) if len(args) > 0 else 200_000,
+        int(args[1]) if len(args) > 1 else 20,
+        "--keep" in sys.argv,
+    )
@@ -0,0 +1,136 @@
+"""게시글 목록 한 페이지의 이미지 요청 비교 (정적 파일 서빙)
+
+게시글 10개짜리 목록 화면이 불러오는 이미지(작성자 avatar 10개 + 첨부 썸네일 10개)를
+임시 디렉토리에 내용 해시 경로로 만들어 두고, 같은 페이지를 여러 번 여는 브라우저를 흉내 낸다.
+- before: StaticFiles 기본 설정 (캐시 헤더 없음 -> 다시 열 때마다 If-None-Match로 재검증, 304)
+- after: util.staticFiles.ImmutableStaticFiles (immutable 캐시 -> 다시 열 때는 요청 자체가 없음)
+처음 열 때(cold)의 초당 요청 수와 전송 바이트, 이후 여러 번 열 때(warm)의 요청 수/전송 바이트를 출력한다.
+ASGI 앱을 같은 프로세스에서 직접 호출하므로 네트워크 비용은 포함되지 않는다.
+
+사용법 (저장소 루트에서):
+    python benchmark/static_feed.py [cold 반복 횟수] [warm 페이지 열기 횟수]
+"""
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+
+from util.staticFiles import ImmutableStaticFiles
+from util.uploadUtil import blob_path
+
+POSTS_PER_PAGE = 10
+AVATAR_BYTES = 3 * 1024
+THUMB_BYTES = 25 * 1024
+
+
+def _make_page(directory: str) -> list:
+    urls = []
+    for i in range(POSTS_PER_PAGE):
+        for name, size in (("avatar", AVATAR_BYTES), ("thumb", THUMB_BYTES)):
+            data = os.urandom(size)
+            digest = hashlib.sha256(data).hexdigest()
+            relative = blob_path(digest, ".webp")
+            if name == "avatar":
+                relative = relative.replace(".webp", "-avatar.webp")
+            path = os.path.join(directory, relative)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+            urls.append("/public/" + relative)
+    return urls
+
+
+class _Browser:
+    """캐시 헤더를 따르는 단순한 브라우저 캐시"""
+
+    def __init__(self, app):
+        self.app = app
+        self.cache = {}
+        self.requests = 0
+        self.bytes = 0
+
+    async def get(self, url: str):
+        cached = self.cache.get(url)
+        if cached is not None and "immutable" in cached.get("cache-control", ""):
+            return
+        headers = [(b"host", b"localhost"), (b"accept-encoding", b"gzip, br")]
+        if cached is not None and "etag" in cached:
+            headers.append((b"if-none-match", cached["etag"].encode()))
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": url, "raw_path": url.encode(), "root_path": "",
+            "query_string": b"", "headers": headers, "client": ("127.0.0.1", 50000), "server": ("localhost", 8000),
+        }
+        response_headers = {}
+        body_size = 0
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            nonlocal body_size, response_headers
+            if message["type"] == "http.response.start":
+                response_headers = {k.decode(): v.decode() for k, v in message["headers"]}
+                response_headers["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                body_size += len(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        self.requests += 1
+        self.bytes += body_size
+        if response_headers.get("status") == 200:
+            self.cache[url] = response_headers
+
+
+async def _cold(app, urls, rounds: int):
+    browser = _Browser(app)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        browser.cache.clear()
+        for url in urls:
+            await browser.get(url)
+    elapsed = time.perf_counter() - start
+    return browser.requests / elapsed, browser.bytes / rounds
+
+
+async def _warm(app, urls, loads: int):
+    browser = _Browser(app)
+    for url in urls:
+        await browser.get(url)
+    browser.requests = browser.bytes = 0
+    for _ in range(loads):
+        for url in urls:
+            await browser.get(url)
+    return browser.requests, browser.bytes
+
+
+async def main(rounds: int, loads: int):
+    with tempfile.TemporaryDirectory() as directory:
+        urls = _make_page(directory)
+        apps = [
+            ("StaticFiles (before)", Starlette(routes=[Mount("/public", StaticFiles(directory=directory))])),
+            ("ImmutableStaticFiles (after)", Starlette(routes=[Mount("/public", ImmutableStaticFiles(directory=directory))])),
+        ]
+        print(f"page: {len(urls)} images, {POSTS_PER_PAGE * (AVATAR_BYTES + THUMB_BYTES) // 1024} KiB")
+        print(f"{'server':<30}{'cold req/s':>12}{'cold KiB/page':>15}{'warm requests':>15}{'warm KiB':>10}")
+        for name, app in apps:
+            rps, cold_bytes = await _cold(app, urls, rounds)
+            warm_requests, warm_bytes = await _warm(app, urls, loads)
+            print(f"{name:<30}{rps:>12.0f}{cold_bytes / 1024:>15.1f}{warm_requests:>15}{warm_bytes / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    ))
@@ -1,8 +1,15 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
+from util.jsonResponse import FastJSONResponse
+from util.etagUtil import make_etag, etag_matches, not_modified, with_etag
 from util.constant.httpStatusCode import STATUS_CODE, STATUS_MESSAGE
-from model import comment_model
+from model import comment_model, post_model
+from util.cursorUtil import encode_cursor, decode_cursor, InvalidCursorError
+
+# 댓글 한 페이지의 기본 크기와 최대 크기 (클라이언트가 더 큰 limit을 보내도 잘라냄)
+DEFAULT_COMMENT_PAGE_SIZE = 20
+MAX_COMMENT_PAGE_SIZE = 100
 
 class CommentsController:
     # 새로운 댓글 작성
@@ -22,20 +29,54 @@ class CommentsController:
         except Exception:
             raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], STATUS_MESSAGE["WRITE_COMMENT_FAILED"])
 
-    # 댓글 조회
-    async def get_comments(self, post_id: int):
+    # 댓글 조회 (커서 방식)
+    # 응답의 nextCursor를 다음 요청의 cursor로 넘기면 다음 페이지, nextCursor가 None이면 마지막 페이지
+    # if_none_match가 게시글 댓글 버전의 ETag와 같으면 댓글을 조회하지 않고 304 응답
+    async def get_comments(
+        self,
+        post_id: int,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_COMMENT_PAGE_SIZE,
+        if_none_match: Optional[str] = None,
+    ):
         try:
             if not post_id:
                 raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_POST_ID"])
+            if limit <= 0:
+                raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_OFFSET_OR_LIMIT"])
+            limit = min(limit, MAX_COMMENT_PAGE_SIZE)
+            try:
+                after = decode_cursor(cursor, 1)[0] if cursor else None
+            except InvalidCursorError:
+                raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_CURSOR"])
+            if after is not None and not isinstance(after, int):
+                raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_CURSOR"])
+
+            # 댓글보다 먼저 버전을 읽어서, 조회하는 사이 바뀌어도 오래된 본문에 새 버전이 붙지 않게 함
+            version = await post_model.get_comment_version(post_id)
+            etag = make_etag("comments", post_id, version) if version is not None else None
+            if etag is not None and etag_matches(if_none_match, etag):
+                return not_modified(etag)
 
-            data = await comment_model.get_comments(post_id)
+            # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+            data = await comment_model.get_comments(post_id, after=after, limit=limit + 1)
             if not data:
-                return {
+                response = FastJSONResponse({
                     "status_code": STATUS_CODE["OK"],
                     "status_message": STATUS_MESSAGE["GET_COMMENTS_SUCCESS"],
                     "data": [],
-                }
-            return {"message": None, "data": data}
+                    "nextCursor": None,
+                })
+                return with_etag(response, etag) if etag is not None else response
+
+            next_cursor = None
+            if len(data) > limit:
+                data = data[:limit]
+                next_cursor = encode_cursor(data[-1]["comment_id"])
+            response = FastJSONResponse({"message": None, "data": data, "nextCursor": next_cursor})
+            return with_etag(response, etag) if etag is not None else response
+        except HTTPException:
+            raise
         except Exception:
             raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], STATUS_MESSAGE["GET_COMMENTS_FAILED"])
 
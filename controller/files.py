@@ -1,38 +1,39 @@
-import shutil
 from pathlib import Path as FSPath
 from fastapi import HTTPException, UploadFile
 from fastapi.responses import JSONResponse
 from util.constant.httpStatusCode import STATUS_CODE, STATUS_MESSAGE
+from util.uploadUtil import save_upload
+from util.imageVariants import image_pipeline, existing_variants
 
 class FilesController:
     # 파일 저장 메서드
     # base_dir: 파일이 저장될 기본 디렉토리
     # upfile: 업로드된 파일 객체
-    def _save_file(self, base_dir: str, upfile: UploadFile) -> str:
-        if not upfile:
+    # 파일은 내용 해시 경로(ab/cd/<sha256>.<확장자>)에 저장되고 base_dir 기준 경로를 반환
+    # 같은 내용은 한 번만 저장, 복사는 스레드풀에서 청크 단위로 하고 UPLOAD_MAX_BYTES를 넘으면 413
+    async def _save_file(self, base_dir: str, upfile: UploadFile) -> str:
+        if not upfile or not upfile.filename:
             raise HTTPException(status_code=STATUS_CODE["BAD_REQUEST"], detail=STATUS_MESSAGE["INVALID_FILE"])
 
-        save_dir = FSPath(base_dir)
-        save_dir.mkdir(parents=True, exist_ok=True)
-
-        file_path = save_dir / upfile.filename
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(upfile.file, buffer)
-
-        return str(file_path)
+        saved = await save_upload(upfile, base_dir)
+        # 크기별 변형 이미지는 프로세스 풀에서 따로 생성 (응답은 기다리지 않음)
+        public_path = "/" + FSPath(base_dir, saved.relative_path).as_posix().lstrip("./")
+        if not saved.deduplicated or not existing_variants(public_path):
+            image_pipeline.schedule(saved.path, public_path)
+        return saved.relative_path
 
     # 게시물 파일 업로드
     async def upload_post_file(self, post_file: UploadFile):
-        self._save_file("./public/image/post", post_file)
+        file_name = await self._save_file("./public/image/post", post_file)
         return {
             "status_code": STATUS_CODE["CREATED"],
             "status_message": STATUS_MESSAGE["FILE_UPLOAD_SUCCESS"],
-            "data": {"filePath": f"/public/image/post/{post_file.filename}"},
+            "data": {"filePath": f"/public/image/post/{file_name}"},
         }
 
     # 프로필 이미지 업로드
     async def upload_profile_image(self, profile_image: UploadFile):
-        self._save_file("./public/image/profile", profile_image)
+        file_name = await self._save_file("./public/image/profile", profile_image)
         return JSONResponse(
-            content={"data": {"filePath": f"/public/image/profile/{profile_image.filename}"}}
-        )
\ No newline at end of file
+            content={"data": {"filePath": f"/public/image/profile/{file_name}"}}
+        )
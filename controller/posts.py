@@ -1,15 +1,19 @@
 from typing import Optional
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
+from util.jsonResponse import FastJSONResponse
+from util.etagUtil import make_etag, etag_matches, not_modified, with_etag
 from util.constant.httpStatusCode import STATUS_CODE, STATUS_MESSAGE
-from model import post_model
+from model import post_model, like_model
+from util.cursorUtil import encode_cursor, decode_cursor, InvalidCursorError
+from util.formatUtil import compact_count
 
-# 입력으로 들어오는 값을 ISO 8601 형식의 문자열로 변환하는 헬퍼 함수
-def _iso(v):
-    if v is None: return None
-    if isinstance(v, datetime): return v.isoformat(timespec="seconds")
-    return str(v)
+# 게시물 목록 한 페이지의 최대 크기 (클라이언트가 더 큰 limit을 보내도 잘라냄)
+MAX_POST_PAGE_SIZE = 50
+# 검색어 최대 길이
+MAX_SEARCH_QUERY_LENGTH = 100
 
 # 여러 키 중에서 첫 번째로 존재하는 값을 반환하는 헬퍼 함수
 def _pick(row: dict, *keys, default=None):
@@ -28,13 +32,17 @@ def _augment_row(row: dict) -> dict:
     user_id = _pick(row, "user_id", "userId")
     nickname = _pick(row, "nickname")
     file_id = _pick(row, "file_id", "fileId")
-    created_at = _iso(_pick(row, "created_at", "createdAt"))
-    updated_at = _iso(_pick(row, "updated_at", "updatedAt"))
-    deleted_at = _iso(_pick(row, "deleted_at", "deletedAt"))
+    # datetime은 응답 직렬화(FastJSONResponse) 단계에서 ISO 8601 문자열로 변환
+    created_at = _pick(row, "created_at", "createdAt")
+    updated_at = _pick(row, "updated_at", "updatedAt")
+    deleted_at = _pick(row, "deleted_at", "deletedAt")
     like_val = _pick(row, "like", "likeCount")
     comment_cnt = _pick(row, "comment_count", "commentCount")
     hits = _pick(row, "hits", "viewCount")
     profile_img = _pick(row, "profile_image_path", "profileImagePath")
+    # 목록에서는 작은 프로필 이미지(avatar 변형)를 쓰고, 아직 없으면 원본
+    profile_variants = _pick(row, "profileImageVariants", default={})
+    profile_thumb = profile_variants.get("avatar") or profile_img
 
     return {
         "post_id": post_id,
@@ -50,8 +58,38 @@ def _augment_row(row: dict) -> dict:
         "comment_count": comment_cnt,
         "hits": hits,
         "profileImagePath": profile_img,
+        "profileImageThumbnailPath": profile_thumb,
     }
 
+# 화면 표시용으로 축약하는 카운트 필드
+_COUNT_FIELDS = ("like", "comment_count", "hits")
+
+# 게시글 카운트(좋아요/댓글/조회수)를 한 번에 축약 문자열로 변환하는 포맷 단계
+# raw=True면 DB의 정수 값을 그대로 둠 (rawCounts=true로 요청한 클라이언트용)
+def _format_counts(rows: list, raw: bool = False) -> list:
+    if raw:
+        return rows
+    for row in rows:
+        for key in _COUNT_FIELDS:
+            if key in row:
+                row[key] = compact_count(row[key])
+    return rows
+
+# 검색 커서 값 (점수 문자열, post_id)을 (Decimal, int)로 변환, 형식이 맞지 않으면 None
+def _search_cursor(after: tuple) -> Optional[tuple]:
+    score, post_id = after
+    if not isinstance(score, str) or not isinstance(post_id, int) or isinstance(post_id, bool):
+        return None
+    try:
+        score = Decimal(score)
+    except InvalidOperation:
+        return None
+    return (score, post_id) if score.is_finite() else None
+
+# ETag가 있으면 응답에 붙임
+def _with_etag(response, etag: Optional[str]):
+    return with_etag(response, etag) if etag is not None else response
+
 class PostsController:
     # 새로운 게시물 작성
     async def write_post(
@@ -88,7 +126,19 @@ class PostsController:
         )
 
     # 게시물 목록 조회
-    async def get_post_list(self, offset: str, limit: str):
+    # cursor가 주어지면 커서 방식(빈 문자열은 첫 페이지), 아니면 기존 offset 방식으로 조회
+    # if_none_match: 이전 응답의 ETag, 그 뒤로 목록이 바뀌지 않았으면 목록을 조회하지 않고 304 응답
+    async def get_post_list(
+        self,
+        offset: Optional[str],
+        limit: str,
+        cursor: Optional[str] = None,
+        raw_counts: bool = False,
+        if_none_match: Optional[str] = None,
+    ):
+        if cursor is not None:
+            return await self._get_post_list_by_cursor(cursor, limit, raw_counts, if_none_match)
+
         if not offset or not limit:
             raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_OFFSET_OR_LIMIT"])
         try:
@@ -96,6 +146,13 @@ class PostsController:
             limit_int = int(limit, 10)
         except ValueError:
             raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_OFFSET_OR_LIMIT"])
+        if offset_int < 0 or limit_int <= 0:
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_OFFSET_OR_LIMIT"])
+        limit_int = min(limit_int, MAX_POST_PAGE_SIZE)
+
+        etag = await self._feed_etag()
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
 
         try:
             rows = await post_model.get_post_list(offset=offset_int, limit=limit_int)
@@ -111,20 +168,179 @@ class PostsController:
                 raise HTTPException(STATUS_CODE["NOT_FOUND"], STATUS_MESSAGE["NOT_A_SINGLE_POST"])
             # 데이터 변환 rows에 있는 각 행을 _augment_row 함수를 사용하여 변환
             data_out = [_augment_row(r) for r in (rows if isinstance(rows, list) else [rows])]
-            return {
+            _format_counts(data_out, raw_counts)
+            return _with_etag(FastJSONResponse({
                 "status_code": STATUS_CODE["OK"],
                 "status_message": STATUS_MESSAGE["GET_POST_LIST_SUCCESS"],
                 "data": data_out,
-            }
+            }), etag)
         except HTTPException:
             raise
         except Exception:
             raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"],
                                 STATUS_MESSAGE.get("GET_POST_LIST_FAILED", "get_post_list_failed"))
 
+    # 게시물 목록 조회 (커서 방식)
+    # 응답의 nextCursor를 다음 요청의 cursor로 넘기면 다음 페이지, nextCursor가 None이면 마지막 페이지
+    async def _get_post_list_by_cursor(
+        self, cursor: str, limit: str, raw_counts: bool = False, if_none_match: Optional[str] = None
+    ):
+        try:
+            limit_int = int(limit, 10) if isinstance(limit, str) else int(limit)
+        except ValueError:
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_OFFSET_OR_LIMIT"])
+        if limit_int <= 0:
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_OFFSET_OR_LIMIT"])
+        limit_int = min(limit_int, MAX_POST_PAGE_SIZE)
+
+        try:
+            after = decode_cursor(cursor, 2) if cursor else None
+        except InvalidCursorError:
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_CURSOR"])
+        # (created_at, post_id) 형태가 아니면 SQL까지 가지 않고 400
+        if after is not None and not (
+            isinstance(after[0], datetime) and isinstance(after[1], int) and not isinstance(after[1], bool)
+        ):
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_CURSOR"])
+
+        etag = await self._feed_etag()
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        try:
+            # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+            rows = await post_model.get_post_list_by_cursor(cursor=after, limit=limit_int + 1)
+            if rows is None:
+                raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], STATUS_MESSAGE["GET_POST_LIST_FAILED"])
+            if not rows:
+                raise HTTPException(STATUS_CODE["NOT_FOUND"], STATUS_MESSAGE["NOT_A_SINGLE_POST"])
+
+            next_cursor = None
+            if len(rows) > limit_int:
+                rows = rows[:limit_int]
+                last = rows[-1]
+                next_cursor = encode_cursor(last["created_at"], last["post_id"])
+
+            return _with_etag(FastJSONResponse({
+                "status_code": STATUS_CODE["OK"],
+                "status_message": STATUS_MESSAGE["GET_POST_LIST_SUCCESS"],
+                "data": _format_counts([_augment_row(r) for r in rows], raw_counts),
+                "nextCursor": next_cursor,
+            }), etag)
+        except HTTPException:
+            raise
+        except Exception:
+            raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], STATUS_MESSAGE["GET_POST_LIST_FAILED"])
+
+    # 게시물 좋아요 / 좋아요 취소
+    # 사용자당 한 번만 반영되며 같은 요청을 반복해도 결과가 같음, 응답에 현재 좋아요 수를 포함
+    async def like_post(self, post_id: int, user_id: int):
+        return await self._change_like(post_id, user_id, liked=True)
+
+    async def unlike_post(self, post_id: int, user_id: int):
+        return await self._change_like(post_id, user_id, liked=False)
+
+    async def _change_like(self, post_id: int, user_id: int, liked: bool):
+        if not user_id:
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_USER_ID"])
+        failed = STATUS_MESSAGE["LIKE_POST_FAILED" if liked else "UNLIKE_POST_FAILED"]
+        try:
+            if liked:
+                result = await like_model.like_post(post_id, user_id)
+            else:
+                result = await like_model.unlike_post(post_id, user_id)
+            if result == STATUS_MESSAGE["NOT_FOUND_POST"]:
+                raise HTTPException(STATUS_CODE["NOT_FOUND"], STATUS_MESSAGE["NOT_FOUND_POST"])
+            if not isinstance(result, dict):
+                raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], failed)
+        except HTTPException:
+            raise
+        except Exception:
+            raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], failed)
+        return {
+            "message": STATUS_MESSAGE["LIKE_POST_SUCCESS" if liked else "UNLIKE_POST_SUCCESS"],
+            "data": {"postId": post_id, **result},
+        }
+
+    # 게시물 검색 (관련도 순, 커서 방식)
+    # 결과가 없으면 404가 아니라 빈 목록 반환
+    # 검색 결과도 게시글 목록과 같은 변경에만 바뀌므로 목록 버전으로 ETag를 만듦
+    async def search_posts(
+        self,
+        q: Optional[str],
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        raw_counts: bool = False,
+        if_none_match: Optional[str] = None,
+    ):
+        query = (q or "").strip()
+        if not query or len(query) > MAX_SEARCH_QUERY_LENGTH or not post_model.search_expression(query):
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_SEARCH_QUERY"])
+        if limit <= 0:
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_OFFSET_OR_LIMIT"])
+        limit = min(limit, MAX_POST_PAGE_SIZE)
+        try:
+            after = decode_cursor(cursor, 2) if cursor else None
+        except InvalidCursorError:
+            raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_CURSOR"])
+        if after is not None:
+            after = _search_cursor(after)
+            if after is None:
+                raise HTTPException(STATUS_CODE["BAD_REQUEST"], STATUS_MESSAGE["INVALID_CURSOR"])
+
+        etag = await self._feed_etag()
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        try:
+            # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+            rows = await post_model.search_posts(query, cursor=after, limit=limit + 1)
+            if rows is None:
+                raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], STATUS_MESSAGE["SEARCH_POSTS_FAILED"])
+
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1]
+                # 점수(Decimal)는 JSON 숫자로 바꾸면 값이 달라질 수 있으므로 문자열로 담음
+                next_cursor = encode_cursor(str(last["score"]), last["post_id"])
+
+            return _with_etag(FastJSONResponse({
+                "status_code": STATUS_CODE["OK"],
+                "status_message": STATUS_MESSAGE["SEARCH_POSTS_SUCCESS"],
+                "data": _format_counts([_augment_row(r) for r in rows], raw_counts),
+                "nextCursor": next_cursor,
+            }), etag)
+        except HTTPException:
+            raise
+        except Exception:
+            raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], STATUS_MESSAGE["SEARCH_POSTS_FAILED"])
+
+    # 게시글 목록 ETag (목록 버전을 읽지 못하면 None, 이때는 ETag 없이 응답)
+    # 목록보다 먼저 읽어서, 조회하는 사이 목록이 바뀌어도 오래된 본문에 새 버전이 붙지 않게 함
+    @staticmethod
+    async def _feed_etag() -> Optional[str]:
+        version = await post_model.get_feed_version()
+        return make_etag("posts", version) if version is not None else None
+
+    # 게시글 상세 ETag (버전 + 좋아요 수 + 조회수 구간)
+    # 조회수는 HITS_ETAG_STEP 단위로만 바뀌므로 304 응답의 조회수는 그 안에서 늦게 보일 수 있음
+    @staticmethod
+    def _post_etag(post_id: int, state: dict) -> str:
+        return make_etag("post", post_id, state["version"], state["like"], state["hits"] // post_model.HITS_ETAG_STEP)
+
     # 단일 게시물 조회
-    async def get_post(self, post_id: int):
+    # if_none_match가 현재 ETag와 같으면 상세 조회/직렬화 없이 304 응답 (조회수는 그대로 증가)
+    async def get_post(self, post_id: int, raw_counts: bool = False, if_none_match: Optional[str] = None):
         try:
+            if if_none_match:
+                state = await post_model.get_post_etag_state(post_id)
+                if state is not None:
+                    etag = self._post_etag(post_id, state)
+                    if etag_matches(if_none_match, etag):
+                        post_model.record_hit(post_id)
+                        return not_modified(etag)
+
             response_data = await post_model.get_post(post_id=post_id)
             if not response_data:
                 raise HTTPException(STATUS_CODE["NOT_FOUND"], STATUS_MESSAGE["NOT_FOUND_POST"])
@@ -132,7 +348,11 @@ class PostsController:
             raise
         except Exception:
             raise HTTPException(STATUS_CODE["INTERNAL_SERVER_ERROR"], STATUS_MESSAGE["GET_POST_FAILED"])
-        return {"message": None, "data": response_data}
+        etag = self._post_etag(post_id, response_data) if response_data.get("version") is not None else None
+        response_data.pop("version", None)
+        _format_counts([response_data], raw_counts)
+        response = FastJSONResponse({"message": None, "data": response_data})
+        return _with_etag(response, etag)
 
     # 게시물 수정
     async def update_post(
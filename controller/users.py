@@ -4,12 +4,19 @@ from uuid import uuid4
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 from starlette.responses import Response
-from fastapi.encoders import jsonable_encoder
+from util.jsonResponse import FastJSONResponse
 
 from model import user_model
 from util.constant.httpStatusCode import STATUS_MESSAGE, STATUS_CODE
+from util.passwordHasher import PasswordHasherBusyError
 from util.validUtil import valid_email, valid_password, valid_nickname
 
+# 비밀번호 해싱 대기열이 가득 찼을 때 응답 (잠시 후 재시도 안내)
+def _server_busy_response() -> JSONResponse:
+    return JSONResponse(status_code=STATUS_CODE["SERVICE_UNAVAILABLE"],
+                        content={"error": {"message": STATUS_MESSAGE["SERVER_BUSY"], "data": None}},
+                        headers={"Retry-After": "1"})
+
 class UsersController:
     # 로그인 메서드
     async def login(self, email: str, password: str, session_id: Optional[str]):
@@ -17,7 +24,10 @@ class UsersController:
             return JSONResponse(status_code=STATUS_CODE["BAD_REQUEST"],
                                 content={"error": {"message": STATUS_MESSAGE["INVALID_EMAIL_FORMAT"], "data": None}})
         session_id = session_id or uuid4().hex
-        user_row = await user_model.login_user(email, password, session_id)
+        try:
+            user_row = await user_model.login_user(email, password, session_id)
+        except PasswordHasherBusyError:
+            return _server_busy_response()
         if not user_row:
             return JSONResponse(status_code=STATUS_CODE["BAD_REQUEST"],
                                 content={"error": {"message": STATUS_MESSAGE["INVALID_CREDENTIALS"], "data": None}})
@@ -54,9 +64,12 @@ class UsersController:
             return JSONResponse(status_code=STATUS_CODE["BAD_REQUEST"],
                                 content={"error": {"message": STATUS_MESSAGE["INVALID_NICKNAME_FORMAT"], "data": None}})
 
-        user = await user_model.signup_user(
-            email=email, password=password, nickname=nickname, profile_image_path=profile_image_path
-        )
+        try:
+            user = await user_model.signup_user(
+                email=email, password=password, nickname=nickname, profile_image_path=profile_image_path
+            )
+        except PasswordHasherBusyError:
+            return _server_busy_response()
         if user == "already_exist_email":
             return JSONResponse(status_code=STATUS_CODE["BAD_REQUEST"],
                                 content={"error": {"message": STATUS_MESSAGE["ALREADY_EXIST_EMAIL"], "data": None}})
@@ -91,8 +104,8 @@ class UsersController:
             raise HTTPException(status_code=STATUS_CODE["INTERNAL_SERVER_ERROR"],
                                 detail=STATUS_MESSAGE["INTERNAL_SERVER_ERROR"])
 
-        return JSONResponse(status_code=STATUS_CODE["OK"],
-                            content={"message": None, "data": jsonable_encoder(response_data)})
+        return FastJSONResponse(status_code=STATUS_CODE["OK"],
+                                content={"message": None, "data": response_data})
 
     # 사용자 정보 수정 메서드
     async def update_user(self, user_id: int, nickname: str, profile_image_path: Optional[str]):
@@ -135,7 +148,10 @@ class UsersController:
     async def change_password(self, user_id: int, password: str):
         if not password:
             raise HTTPException(status_code=STATUS_CODE["BAD_REQUEST"], detail=STATUS_MESSAGE["INVALID_PASSWORD"])
-        ok = await user_model.change_password({"userId": user_id, "password": password})
+        try:
+            ok = await user_model.change_password({"userId": user_id, "password": password})
+        except PasswordHasherBusyError:
+            return _server_busy_response()
         if not ok:
             raise HTTPException(status_code=STATUS_CODE["NOT_FOUND"], detail=STATUS_MESSAGE["NOT_FOUND_USER"])
         return JSONResponse(status_code=STATUS_CODE["CREATED"],
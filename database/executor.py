@@ -0,0 +1,65 @@
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from database.index import DB_POOL_CONFIG
+
+T = TypeVar("T")
+
+# DB 작업 전용 스레드 수
+# Starlette 기본 스레드풀과 분리해서 관리하며, 기본값은 커넥션 풀 최대 크기와 같게 맞춤
+# (스레드가 커넥션보다 많으면 남는 스레드는 풀 대기만 하게 됨)
+DB_EXECUTOR_WORKERS = int(os.getenv("DB_EXECUTOR_WORKERS", str(DB_POOL_CONFIG["max_size"])))
+
+_executor: Optional[ThreadPoolExecutor] = None
+# 실행 중이거나 스레드를 기다리는 DB 작업 수 (이벤트 루프 스레드에서만 갱신)
+_pending = 0
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="db")
+    return _executor
+
+
+# 동기 DB 함수를 전용 스레드풀에서 실행하고 결과를 기다림
+# contextvars를 복사해서 넘기므로 요청 단위 컨텍스트가 DB 스레드에서도 보임
+async def run_db(func: Callable[..., T], *args, **kwargs) -> T:
+    global _pending
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    _pending += 1
+    try:
+        return await loop.run_in_executor(_get_executor(), call)
+    finally:
+        _pending -= 1
+
+
+# 동기 함수를 DB 스레드풀에서 실행되는 코루틴 함수로 바꾸는 데코레이터
+# 모델 함수는 동기 코드로 작성하고, 호출하는 쪽은 기존처럼 await 하면 됨
+def db_task(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> Any:
+        return await run_db(func, *args, **kwargs)
+    return wrapper
+
+
+# 애플리케이션 종료 시 스레드풀 정리
+def shutdown_db_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+# 런타임 DB 스레드풀 상태
+def get_db_executor_stats() -> dict:
+    return {
+        "workers": DB_EXECUTOR_WORKERS,
+        "pending": _pending,
+    }
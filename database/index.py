@@ -1,4 +1,4 @@
-import logging
+from random import random
 from time import perf_counter
 
 import pymysql
@@ -7,6 +7,9 @@ import os
 
 from pymysql.cursors import DictCursor
 
+from database.pool import ConnectionPool, PooledConnection
+from database.instrumentation import LazySQL, query_stats, record_query, setup_sql_logger
+
 load_dotenv(dotenv_path=".env.dev")
 
 # MySQL 연결 설정
@@ -19,33 +22,70 @@ MYSQL_DB_CONFIG = {
 }
 
 # SQL 로깅 설정
-logger = logging.getLogger("sql")
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter(
-        "[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    ))
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+# SQL_LOG_SLOW_MS 이상 걸린 쿼리는 항상 로깅, 나머지는 SQL_LOG_SAMPLE_RATE 비율(0~1)만큼만 샘플링
+# (개발 중 모든 쿼리를 보려면 SQL_LOG_SAMPLE_RATE=1)
+SQL_LOG_SLOW_MS = float(os.getenv("SQL_LOG_SLOW_MS", "200"))
+SQL_LOG_SAMPLE_RATE = float(os.getenv("SQL_LOG_SAMPLE_RATE", "0"))
+
+logger = setup_sql_logger("sql")
 
 class LoggingCursor(DictCursor):
-    # SQL 실행 시각과 쿼리 로깅
+    # SQL 실행 시간 기록 및 느린 쿼리/샘플 쿼리 로깅
+    # SQL 문자열은 로그가 실제로 출력될 때만 한 번 렌더링
     def execute(self, query, args=None):
         start = perf_counter()
         try:
             return super().execute(query, args)
         finally:
             elapsed_ms = (perf_counter() - start) * 1000
-            logger.info("SQL %0.2f ms | %s",
-                        elapsed_ms, self.mogrify(query, args).decode() if isinstance(self.mogrify(query, args), bytes) else self.mogrify(query, args))
+            record_query(query, elapsed_ms)
+            if elapsed_ms >= SQL_LOG_SLOW_MS or (SQL_LOG_SAMPLE_RATE > 0 and random() < SQL_LOG_SAMPLE_RATE):
+                logger.info("SQL %0.2f ms | %s", elapsed_ms, LazySQL(self, query, args))
 
-# MySQL 연결 함수
-def get_connection():
-    """MySQL 연결을 반환 (동기, 실행 시각+SQL 로깅)."""
+# 커넥션 풀 설정
+DB_POOL_CONFIG = {
+    "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+    "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+    # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간(초)
+    "timeout": float(os.getenv("DB_POOL_TIMEOUT", "5")),
+    # 여분 커넥션을 닫기까지의 유휴 시간(초)
+    "idle_timeout": float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+    # 이 시간(초) 이상 쉰 커넥션은 대여 전에 ping으로 확인
+    "ping_interval": float(os.getenv("DB_POOL_PING_INTERVAL", "30")),
+}
+
+# 실제 MySQL 연결 생성 (풀 내부에서만 사용)
+def _connect():
     return pymysql.connect(
         # **는 파이썬의 딕셔너리 언패킹 문법
         # MYSQL_DB_CONFIG가 딕셔너리일때 그 안의 키-값 쌍을 인자로 풀어서 전달
         **MYSQL_DB_CONFIG,
         cursorclass=LoggingCursor,
         autocommit=False,
-    )
\ No newline at end of file
+    )
+
+pool = ConnectionPool(_connect, **DB_POOL_CONFIG)
+
+# MySQL 연결 함수
+def get_connection() -> PooledConnection:
+    """풀에서 MySQL 연결을 빌려 반환 (동기, 실행 시각+SQL 로깅).
+
+    with 문을 빠져나가거나 close()를 호출하면 연결을 닫지 않고 풀에 반납한다.
+    """
+    return pool.acquire()
+
+# 애플리케이션 시작 시 최소 커넥션 미리 연결
+def init_pool():
+    pool.prefill()
+
+# 애플리케이션 종료 시 풀 정리
+def close_pool():
+    pool.close()
+
+# 런타임 풀 상태 (사용 중/유휴 커넥션 수, 대기 시간 등)
+def get_pool_stats() -> dict:
+    return pool.stats()
+
+# 쿼리 형태별 실행 시간 히스토그램
+def get_sql_stats() -> dict:
+    return query_stats.snapshot()
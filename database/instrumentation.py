@@ -0,0 +1,168 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# SQL 실행 시간 히스토그램 구간 (ms)
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# 기록할 최대 쿼리 형태 수 (넘치면 "<other>"로 합산)
+MAX_SHAPES = 500
+
+_WS_RE = re.compile(r"\s+")
+# IN (%s, %s, ...) / VALUES 목록처럼 개수만 다른 플레이스홀더 나열을 하나로 합침
+_PLACEHOLDER_LIST_RE = re.compile(r"%s(?:\s*,\s*%s)+")
+# CASE ... WHEN %s THEN %s WHEN %s THEN %s ... 반복도 하나로 합침
+_WHEN_LIST_RE = re.compile(r"(?:WHEN %s THEN %s\s*)+")
+
+
+# 쿼리 문자열을 형태(shape)로 정규화 - 인자가 달라도 같은 쿼리면 같은 키
+# 쿼리 템플릿 문자열은 대부분 상수라 캐시가 잘 맞음
+@lru_cache(maxsize=2048)
+def shape_of(query: str) -> str:
+    shape = _WS_RE.sub(" ", query).strip().rstrip(";").strip()
+    shape = _WHEN_LIST_RE.sub("WHEN %s THEN %s ... ", shape)
+    return _PLACEHOLDER_LIST_RE.sub("%s, ...", shape)
+
+
+# 로그 레코드가 실제로 출력될 때만 SQL을 렌더링하는 지연 문자열
+class LazySQL:
+    __slots__ = ("cursor", "query", "args")
+
+    def __init__(self, cursor, query, args):
+        self.cursor = cursor
+        self.query = query
+        self.args = args
+
+    def __str__(self) -> str:
+        try:
+            rendered = self.cursor.mogrify(self.query, self.args)
+        except Exception:
+            return shape_of(self.query)
+        return rendered.decode() if isinstance(rendered, bytes) else rendered
+
+
+# 쿼리 형태별 실행 시간 히스토그램
+class _ShapeHistogram:
+    __slots__ = ("count", "sum_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        # 마지막 칸은 +Inf
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+
+class QueryStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._shapes: Dict[str, _ShapeHistogram] = {}
+
+    def record(self, shape: str, elapsed_ms: float):
+        index = bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)
+        with self._lock:
+            hist = self._shapes.get(shape)
+            if hist is None:
+                if len(self._shapes) >= MAX_SHAPES:
+                    shape = "<other>"
+                    hist = self._shapes.get(shape)
+                if hist is None:
+                    hist = self._shapes[shape] = _ShapeHistogram()
+            hist.count += 1
+            hist.sum_ms += elapsed_ms
+            if elapsed_ms > hist.max_ms:
+                hist.max_ms = elapsed_ms
+            hist.buckets[index] += 1
+
+    # 쿼리 형태별 통계 (buckets는 le(ms) -> 누적 건수)
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            items = [(shape, h.count, h.sum_ms, h.max_ms, list(h.buckets)) for shape, h in self._shapes.items()]
+        result = {}
+        for shape, count, sum_ms, max_ms, buckets in items:
+            cumulative = 0
+            le = {}
+            for bound, n in zip(LATENCY_BUCKETS_MS + ("+Inf",), buckets):
+                cumulative += n
+                le[str(bound)] = cumulative
+            result[shape] = {
+                "count": count,
+                "sum_ms": round(sum_ms, 3),
+                "avg_ms": round(sum_ms / count, 3) if count else 0.0,
+                "max_ms": round(max_ms, 3),
+                "buckets": le,
+            }
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._shapes.clear()
+
+
+query_stats = QueryStats()
+
+
+# 요청 하나가 실행한 쿼리 통계 (쿼리 수, DB 시간, 쿼리 형태별 횟수)
+class RequestQueryStats:
+    __slots__ = ("count", "db_ms", "shapes", "_lock")
+
+    def __init__(self):
+        self.count = 0
+        self.db_ms = 0.0
+        self.shapes: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, shape: str, elapsed_ms: float):
+        with self._lock:
+            self.count += 1
+            self.db_ms += elapsed_ms
+            self.shapes[shape] += 1
+
+    # 같은 형태의 쿼리가 threshold번 이상 반복된 목록 (N+1 의심)
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        with self._lock:
+            return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+# 현재 요청의 쿼리 통계 (미들웨어가 요청마다 설정)
+# DB 스레드풀은 컨텍스트를 복사해서 실행하므로 같은 객체에 기록됨
+current_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("current_request_stats", default=None)
+
+
+# 쿼리 한 건 실행 기록 - 전역 히스토그램과 현재 요청 통계에 함께 반영
+def record_query(query: str, elapsed_ms: float):
+    shape = shape_of(query)
+    query_stats.record(shape, elapsed_ms)
+    request_stats = current_request_stats.get()
+    if request_stats is not None:
+        request_stats.add(shape, elapsed_ms)
+
+
+# SQL 로거 설정
+# 핸들러 출력(I/O)은 별도 스레드의 QueueListener가 처리하므로
+# 이벤트 루프나 DB 스레드는 큐에 넣기만 하고 바로 돌아감
+def setup_sql_logger(name: str = "sql") -> logging.Logger:
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        "[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    ))
+    log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    # 루트 로거의 동기 핸들러로 다시 출력되지 않게 함
+    logger.propagate = False
+    return logger
@@ -0,0 +1,4 @@
+-- GET /posts 커서 페이지네이션용 인덱스
+-- WHERE deleted_at IS NULL ORDER BY created_at DESC, post_id DESC 를 인덱스 순서대로 읽음
+ALTER TABLE post_table
+    ADD INDEX idx_post_table_deleted_created_id (deleted_at, created_at, post_id);
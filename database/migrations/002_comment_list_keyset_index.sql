@@ -0,0 +1,4 @@
+-- GET /posts/{post_id}/comments 커서 페이지네이션용 인덱스
+-- WHERE post_id = ? AND deleted_at IS NULL AND comment_id > ? ORDER BY comment_id 를 인덱스 순서대로 읽음
+ALTER TABLE comment_table
+    ADD INDEX idx_comment_table_post_deleted_id (post_id, deleted_at, comment_id);
@@ -0,0 +1,4 @@
+-- 업로드 이미지의 크기별 변형 경로 (예: {"avatar": "...-avatar.webp", "thumb": "...", "detail": "..."})
+-- 변형 생성 전이거나 이미지가 아니면 NULL
+ALTER TABLE file_table
+    ADD COLUMN variants JSON NULL AFTER file_path;
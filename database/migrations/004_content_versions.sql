@@ -0,0 +1,15 @@
+-- 조건부 GET(ETag/If-None-Match)용 변경 카운터
+-- version: 게시글 상세 응답에 보이는 값(본문, 첨부파일, 댓글 수, 작성자 프로필)이 바뀔 때마다 증가
+--          (조회수/좋아요 수의 write-behind 반영에서는 올리지 않음, 약한 ETag라 카운트는 조금 늦게 보일 수 있음)
+-- comment_version: 그 게시글의 댓글 목록 응답이 바뀔 때마다 증가
+ALTER TABLE post_table
+    ADD COLUMN version INT UNSIGNED NOT NULL DEFAULT 0,
+    ADD COLUMN comment_version INT UNSIGNED NOT NULL DEFAULT 0;
+
+-- 게시글 목록처럼 여러 행을 모은 응답의 버전 (name -> version)
+-- post_feed: 게시글 목록에 보이는 값이 바뀔 때마다 증가
+CREATE TABLE content_version (
+    name VARCHAR(32) NOT NULL PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0
+);
+INSERT INTO content_version (name, version) VALUES ('post_feed', 0);
@@ -0,0 +1,5 @@
+-- GET /posts/search 전문 검색용 FULLTEXT 인덱스
+-- ngram 파서로 공백 없이 붙어 쓰는 한국어도 n-gram(기본 ngram_token_size=2) 단위로 색인
+-- LIKE '%검색어%'와 달리 테이블 전체를 훑지 않고 인덱스에서 일치하는 글만 찾음
+ALTER TABLE post_table
+    ADD FULLTEXT INDEX ft_post_table_title_content (post_title, post_content) WITH PARSER ngram;
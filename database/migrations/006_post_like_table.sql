@@ -0,0 +1,10 @@
+-- 게시글 좋아요 (사용자당 게시글 하나에 한 번)
+-- post_table.like는 이 테이블의 행 수를 write-behind로 다시 세어 반영한 값
+-- 어긋난 값은 애플리케이션이 시작할 때와 LIKES_RECONCILE_INTERVAL마다 post_model.reconcile_like_counts가 고침
+CREATE TABLE post_like_table (
+    post_id INT NOT NULL,
+    user_id INT NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (post_id, user_id),
+    INDEX idx_post_like_table_user (user_id)
+);
@@ -0,0 +1,4 @@
+-- 이메일/닉네임 필터 동기화에서 최근 수정된 사용자만 읽기 위한 인덱스
+--   SELECT user_id, email, nickname, created_at FROM user_table WHERE user_id > ? OR updated_at >= ?
+-- (user_id 조건은 PK, updated_at 조건은 이 인덱스로 읽어 index merge)
+CREATE INDEX idx_user_table_updated_at ON user_table (updated_at);
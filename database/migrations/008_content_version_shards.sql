@@ -0,0 +1,8 @@
+-- 게시글 목록 버전을 여러 행(shard)으로 나눔
+-- 게시글 작성/수정/삭제, 좋아요마다 content_version의 한 행을 갱신하면 그 행 잠금에 쓰기가 몰리므로
+-- 쓰기는 임의의 shard 하나만 올리고, 읽을 때는 같은 name의 모든 shard를 더함
+-- (각 shard는 증가만 하므로 합계도 바뀔 때마다 커짐)
+ALTER TABLE content_version
+    ADD COLUMN shard TINYINT UNSIGNED NOT NULL DEFAULT 0,
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (name, shard);
@@ -0,0 +1,270 @@
+import threading
+from time import monotonic, perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+import pymysql
+
+
+# 커넥션 풀이 가득 차서 제한 시간 안에 커넥션을 얻지 못했을 때 발생
+# 모델의 기존 except pymysql.MySQLError 처리에 그대로 잡히도록 OperationalError를 상속
+class PoolTimeoutError(pymysql.err.OperationalError):
+    pass
+
+
+# 풀에 보관되는 실제 커넥션과 사용 시각 정보
+class _PoolEntry:
+    __slots__ = ("conn", "created_at", "last_used_at")
+
+    def __init__(self, conn):
+        now = monotonic()
+        self.conn = conn
+        self.created_at = now
+        self.last_used_at = now
+
+
+# 풀에서 빌려준 커넥션을 감싸는 프록시
+# 기존 pymysql 커넥션처럼 with 문과 close()를 지원하지만
+# 실제로 닫지 않고 풀에 반납함
+class PooledConnection:
+    def __init__(self, pool: "ConnectionPool", entry: _PoolEntry):
+        self._pool = pool
+        self._entry = entry
+
+    def __getattr__(self, name):
+        entry = self.__dict__.get("_entry")
+        if entry is None:
+            raise pymysql.err.InterfaceError(0, "connection already returned to pool")
+        return getattr(entry.conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # 커넥션을 풀에 반납 (여러 번 호출해도 안전)
+    def close(self):
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._pool._release(entry)
+
+    # close()를 호출하지 않고 버려진 커넥션도 회수
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# 스레드 안전한 MySQL 커넥션 풀
+# min_size: 최소 유지 커넥션 수, max_size: 최대 커넥션 수
+# timeout: 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간(초)
+# idle_timeout: 이 시간(초) 이상 쉬고 있는 여분 커넥션은 닫음
+# ping_interval: 이 시간(초) 이상 쉬었던 커넥션은 빌려주기 전에 ping으로 상태 확인
+class ConnectionPool:
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 5.0,
+        idle_timeout: float = 300.0,
+        ping_interval: float = 30.0,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("invalid pool size: min_size=%s max_size=%s" % (min_size, max_size))
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+
+        self._cond = threading.Condition(threading.RLock())
+        self._idle: List[_PoolEntry] = []
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+
+        # 통계
+        self._borrow_count = 0
+        self._wait_count = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._timeout_count = 0
+        self._created_count = 0
+        self._recycled_count = 0
+        self._broken_count = 0
+
+    # 최소 커넥션 수만큼 미리 연결
+    def prefill(self):
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                entry = self._new_entry()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                raise
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+
+    # 커넥션 대여
+    def acquire(self) -> PooledConnection:
+        start = perf_counter()
+        deadline = monotonic() + self.timeout
+        waited = False
+        while True:
+            entry = None
+            create = False
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise pymysql.err.InterfaceError(0, "connection pool is closed")
+                    if self._idle:
+                        # 최근에 쓴 커넥션부터 재사용 (LIFO) -> 남는 커넥션은 자연스럽게 유휴 상태로 정리됨
+                        entry = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        self._timeout_count += 1
+                        raise PoolTimeoutError(
+                            2013, "timed out after %.1fs waiting for a database connection" % self.timeout
+                        )
+                    waited = True
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                self._in_use += 1
+
+            if create:
+                try:
+                    entry = self._new_entry()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._check(entry):
+                # 상태 확인 실패 -> 버리고 다시 시도
+                with self._cond:
+                    self._size -= 1
+                    self._in_use -= 1
+                    self._broken_count += 1
+                    self._cond.notify()
+                continue
+
+            elapsed = perf_counter() - start
+            with self._cond:
+                self._borrow_count += 1
+                if waited:
+                    self._wait_count += 1
+                    self._wait_time_total += elapsed
+                    self._wait_time_max = max(self._wait_time_max, elapsed)
+            return PooledConnection(self, entry)
+
+    # 커넥션 반납
+    # 커밋되지 않은 트랜잭션은 롤백하여 다음 사용자에게 상태가 넘어가지 않게 함
+    def _release(self, entry: _PoolEntry):
+        healthy = True
+        try:
+            if entry.conn.open:
+                entry.conn.rollback()
+            else:
+                healthy = False
+        except Exception:
+            healthy = False
+
+        to_close = []
+        with self._cond:
+            self._in_use -= 1
+            if healthy and not self._closed:
+                entry.last_used_at = monotonic()
+                self._idle.append(entry)
+                to_close = self._reap_idle()
+            else:
+                self._size -= 1
+                to_close.append(entry)
+            self._cond.notify()
+        for stale in to_close:
+            self._close_entry(stale)
+
+    # idle_timeout을 넘긴 여분 커넥션 정리 (min_size 이하로는 줄이지 않음)
+    # self._cond를 잡은 상태에서 호출
+    def _reap_idle(self) -> List[_PoolEntry]:
+        if self.idle_timeout <= 0:
+            return []
+        limit = monotonic() - self.idle_timeout
+        reaped = []
+        # _idle은 오래 쉰 커넥션이 앞쪽에 쌓임
+        while self._idle and self._size > self.min_size and self._idle[0].last_used_at < limit:
+            reaped.append(self._idle.pop(0))
+            self._size -= 1
+            self._recycled_count += 1
+        return reaped
+
+    # 대여 전 상태 확인
+    def _check(self, entry: _PoolEntry) -> bool:
+        if monotonic() - entry.last_used_at < self.ping_interval:
+            return True
+        try:
+            entry.conn.ping(reconnect=False)
+            return True
+        except Exception:
+            self._close_entry(entry)
+            return False
+
+    def _new_entry(self) -> _PoolEntry:
+        entry = _PoolEntry(self._connect())
+        with self._cond:
+            self._created_count += 1
+        return entry
+
+    @staticmethod
+    def _close_entry(entry: _PoolEntry):
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+
+    # 풀 종료 - 유휴 커넥션을 모두 닫고 이후 대여를 거부
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_entry(entry)
+
+    # 런타임 풀 상태 조회
+    def stats(self) -> Dict[str, Optional[float]]:
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "borrow_count": self._borrow_count,
+                "wait_count": self._wait_count,
+                "wait_time_total_ms": round(self._wait_time_total * 1000, 3),
+                "wait_time_max_ms": round(self._wait_time_max * 1000, 3),
+                "timeout_count": self._timeout_count,
+                "created_count": self._created_count,
+                "recycled_count": self._recycled_count,
+                "broken_count": self._broken_count,
+            }
@@ -2,20 +2,29 @@ import asyncio
 import logging
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from starlette.middleware.cors import CORSMiddleware
-import time
-from typing import Dict, Deque
+from starlette.concurrency import run_in_threadpool
+from typing import Iterable
 from router.users_router import router as users_router
 from router.files_router import router as files_router
 from router.posts_router import router as posts_router
 from router.comments_router import router as comments_router
-from collections import deque
-from fastapi.staticfiles import StaticFiles
+from router.metrics_router import router as metrics_router
+from util.staticFiles import ImmutableStaticFiles
 
-from database.index import get_connection
+from database.index import get_connection, init_pool, close_pool, get_pool_stats
+from database.executor import shutdown_db_executor, get_db_executor_stats
+from model import post_model, user_model, file_model
+from util.passwordHasher import password_hasher
 import os
 from starlette.middleware.sessions import SessionMiddleware
+from util.rateLimit import RateLimiter, RateLimitRule, InMemoryRateLimitBackend, create_backend
+from util.queryBudget import QueryBudgetMiddleware
+from util.metrics import MetricsMiddleware, registry as metrics_registry
+from util.uploadUtil import UploadLimitMiddleware, UPLOAD_MAX_BYTES
+from util.compression import CompressionMiddleware
+from util.imageVariants import image_pipeline
 
 
 # 로거 설정
@@ -24,78 +33,108 @@ logging.basicConfig(level=logging.INFO)
 # 현재 모듈의 로거 인스턴스 생성
 logger = logging.getLogger(__name__)
 
-# 타임아웃 미들웨어 정의
+# 타임아웃 미들웨어 정의 (순수 ASGI)
 # 요청 처리 시간이 지정된 시간(초)을 초과하면 504 응답 반환
-class TimeoutMiddleware(BaseHTTPMiddleware):
+# BaseHTTPMiddleware처럼 요청/응답을 별도 태스크와 스트림으로 감싸지 않아 오버헤드가 적고 스트리밍 응답도 그대로 전달됨
+class TimeoutMiddleware:
     # 타임아웃 시간(초) 설정
     # __init__은 미들웨어 인스턴스 생성 시 호출되는 초기화 메서드
-    def __init__(self, app, timeout: int = 10):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, timeout: int = 10):
+        self.app = app
         self.timeout = timeout
+
     # 요청 처리에 타임아웃 적용
-    async def dispatch(self, request: Request, call_next):
+    # 응답 헤더가 나가기 전까지만 타임아웃을 적용 (기존 call_next 기준과 동일)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # 응답이 시작되면 타임아웃 해제
+                deadline.reschedule(None)
+            await send(message)
+
         try:
-            # asyncio.wait_for를 사용하여 요청 처리에 타임아웃 적용
-            return await asyncio.wait_for(call_next(request), timeout=self.timeout)
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(self.timeout) as deadline:
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError:
+            # 앱 내부에서 발생한 TimeoutError는 그대로 전달
+            if not deadline.expired() or response_started:
+                raise
             # 타임아웃 발생 시 경고 로그 기록
+            metrics_registry.inc("http_timeouts_total")
             logger.warning(
-                f"Request timed out: {request.method} {request.url}"
+                f"Request timed out: {scope['method']} {Request(scope).url}"
             )
             # 504 Gateway Timeout 응답 반환
-            return JSONResponse(
+            response = JSONResponse(
                 {"detail": "Request processing time exceeded limit"},
                 status_code=504
             )
+            await response(scope, receive, send)
 
-# 간단한 메모리 기반 속도 제한 미들웨어 정의
-# 각 클라이언트 IP별로 일정 시간 내에 허용된 요청 횟수를 초과하면 429 응답 반환
-rate_limit_data: Dict[str, Deque[float]] = {}
-
-# 속도 제한 미들웨어 정의
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, requests_limit: int = 5, time_window: int = 10):
-        super().__init__(app)
+# 속도 제한 미들웨어 정의 (순수 ASGI)
+# 클라이언트 IP별로 일정 시간 내에 허용된 요청 횟수를 초과하면 429 응답 반환 (Retry-After 헤더에 다시 요청할 수 있을 때까지의 초)
+# 실제 계산은 util.rateLimit의 슬라이딩 윈도우 카운터 엔진이 담당 (키당 고정 메모리, 유휴 키 자동 정리)
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests_limit: int = 5,
+        time_window: int = 10,
+        backend=None,
+        rules: Iterable[RateLimitRule] = (),
+    ):
+        self.app = app
         self.requests_limit = requests_limit  # 허용 요청 횟수
         self.time_window = time_window      # 시간 창 (초)
+        # backend: 카운터 저장소 (기본은 프로세스 메모리), rules: 경로별 한도
+        self.limiter = RateLimiter(backend or InMemoryRateLimitBackend(), requests_limit, time_window, rules)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # 클라이언트 IP 가져오기
         # 없을 경우 "unknown" 사용
-        client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
-
-        # 현재 IP에 대한 요청 기록 가져오기 (없으면 새로 생성)
-        request_timestamps = rate_limit_data.setdefault(client_ip, deque())
-
-        # 시간 창을 벗어난 오래된 타임스탬프 제거
-        while request_timestamps and request_timestamps[0] < current_time - self.time_window:
-            request_timestamps.popleft()
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
         # 현재 요청 횟수가 한도를 초과했는지 확인
-        if len(request_timestamps) >= self.requests_limit:
-            return JSONResponse(
+        result = await self.limiter.allow(client_ip, scope["method"], scope["path"])
+        if not result.allowed:
+            metrics_registry.inc("http_rate_limited_total")
+            response = JSONResponse(
                 {"detail": "Too Many Requests"},
-                status_code=429 # 429 Too Many Requests
+                status_code=429, # 429 Too Many Requests
+                # 정수 초만 쓸 수 있으므로 올림 (경계 시점에는 아직 거절되므로 1초 여유)
+                headers={"Retry-After": str(int(result.retry_after) + 1)},
             )
-
-        # 현재 요청의 타임스탬프 추가
-        request_timestamps.append(current_time)
+            await response(scope, receive, send)
+            return
 
         # 다음 미들웨어 또는 엔드포인트 실행
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
 app = FastAPI()
 
 # 정적 파일 서빙 설정
-app.mount("/public", StaticFiles(directory="public"))
+# 업로드 이미지는 내용 해시 경로에 저장되므로 immutable 캐시 헤더와 함께 서빙
+app.mount("/public", ImmutableStaticFiles(directory="public"))
 
 # 라우터 포함
 app.include_router(users_router)
 app.include_router(posts_router)
 app.include_router(comments_router)
 app.include_router(files_router)
+app.include_router(metrics_router)
 
 # CORS 설정
 ALLOW_ORIGINS = [
@@ -108,12 +147,46 @@ ALLOW_ORIGINS = [
 # 미들웨어 추가
 app.add_middleware(TimeoutMiddleware, timeout=15)
 
+# 응답 압축 미들웨어 추가 (JSON 등 텍스트 응답을 brotli/gzip으로 압축)
+# COMPRESSION_MIN_SIZE보다 작은 응답은 그대로 보냄
+app.add_middleware(CompressionMiddleware)
+
+# 요청 메트릭 수집 미들웨어 추가 (/metrics로 노출)
+# 타임아웃 미들웨어 바깥에 두어 504 응답도 라우트별로 집계
+app.add_middleware(MetricsMiddleware)
+
+# 업로드 크기 제한 미들웨어 추가
+# Content-Length가 UPLOAD_MAX_BYTES를 넘으면 본문을 받기 전에, 아니면 받는 도중 한도를 넘는 순간 413 응답
+app.add_middleware(
+    UploadLimitMiddleware,
+    max_bytes=UPLOAD_MAX_BYTES,
+    paths=("/posts/upload/attach-file", "/users/upload/profile-image"),
+)
+
+# 요청별 쿼리 수/DB 시간 계측 미들웨어 추가 (Server-Timing 헤더, 쿼리 예산 초과 및 N+1 경고 로그)
+app.add_middleware(
+    QueryBudgetMiddleware,
+    budget=int(os.getenv("QUERY_BUDGET", "8")),
+    n_plus_one_threshold=int(os.getenv("QUERY_N_PLUS_ONE_THRESHOLD", "3")),
+    server_timing=os.getenv("SERVER_TIMING", "true").lower() == "true",
+)
+
 # 속도 제한 미들웨어 추가
-# 현재: 10초에 100회 요청 허용
+# 현재: 10초에 100회 요청 허용, 로그인은 60초에 20회
+# RATE_LIMIT_BACKEND=redis 로 설정하면 Redis에 카운터를 두어 모든 워커가 같은 한도를 공유
+RATE_LIMIT_RULES = [
+    RateLimitRule("login", limit=20, window=60, path_prefix="/users/login", methods=("POST",)),
+]
 app.add_middleware(
     RateLimitMiddleware,
     requests_limit=100,
-    time_window=10
+    time_window=10,
+    backend=create_backend(
+        os.getenv("RATE_LIMIT_BACKEND", "memory"),
+        redis_url=os.getenv("REDIS_URL"),
+        max_keys=int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000")),
+    ),
+    rules=RATE_LIMIT_RULES,
 )
 
 """
@@ -139,6 +212,93 @@ app.add_middleware(
 # SESSION_SECRET 환경 변수를 비밀 키로 사용
 app.add_middleware(SessionMiddleware, secret_key=os.getenv("SESSION_SECRET"))
 
+# /metrics 조회 시점에 읽는 런타임 상태 (커넥션 풀, DB 스레드풀, 조회수/좋아요 버퍼, 이미지 변형 작업, 비밀번호 해싱 대기열)
+def collect_runtime_metrics():
+    pool_stats = get_pool_stats()
+    yield "db_pool_connections", "gauge", "Database connections in the pool by state.", [
+        ({"state": "in_use"}, pool_stats["in_use"]),
+        ({"state": "idle"}, pool_stats["idle"]),
+    ]
+    yield "db_pool_waiting", "gauge", "Threads waiting for a pooled connection.", [({}, pool_stats["waiting"])]
+    yield "db_pool_wait_seconds_total", "counter", "Total time spent waiting for a pooled connection.", [
+        ({}, pool_stats["wait_time_total_ms"] / 1000),
+    ]
+    yield "db_pool_timeouts_total", "counter", "Connection requests that timed out.", [({}, pool_stats["timeout_count"])]
+    yield "db_executor_pending", "gauge", "DB tasks running or queued on the DB thread pool.", [
+        ({}, get_db_executor_stats()["pending"]),
+    ]
+    yield "post_hits_pending", "gauge", "View count increments not yet flushed to MySQL.", [
+        ({}, post_model.hit_buffer.stats()["pending"]),
+    ]
+    yield "post_likes_pending", "gauge", "Like count changes not yet flushed to MySQL.", [
+        ({}, post_model.like_buffer.stats()["pending"]),
+    ]
+    hasher_stats = password_hasher.stats()
+    yield "image_variant_pending", "gauge", "Uploaded images waiting for size variants.", [
+        ({}, image_pipeline.stats()["pending"]),
+    ]
+    for name, stats in user_model.user_name_filter_stats().items():
+        if stats is not None:
+            yield "user_name_filter_entries", "gauge", "Values added to the email/nickname Bloom filters.", [
+                ({"filter": name}, stats["count"]),
+            ]
+    yield "password_hash_pending", "gauge", "Password hash/verify jobs running or queued.", [({}, hasher_stats["pending"])]
+    yield "password_hash_rejected_total", "counter", "Password hash/verify jobs rejected because the queue was full.", [
+        ({}, hasher_stats["rejected_count"]),
+    ]
+
+# 메모리 캐시 적중/실패/제거 통계 (cache 라벨로 구분)
+def collect_cache_metrics():
+    caches = {
+        "post_detail": post_model.post_detail_cache.stats(),
+        "session": user_model.session_cache.stats(),
+    }
+    yield "cache_entries", "gauge", "Entries currently held by in-process caches.", [
+        ({"cache": name}, stats["size"]) for name, stats in caches.items()
+    ]
+    for key in ("hits", "misses", "evictions", "expirations"):
+        yield f"cache_{key}_total", "counter", f"In-process cache {key}.", [
+            ({"cache": name}, stats[key]) for name, stats in caches.items()
+        ]
+
+metrics_registry.register_collector(collect_runtime_metrics)
+metrics_registry.register_collector(collect_cache_metrics)
+
+# 업로드 이미지의 변형 생성이 끝나면 file_table에 경로를 기록하고 해당 게시글 상세 캐시 무효화
+async def record_image_variants(file_path: str, variants: dict):
+    await file_model.update_file_variants(file_path, variants)
+    post_model.invalidate_file_posts(file_path)
+
+image_pipeline.on_done = record_image_variants
+
+# 다른 워커에서 가입/닉네임 변경한 사용자를 이메일/닉네임 필터에 주기적으로 반영
+# 시작 시 필터를 만들지 못했으면(DB 장애 등) 여기서 다시 시도하고, 그동안 중복 확인은 DB에서 함
+async def sync_user_name_filters_loop():
+    while True:
+        await asyncio.sleep(user_model.USER_NAME_SYNC_INTERVAL)
+        try:
+            await user_model.sync_user_name_filters()
+        except Exception as e:
+            logger.warning(f"user name filter sync failed: {e}")
+
+user_name_sync_task = None
+
+# 좋아요 수를 post_like_table 기준으로 맞추는 작업 (시작할 때 한 번, 이후 LIKES_RECONCILE_INTERVAL마다)
+# 비정상 종료로 반영하지 못한 좋아요 증감분을 고침
+async def reconcile_like_counts_loop():
+    while True:
+        try:
+            post_ids = await post_model.reconcile_like_counts()
+            if post_ids:
+                logger.info(f"reconciled like counts for {len(post_ids)} posts")
+        except Exception as e:
+            logger.warning(f"like count reconcile failed: {e}")
+        if post_model.LIKES_RECONCILE_INTERVAL <= 0:
+            return
+        await asyncio.sleep(post_model.LIKES_RECONCILE_INTERVAL)
+
+like_reconcile_task = None
+
 # 애플리케이션 시작 시 모든 사용자의 session_id를 NULL로 초기화
 def init_session_id():
     try:
@@ -156,4 +316,35 @@ def init_session_id():
 # 애플리케이션 시작 이벤트에 초기화 함수 등록
 @app.on_event("startup")
 async def startup_event():
-    init_session_id()
\ No newline at end of file
+    try:
+        init_pool()
+    except Exception as e:
+        print("MySQL error in init_pool:", e)
+    init_session_id()
+    # 조회수/좋아요 수 write-behind 반영 작업 시작
+    post_model.hit_buffer.start()
+    post_model.like_buffer.start()
+    # 이메일/닉네임 중복 확인용 필터 생성 후 주기적 동기화 시작
+    global user_name_sync_task
+    try:
+        await user_model.load_user_name_filters()
+    except Exception as e:
+        print("MySQL error in load_user_name_filters:", e)
+    user_name_sync_task = asyncio.create_task(sync_user_name_filters_loop())
+    global like_reconcile_task
+    like_reconcile_task = asyncio.create_task(reconcile_like_counts_loop())
+
+# 애플리케이션 종료 시 남은 조회수/좋아요 수와 이미지 변형 작업을 마친 뒤 해싱/DB 스레드풀과 커넥션 풀 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    if user_name_sync_task is not None:
+        user_name_sync_task.cancel()
+    if like_reconcile_task is not None:
+        like_reconcile_task.cancel()
+    await post_model.hit_buffer.stop()
+    await post_model.like_buffer.stop()
+    await image_pipeline.stop()
+    # 실행 중인 해싱/DB 작업이 끝날 때까지 기다리는 동안 이벤트 루프를 막지 않도록 다른 스레드에서 정리
+    await run_in_threadpool(password_hasher.shutdown)
+    await run_in_threadpool(shutdown_db_executor)
+    close_pool()
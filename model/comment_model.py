@@ -1,21 +1,36 @@
 from database.index import get_connection
+from database.executor import db_task
+from model.post_model import invalidate_post, bump_feed_version
 from util.constant.httpStatusCode import STATUS_MESSAGE
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-# 댓글 조회
-async def get_comments(post_id: int) -> list:
+# 댓글 조회 (커서 방식, 작성 순)
+# after: 이전 페이지 마지막 댓글의 comment_id, None이면 첫 페이지
+# (post_id, deleted_at, comment_id) 인덱스를 타고 시작 지점부터 limit개만 읽음
+@db_task
+def get_comments(post_id: int, after: Optional[int] = None, limit: int = 20) -> list:
     result = []
     try:
         with get_connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
-                SELECT ct.*, ut.file_id, COALESCE(ft.file_path, NULL) AS profileImage
+                SELECT
+                    ct.comment_id,
+                    ct.post_id,
+                    ct.user_id,
+                    ct.nickname,
+                    ct.comment_content,
+                    ct.created_at,
+                    ct.updated_at,
+                    ft.file_path AS profileImage
                 FROM comment_table AS ct
                 LEFT JOIN user_table AS ut ON ct.user_id = ut.user_id
                 LEFT JOIN file_table AS ft ON ut.file_id = ft.file_id
-                WHERE ct.post_id = %s AND ct.deleted_at IS NULL;
+                WHERE ct.post_id = %s AND ct.deleted_at IS NULL AND ct.comment_id > %s
+                ORDER BY ct.comment_id
+                LIMIT %s;
                 """,
-                post_id
+                (post_id, after or 0, limit)
             )
             result = cursor.fetchall()
     except Exception as e:
@@ -24,7 +39,8 @@ async def get_comments(post_id: int) -> list:
     return result
 
 # 새로운 댓글 작성
-async def write_comment(post_id: int, user_id: int, comment_content: str) -> str | int | bool:
+@db_task
+def write_comment(post_id: int, user_id: int, comment_content: str) -> str | int | bool:
     result = False
     try:
         with get_connection() as connection, connection.cursor() as cursor:
@@ -62,12 +78,17 @@ async def write_comment(post_id: int, user_id: int, comment_content: str) -> str
 
             comment_count_sql = """
                 UPDATE post_table
-                SET comment_count = comment_count + 1
+                SET comment_count = comment_count + 1,
+                    version = version + 1,
+                    comment_version = comment_version + 1
                 WHERE post_id = %s;
             """
             cursor.execute(comment_count_sql, (result_post,))
             result = cursor.lastrowid
+            bump_feed_version(cursor)
             connection.commit()
+            # 댓글 수가 바뀌었으므로 게시글 상세 캐시 무효화
+            invalidate_post(result_post)
             return result
     except Exception as e:
         print("MySQL error in write_comment:", e)
@@ -75,7 +96,8 @@ async def write_comment(post_id: int, user_id: int, comment_content: str) -> str
     return result
 
 # 댓글 삭제
-async def delete_comment(post_id: int, comment_id: int, user_id: int):
+@db_task
+def delete_comment(post_id: int, comment_id: int, user_id: int):
     result = False
     try:
         with get_connection() as conn, conn.cursor() as cur:
@@ -116,12 +138,16 @@ async def delete_comment(post_id: int, comment_id: int, user_id: int):
 
             comment_count_sql = """
             UPDATE post_table
-            SET comment_count = comment_count - 1
+            SET comment_count = comment_count - 1,
+                version = version + 1,
+                comment_version = comment_version + 1
             WHERE post_id = %s;
             """
 
             cur.execute(comment_count_sql, (post_id,))
+            bump_feed_version(cur)
             conn.commit()
+            invalidate_post(post_id)
             return result
     except Exception as e:
         print("MySQL error in delete_comment:", e)
@@ -129,7 +155,8 @@ async def delete_comment(post_id: int, comment_id: int, user_id: int):
     return result
 
 # 댓글 수정
-async def update_comment(post_id: int, comment_id: int, user_id: int, comment_content: str) -> Dict[str, Any] | str | None:
+@db_task
+def update_comment(post_id: int, comment_id: int, user_id: int, comment_content: str) -> Dict[str, Any] | str | None:
     result = False
     try:
         with get_connection() as conn, conn.cursor() as cur:
@@ -150,6 +177,11 @@ async def update_comment(post_id: int, comment_id: int, user_id: int, comment_co
 
             cur.execute(sql, (comment_content, post_id, comment_id, user_id))
             result = cur.rowcount
+            if result:
+                cur.execute(
+                    "UPDATE post_table SET comment_version = comment_version + 1 WHERE post_id = %s",
+                    (post_id,),
+                )
 
             conn.commit()
             return result
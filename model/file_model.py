@@ -0,0 +1,35 @@
+import json
+from typing import Dict
+from pymysql import MySQLError as Error
+from database.index import get_connection
+from database.executor import db_task
+from model.post_model import bump_feed_version
+
+# 파일의 변형 이미지 경로 기록
+# 업로드 후 변형 생성이 끝났을 때 호출되며, 같은 경로를 쓰는 file_table 행을 모두 갱신
+# (아직 행이 없으면 나중에 행을 넣을 때 디스크의 변형 파일을 보고 채움)
+# 응답에 변형 경로가 들어가는 게시글(첨부파일, 작성자 프로필)과 게시글 목록의 버전도 올림
+@db_task
+def update_file_variants(file_path: str, variants: Dict[str, str]) -> int:
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "UPDATE file_table SET variants = %s WHERE file_path = %s AND deleted_at IS NULL",
+                (json.dumps(variants, separators=(",", ":")), file_path),
+            )
+            updated = cur.rowcount
+            if updated:
+                cur.execute(
+                    """
+                    UPDATE post_table SET version = version + 1
+                    WHERE file_id IN (SELECT file_id FROM file_table WHERE file_path = %s)
+                       OR user_id IN (SELECT user_id FROM file_table WHERE file_path = %s AND file_category = 1)
+                    """,
+                    (file_path, file_path),
+                )
+                bump_feed_version(cur)
+            conn.commit()
+            return updated
+    except Error as e:
+        print("MySQL error in update_file_variants:", e)
+        return 0
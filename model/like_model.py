@@ -0,0 +1,92 @@
+from typing import Dict, Any, Union
+from pymysql import MySQLError as Error
+from database.index import get_connection
+from database.executor import db_task
+from model.post_model import like_buffer, bump_feed_version
+from util.constant.httpStatusCode import STATUS_MESSAGE
+
+# 게시글 좋아요
+# post_like_table에 (게시글, 사용자) 행을 넣고, 새로 넣은 경우에만 like_buffer에 +1 (post_table.like 반영 예약)
+# 이미 좋아요한 게시글이면 아무것도 바꾸지 않음 (같은 요청을 다시 보내도 결과가 같음)
+# 반환값: {"liked": True, "like": 좋아요 수}, 게시글이 없으면 STATUS_MESSAGE 문자열
+# 좋아요 수는 같은 트랜잭션에서 post_like_table의 행 수를 센 값 (다른 워커의 반영 대기분도 포함)
+async def like_post(post_id: int, user_id: int) -> Union[Dict[str, Any], str]:
+    result = await _insert_like(post_id, user_id)
+    if isinstance(result, str):
+        return result
+    inserted, like_count = result
+    if inserted:
+        like_buffer.add(post_id, 1)
+    return {"liked": True, "like": like_count}
+
+# 게시글 좋아요 취소
+# 좋아요 행을 지운 경우에만 like_buffer에 -1
+async def unlike_post(post_id: int, user_id: int) -> Union[Dict[str, Any], str]:
+    result = await _delete_like(post_id, user_id)
+    if isinstance(result, str):
+        return result
+    deleted, like_count = result
+    if deleted:
+        like_buffer.add(post_id, -1)
+    return {"liked": False, "like": like_count}
+
+# 게시글의 좋아요 수 (post_like_table의 (post_id, user_id) 기본 키 범위만 셈)
+def _count_likes(cur, post_id: int) -> int:
+    cur.execute("SELECT COUNT(*) AS like_count FROM post_like_table WHERE post_id = %s", (post_id,))
+    return cur.fetchone()["like_count"]
+
+# 좋아요 행 추가 -> (새로 추가했는지, 추가한 뒤의 좋아요 수)
+# post_table은 잠그지 않고 읽기만 함 (좋아요 수 증가는 like_buffer가 모아서 반영, 목록 버전은 shard 하나만 올림)
+@db_task
+def _insert_like(post_id: int, user_id: int):
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT 1 FROM post_table WHERE post_id = %s AND deleted_at IS NULL",
+                (post_id,),
+            )
+            if not cur.fetchone():
+                return STATUS_MESSAGE["NOT_FOUND_POST"]
+            cur.execute(
+                """
+                INSERT INTO post_like_table (post_id, user_id) VALUES (%s, %s)
+                ON DUPLICATE KEY UPDATE post_id = post_id
+                """,
+                (post_id, user_id),
+            )
+            # 새로 넣으면 1, 이미 있으면 0 (접속 옵션에 CLIENT_FOUND_ROWS를 쓰지 않음)
+            inserted = cur.rowcount == 1
+            # 목록에 보이는 좋아요 수가 바뀌므로 목록 버전을 올림
+            if inserted:
+                bump_feed_version(cur)
+            like_count = _count_likes(cur, post_id)
+            conn.commit()
+            return inserted, like_count
+    except Error as e:
+        print("MySQL error in like_post:", e)
+        return STATUS_MESSAGE["LIKE_POST_FAILED"]
+
+# 좋아요 행 삭제 -> (삭제했는지, 삭제한 뒤의 좋아요 수)
+@db_task
+def _delete_like(post_id: int, user_id: int):
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT 1 FROM post_table WHERE post_id = %s AND deleted_at IS NULL",
+                (post_id,),
+            )
+            if not cur.fetchone():
+                return STATUS_MESSAGE["NOT_FOUND_POST"]
+            cur.execute(
+                "DELETE FROM post_like_table WHERE post_id = %s AND user_id = %s",
+                (post_id, user_id),
+            )
+            deleted = cur.rowcount == 1
+            if deleted:
+                bump_feed_version(cur)
+            like_count = _count_likes(cur, post_id)
+            conn.commit()
+            return deleted, like_count
+    except Error as e:
+        print("MySQL error in unlike_post:", e)
+        return STATUS_MESSAGE["UNLIKE_POST_FAILED"]
@@ -3,9 +3,68 @@ from util.constant.httpStatusCode import STATUS_MESSAGE
 from typing import Optional, Dict, Any
 from pymysql.cursors import DictCursor
 from database.index import get_connection
+from database.executor import db_task
+from util.counterBuffer import CounterBuffer
+from util.ttlCache import TTLCache
+from util.imageVariants import variants_json, parse_variants
+import os
+import random
+
+# 게시글 상세 캐시 (post_id -> 게시글 + 첨부파일 + 작성자 프로필 이미지를 모은 행)
+# 조회수/좋아요 수는 자주 바뀌므로 캐시된 행에는 DB 값만 두고 응답할 때 반영 대기 중인 증감분을 더함
+# 같은 프로세스의 쓰기(게시글 수정/삭제, 댓글 작성/삭제, 작성자 프로필 변경)는 커밋 직후 무효화
+# 조회수/좋아요 반영은 무효화하지 않고 캐시된 행의 카운트에 반영된 증가분을 더함
+# 다른 워커에서 일어난 변경은 TTL이 지나야 반영됨
+post_detail_cache = TTLCache(
+    max_size=int(os.getenv("POST_CACHE_MAX_SIZE", "1000")),
+    ttl=float(os.getenv("POST_CACHE_TTL", "60")),
+)
+
+# 게시글 상세 캐시 무효화
+def invalidate_post(post_id: int):
+    post_detail_cache.pop(int(post_id))
+
+# 첨부파일/프로필 이미지의 변형 경로가 기록됐을 때 그 파일을 쓰는 게시글 상세 캐시를 무효화
+def invalidate_file_posts(file_path: str):
+    post_detail_cache.pop_if(lambda _, row: file_path in (row.get("filePath"), row.get("profileImage")))
+
+# 작성자의 프로필이 바뀌었을 때 그 작성자의 게시글 상세 캐시를 모두 무효화
+def invalidate_author_posts(user_id: int):
+    post_detail_cache.pop_if(lambda _, row: row.get("user_id") == user_id)
+
+# 게시글 목록 버전 키 (content_version.name)
+POST_FEED_VERSION = "post_feed"
+
+# 게시글 목록 버전을 나눠 담는 행 수 (content_version의 (name, shard))
+# 모든 쓰기가 한 행을 잠그지 않도록 쓰기마다 임의의 shard 하나만 올림
+FEED_VERSION_SHARDS = int(os.getenv("FEED_VERSION_SHARDS", "16"))
+
+# 게시글 목록 버전 올리기
+# 목록에 보이는 값을 바꾸는 쓰기 트랜잭션 안에서 커밋 전에 호출 (같은 트랜잭션으로 반영됨)
+def bump_feed_version(cur):
+    cur.execute(
+        """
+        INSERT INTO content_version (name, shard, version) VALUES (%s, %s, 1)
+        ON DUPLICATE KEY UPDATE version = version + 1
+        """,
+        (POST_FEED_VERSION, random.randrange(FEED_VERSION_SHARDS)),
+    )
+
+# 작성자의 프로필이 바뀌었을 때 그 작성자의 게시글 상세와, 그 작성자가 댓글을 단 게시글의 댓글 목록 버전 올리기
+def bump_author_versions(cur, user_id: int):
+    cur.execute("UPDATE post_table SET version = version + 1 WHERE user_id = %s", (user_id,))
+    cur.execute(
+        """
+        UPDATE post_table SET comment_version = comment_version + 1
+        WHERE post_id IN (SELECT post_id FROM comment_table WHERE user_id = %s AND deleted_at IS NULL)
+        """,
+        (user_id,),
+    )
+    bump_feed_version(cur)
 
 # 게시글 작성
-async def create_post(
+@db_task
+def create_post(
     user_id: int,
     post_title: str,
     post_content: str,
@@ -42,10 +101,10 @@ async def create_post(
                 cur.execute(
                     """
                     INSERT INTO file_table 
-                    (user_id, post_id, file_path, file_category)
-                    VALUES (%s, %s, %s, 2)
+                    (user_id, post_id, file_path, variants, file_category)
+                    VALUES (%s, %s, %s, %s, 2)
                     """,
-                    (user_id, insert_id, attach_file_path),
+                    (user_id, insert_id, attach_file_path, variants_json(attach_file_path)),
                 )
                 file_id = cur.lastrowid
                 if file_id is not None:
@@ -58,6 +117,7 @@ async def create_post(
                         (file_id, insert_id),
                     )
 
+            bump_feed_version(cur)
             conn.commit()
 
             """
@@ -80,7 +140,8 @@ async def create_post(
             conn.close()
 
 # 게시글 업데이트
-async def update_post(
+@db_task
+def update_post(
     postId: int,
     userId: int,
     postTitle: str,
@@ -108,20 +169,31 @@ async def update_post(
             if attachFilePath is None:
                 cur.execute("UPDATE post_table SET file_id = NULL WHERE post_id = %s", (postId,))
             elif attachFilePath:
-                cur.execute("SELECT file_id FROM file_table WHERE file_path = %s", (attachFilePath,))
+                # 업로드는 내용 해시 경로로 중복 제거되므로 같은 경로의 행이 다른 게시글/사용자 것일 수 있음
+                # -> 이 게시글의 첨부파일 행만 찾고, 없으면 새로 만든 뒤 항상 post_table.file_id를 맞춤
+                cur.execute(
+                    "SELECT file_id FROM file_table WHERE file_path = %s AND post_id = %s",
+                    (attachFilePath, postId),
+                )
                 row = cur.fetchone()
-                if not row:
+                if row:
+                    file_id = int(row["file_id"])
+                else:
                     cur.execute(
                         """
-                        INSERT INTO file_table (user_id, post_id, file_path, file_category)
-                        VALUES (%s, %s, %s, 2)
+                        INSERT INTO file_table (user_id, post_id, file_path, variants, file_category)
+                        VALUES (%s, %s, %s, %s, 2)
                         """,
-                        (userId, postId, attachFilePath),
+                        (userId, postId, attachFilePath, variants_json(attachFilePath)),
                     )
                     file_id = int(cur.lastrowid)
-                    cur.execute("UPDATE post_table SET file_id = %s WHERE post_id = %s", (file_id, postId))
+                cur.execute("UPDATE post_table SET file_id = %s WHERE post_id = %s", (file_id, postId))
 
+            # 첨부파일만 바뀐 경우도 있으므로 changedRows와 별개로 버전을 올림
+            cur.execute("UPDATE post_table SET version = version + 1 WHERE post_id = %s", (postId,))
+            bump_feed_version(cur)
         conn.commit()
+        invalidate_post(postId)
 
         """
         MySQL2 드라이버 문제로 직접 메타 정보 생성
@@ -151,145 +223,469 @@ async def update_post(
             conn.close()
 
 # 게시글 삭제
-async def delete_post(postId: int) -> bool:
+@db_task
+def delete_post(postId: int) -> bool:
     result = False
     try:
         with get_connection() as conn, conn.cursor() as cur:
             cur.execute(
                 """
                 UPDATE post_table
-                SET deleted_at = NOW()
+                SET deleted_at = NOW(), version = version + 1
                 WHERE post_id = %s AND deleted_at IS NULL;
                 """,
                 (postId,),
             )
+            bump_feed_version(cur)
             conn.commit()
+            invalidate_post(postId)
             result = True
     except Error as e:
         print("MySQL error in delete_post:", e)
         result = False
     return result
 
-# 게시글 목록 조회
-async def get_post_list(offset: int, limit: int) -> list:
+# 게시글 목록 조회 공통 컬럼/FROM 절
+_POST_LIST_COLUMNS_SQL = """
+        p.post_id,
+        p.post_title,
+        p.post_content,
+        p.file_id,
+        p.user_id,
+        p.nickname,
+        p.created_at,
+        p.updated_at,
+        p.deleted_at,
+        p.`like`,
+        p.comment_count,
+        p.hits,
+        COALESCE(f.file_path, NULL) AS profileImagePath,
+        f.variants AS profileImageVariants
+"""
+_POST_LIST_FROM_SQL = """
+    FROM post_table AS p
+    LEFT JOIN user_table AS u ON p.user_id = u.user_id
+    LEFT JOIN file_table AS f ON u.file_id = f.file_id
+"""
+_POST_LIST_SELECT_SQL = "SELECT" + _POST_LIST_COLUMNS_SQL + _POST_LIST_FROM_SQL
+
+# 조회수/좋아요 수에 아직 DB에 반영되지 않은 증감분을 더함
+def _merge_pending_counts(row: Dict[str, Any]) -> Dict[str, Any]:
+    row["hits"] += hit_buffer.pending(row["post_id"])
+    row["like"] += like_buffer.pending(row["post_id"])
+    return row
+
+# 목록 행 후처리: 반영 대기 중인 카운트를 더하고 프로필 이미지 변형 경로(JSON)를 딕셔너리로 변환
+def _prepare_list_rows(rows: list) -> list:
+    for row in rows:
+        _merge_pending_counts(row)
+        row["profileImageVariants"] = parse_variants(row.get("profileImageVariants"))
+    return rows
+
+# 게시글 목록 조회 (offset 방식, 하위 호환용)
+@db_task
+def get_post_list(offset: int, limit: int) -> list:
     result = None
     try:
         with get_connection() as conn, conn.cursor() as cur:
             cur.execute(
-                """
-                SELECT
-                    p.post_id,
-                    p.post_title,
-                    p.post_content,
-                    p.file_id,
-                    p.user_id,
-                    p.nickname,
-                    p.created_at,
-                    p.updated_at,
-                    p.deleted_at,
-                    CASE
-                        WHEN p.`like` >= 1000000 THEN CONCAT(ROUND(p.`like` / 1000000, 1), 'M')
-                        WHEN p.`like` >= 1000    THEN CONCAT(ROUND(p.`like` / 1000, 1), 'K')
-                        ELSE p.`like`
-                    END AS likeCount,
-                    CASE
-                        WHEN p.comment_count >= 1000000 THEN CONCAT(ROUND(p.comment_count / 1000000, 1), 'M')
-                        WHEN p.comment_count >= 1000    THEN CONCAT(ROUND(p.comment_count / 1000, 1), 'K')
-                        ELSE p.comment_count
-                    END AS commentCount,
-                    CASE
-                        WHEN p.hits >= 1000000 THEN CONCAT(ROUND(p.hits / 1000000, 1), 'M')
-                        WHEN p.hits >= 1000    THEN CONCAT(ROUND(p.hits / 1000, 1), 'K')
-                        ELSE p.hits
-                    END AS hits,
-                    COALESCE(f.file_path, NULL) AS profileImagePath
-                FROM post_table AS p
-                LEFT JOIN user_table AS u ON p.user_id = u.user_id
-                LEFT JOIN file_table AS f ON u.file_id = f.file_id
+                _POST_LIST_SELECT_SQL + """
                 WHERE p.deleted_at IS NULL
-                ORDER BY p.created_at DESC
+                ORDER BY p.created_at DESC, p.post_id DESC
                 LIMIT %s OFFSET %s;
                 """,
                 (limit, offset),
             )
-            result = cur.fetchall()
+            result = _prepare_list_rows(cur.fetchall())
     except Exception as e:
         print("MySQL error in get_post_list:", e)
         result = None
     return result
 
+# 게시글 목록 조회 (커서 방식)
+# cursor: 이전 페이지 마지막 게시글의 (created_at, post_id), None이면 첫 페이지
+# (created_at, post_id) 인덱스를 타고 바로 시작 지점으로 이동하므로 페이지가 깊어져도 비용이 같음
+@db_task
+def get_post_list_by_cursor(cursor: Optional[tuple], limit: int) -> list:
+    result = None
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            if cursor is None:
+                cur.execute(
+                    _POST_LIST_SELECT_SQL + """
+                    WHERE p.deleted_at IS NULL
+                    ORDER BY p.created_at DESC, p.post_id DESC
+                    LIMIT %s;
+                    """,
+                    (limit,),
+                )
+            else:
+                created_at, post_id = cursor
+                cur.execute(
+                    _POST_LIST_SELECT_SQL + """
+                    WHERE p.deleted_at IS NULL
+                      AND (p.created_at < %s OR (p.created_at = %s AND p.post_id < %s))
+                    ORDER BY p.created_at DESC, p.post_id DESC
+                    LIMIT %s;
+                    """,
+                    (created_at, created_at, post_id, limit),
+                )
+            result = _prepare_list_rows(cur.fetchall())
+    except Exception as e:
+        print("MySQL error in get_post_list_by_cursor:", e)
+        result = None
+    return result
+
+# 전문 검색 (post_title, post_content의 FULLTEXT ngram 인덱스 사용)
+# 검색어의 단어마다 필수 구문("단어")으로 찾으므로 ngram 파서에서는 단어 안의 n-gram이 순서대로 모두 있는 글만 일치
+_SEARCH_MATCH_SQL = "MATCH (post_title, post_content) AGAINST (%s IN BOOLEAN MODE)"
+# BOOLEAN MODE 연산자로 해석되는 문자 (검색어에서는 공백으로 바꿈)
+_SEARCH_OPERATORS = str.maketrans({c: " " for c in '+-<>()~*"@'})
+# 검색 단어 최소 길이 (MySQL ngram_token_size 기본값, 이보다 짧은 단어는 인덱스로 찾을 수 없으므로 제외)
+SEARCH_MIN_WORD_LENGTH = 2
+# 검색식에 넣는 최대 단어 수
+SEARCH_MAX_WORDS = 8
+
+# 검색어를 BOOLEAN MODE 검색식으로 변환 (예: '스타트업 회고' -> '+"스타트업" +"회고"'), 쓸 수 있는 단어가 없으면 빈 문자열
+def search_expression(query: str) -> str:
+    words = [w for w in query.translate(_SEARCH_OPERATORS).split() if len(w) >= SEARCH_MIN_WORD_LENGTH]
+    return " ".join(f'+"{word}"' for word in words[:SEARCH_MAX_WORDS])
+
+# 검색 결과로 보여주는 최대 게시글 수 (관련도 상위 N개까지만 페이지를 넘길 수 있음)
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "1000"))
+
+# 게시글 검색 (관련도 순, 커서 방식)
+# cursor: 이전 페이지 마지막 게시글의 (score, post_id), None이면 첫 페이지
+# 반환되는 각 행에는 관련도 점수(score, 소수점 6자리 Decimal)가 들어 있음
+# 안쪽 쿼리에서 관련도 상위 SEARCH_MAX_RESULTS개의 post_id만 고른 뒤 그 안에서 커서를 적용하고 조인함
+# - 정렬/커서 비교/조인은 최대 SEARCH_MAX_RESULTS개 후보에만 적용됨 (그 뒤의 결과는 보여주지 않음)
+# - 안쪽 쿼리는 MATCH 조건만 두고 MATCH 값으로만 정렬하므로 MySQL 8.0에서는 상위 N개만 골라 정렬할 수 있음
+#   (EXPLAIN의 Ft_hints: sorted, limit), 그래도 검색어가 들어간 문서는 전문 인덱스에서 모두 읽음
+# - 점수는 DOUBLE을 DECIMAL로 잘라서 비교하므로 커서에 담았다가 돌려받아도 값이 정확히 같음
+@db_task
+def search_posts(query: str, cursor: Optional[tuple], limit: int) -> Optional[list]:
+    expression = search_expression(query)
+    if not expression:
+        return []
+    sql = (
+        "SELECT s.score," + _POST_LIST_COLUMNS_SQL
+        + f"""
+    FROM (
+        SELECT post_id, CAST({_SEARCH_MATCH_SQL} AS DECIMAL(20, 6)) AS score
+        FROM post_table
+        WHERE {_SEARCH_MATCH_SQL}
+        ORDER BY {_SEARCH_MATCH_SQL} DESC
+        LIMIT %s
+    ) AS s
+    JOIN post_table AS p ON p.post_id = s.post_id
+    LEFT JOIN user_table AS u ON p.user_id = u.user_id
+    LEFT JOIN file_table AS f ON u.file_id = f.file_id
+    WHERE p.deleted_at IS NULL
+"""
+    )
+    args: list = [expression, expression, expression, SEARCH_MAX_RESULTS]
+    if cursor is not None:
+        score, post_id = cursor
+        sql += "AND (s.score < %s OR (s.score = %s AND s.post_id < %s))\n"
+        args.extend((score, score, post_id))
+    sql += "ORDER BY s.score DESC, s.post_id DESC\nLIMIT %s;"
+    args.append(limit)
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, args)
+            return _prepare_list_rows(cur.fetchall())
+    except Exception as e:
+        print("MySQL error in search_posts:", e)
+        return None
+
 # 특정 게시글 조회
-async def get_post(post_id: int) -> tuple[Any, ...] | None:
-    post_result = None
+# 캐시에 있으면 DB를 거치지 않고, 없으면 조회한 행을 캐시에 저장
+# 반환값은 캐시와 분리된 복사본이므로 호출하는 쪽에서 수정해도 됨
+async def get_post(post_id: int) -> Optional[Dict[str, Any]]:
+    # 조회하는 사이 무효화되면 오래된 행을 다시 캐시하지 않음
+    generation = post_detail_cache.generation()
+    row = post_detail_cache.get(post_id)
+    if row is None:
+        row = await _select_post(post_id)
+        if not row:
+            return row
+        # 카운트 반영 중에 읽은 행은 증가분이 이미 들어 있는지 알 수 없으므로 캐시하지 않음
+        if not (hit_buffer.flushing(post_id) or like_buffer.flushing(post_id)):
+            post_detail_cache.set(post_id, row, generation=generation)
+
+    # 조회수/좋아요 수는 아직 DB에 반영되지 않은 증감분까지 더해서 보여줌
+    post_result = _merge_pending_counts(dict(row))
+
+    record_hit(post_id)
+    return post_result
+
+# 조회수 1 증가
+# 메모리에 모았다가 hit_buffer가 주기적으로 한 번에 반영
+def record_hit(post_id: int):
+    hit_buffer.add(post_id)
+
+# 조회수는 이 단위로 묶어서 ETag에 넣음 (조회마다 304가 깨지지 않게, 대신 그만큼은 늦게 보일 수 있음)
+HITS_ETAG_STEP = max(1, int(os.getenv("HITS_ETAG_STEP", "10")))
+
+# 게시글 상세의 ETag를 만들 값 (조건부 GET용, 게시글이 없으면 None)
+# {"version", "like", "hits"}: version은 write-behind 반영에서 올리지 않으므로 카운트를 따로 포함
+# 캐시에 있으면 캐시된 행(응답할 본문)의 값을 쓰고, 없으면 기본 키로 세 컬럼만 조회
+# 반영 대기 중인 증감분을 더하므로 get_post()가 돌려줄 본문과 같은 값이 됨
+async def get_post_etag_state(post_id: int) -> Optional[Dict[str, Any]]:
+    row = post_detail_cache.get(post_id)
+    if row is None:
+        row = await _select_post_state(post_id)
+        if row is None:
+            return None
+    return _merge_pending_counts({
+        "post_id": post_id, "version": row["version"], "like": row["like"], "hits": row["hits"],
+    })
+
+@db_task
+def _select_post_state(post_id: int) -> Optional[Dict[str, Any]]:
     try:
         with get_connection() as conn, conn.cursor() as cur:
-            post_sql = """
-            SELECT 
-                post_table.post_id,
-                post_table.post_title,
-                post_table.post_content,
-                post_table.file_id,
-                post_table.user_id,
-                post_table.nickname,
-                post_table.created_at,
-                post_table.updated_at,
-                post_table.deleted_at,
-                CASE
-                    WHEN post_table.`like` >= 1000000 THEN CONCAT(ROUND(post_table.`like` / 1000000, 1), 'M')
-                    WHEN post_table.`like` >= 1000 THEN CONCAT(ROUND(post_table.`like` / 1000, 1), 'K')
-                    ELSE CAST(post_table.`like` AS CHAR)
-                END as `like`,
-                CASE
-                    WHEN post_table.comment_count >= 1000000 THEN CONCAT(ROUND(post_table.comment_count / 1000000, 1), 'M')
-                    WHEN post_table.comment_count >= 1000 THEN CONCAT(ROUND(post_table.comment_count / 1000, 1), 'K')
-                    ELSE CAST(post_table.comment_count AS CHAR)
-                END as comment_count,
-                CASE
-                    WHEN post_table.hits >= 1000000 THEN CONCAT(ROUND(post_table.hits / 1000000, 1), 'M')
-                    WHEN post_table.hits >= 1000 THEN CONCAT(ROUND(post_table.hits / 1000, 1), 'K')
-                    ELSE CAST(post_table.hits AS CHAR)
-                END as hits,
-                COALESCE(file_table.file_path, NULL) AS filePath
-            FROM post_table
-            LEFT JOIN file_table ON post_table.file_id = file_table.file_id
-            WHERE post_table.post_id = %s AND post_table.deleted_at IS NULL;
-            """
-            cur.execute(post_sql, (post_id,))
+            cur.execute(
+                "SELECT version, `like`, hits FROM post_table WHERE post_id = %s AND deleted_at IS NULL",
+                (post_id,),
+            )
+            return cur.fetchone()
+    except Exception as e:
+        print("MySQL error in _select_post_state:", e)
+        return None
+
+# 게시글 댓글 목록의 현재 버전 (게시글이 없으면 None)
+async def get_comment_version(post_id: int) -> Optional[int]:
+    return await _select_version("comment_version", post_id)
+
+# column: "version" 또는 "comment_version"
+@db_task
+def _select_version(column: str, post_id: int) -> Optional[int]:
+    if column not in ("version", "comment_version"):
+        raise ValueError(column)
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"SELECT {column} AS version FROM post_table WHERE post_id = %s AND deleted_at IS NULL",
+                (post_id,),
+            )
+            row = cur.fetchone()
+    except Exception as e:
+        print(f"MySQL error in _select_version({column}):", e)
+        return None
+    return row["version"] if row else None
+
+# 게시글 목록의 현재 버전 (모든 shard의 합)
+# 목록을 조회하기 전에 읽어야 함 (조회 도중 바뀌면 다음 요청에서 새 버전으로 다시 받게 됨)
+@db_task
+def get_feed_version() -> Optional[int]:
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT COALESCE(SUM(version), 0) AS version FROM content_version WHERE name = %s",
+                (POST_FEED_VERSION,),
+            )
+            row = cur.fetchone()
+    except Exception as e:
+        print("MySQL error in get_feed_version:", e)
+        return None
+    # SUM은 DECIMAL로 돌아오므로 정수로 변환
+    return int(row["version"]) if row else None
+
+# 게시글 상세 조회 (캐시 미스 시)
+# 게시글, 첨부파일 경로, 작성자 프로필 이미지 경로를 한 번의 쿼리로 조회
+_POST_DETAIL_SQL = """
+    SELECT
+        p.post_id,
+        p.post_title,
+        p.post_content,
+        p.file_id,
+        p.user_id,
+        p.nickname,
+        p.created_at,
+        p.updated_at,
+        p.deleted_at,
+        p.`like`,
+        p.comment_count,
+        p.hits,
+        p.version,
+        COALESCE(af.file_path, NULL) AS filePath,
+        af.variants AS fileVariants,
+        pf.file_path AS profileImage,
+        pf.variants AS profileImageVariants
+    FROM post_table AS p
+    LEFT JOIN file_table AS af ON p.file_id = af.file_id
+    LEFT JOIN user_table AS u ON p.user_id = u.user_id
+    LEFT JOIN file_table AS pf
+        ON pf.file_id = u.file_id AND pf.file_category = 1 AND pf.user_id = p.user_id
+    WHERE p.post_id = %s AND p.deleted_at IS NULL;
+"""
+
+@db_task
+def _select_post(post_id: int) -> Optional[Dict[str, Any]]:
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(_POST_DETAIL_SQL, (post_id,))
             post_result = cur.fetchone()
+    except Exception as e:
+        print("MySQL error in get_post:", e)
+        return None
 
-            if not post_result:
-                return None
+    if not post_result:
+        return None
+    # 프로필 이미지가 없으면 기존 응답처럼 profileImage 키를 두지 않음
+    if post_result["profileImage"] is None:
+        del post_result["profileImage"]
+    # 변형 이미지 경로 (변형 이름 -> 경로), 아직 없으면 빈 딕셔너리
+    post_result["fileVariants"] = parse_variants(post_result["fileVariants"])
+    post_result["profileImageVariants"] = parse_variants(post_result["profileImageVariants"])
+    return post_result
 
-            hits_sql = """
-                UPDATE post_table 
-                SET hits = hits + 1 
-                WHERE post_id = %s AND deleted_at IS NULL;
-            """
-            cur.execute(hits_sql, (post_id,))
+# 카운터 컬럼별 ETag 단위 (목록 버전을 올리는 기준)
+# 좋아요 수는 증감분이 아니라 post_like_table의 행 수로 반영하므로 여기에 없음 (flush_likes)
+_COUNTER_ETAG_STEPS = {"hits": HITS_ETAG_STEP}
+
+# 모아둔 카운터 증가분을 한 번의 UPDATE로 반영
+# column: post_table의 카운터 컬럼 (hits), deltas: {post_id: 증가분}
+# 게시글 상세 ETag에는 카운트가 직접 들어가므로 게시글 버전은 올리지 않음
+# 목록 버전은 어떤 게시글의 카운트가 ETag 단위(HITS_ETAG_STEP)를 넘었을 때만 올림 (반영 주기마다 목록의 304가 깨지지 않게)
+def _flush_counter(column: str, deltas: Dict[int, int]) -> bool:
+    if column not in _COUNTER_ETAG_STEPS:
+        raise ValueError(column)
+    if not deltas:
+        return True
+    post_ids = list(deltas.keys())
+    cases = " ".join(["WHEN %s THEN %s"] * len(post_ids))
+    placeholders = ", ".join(["%s"] * len(post_ids))
+    args: list = []
+    for post_id in post_ids:
+        args.extend((post_id, deltas[post_id]))
+    args.extend(post_ids)
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                UPDATE post_table
+                SET `{column}` = `{column}` + CASE post_id {cases} ELSE 0 END
+                WHERE post_id IN ({placeholders});
+                """,
+                args,
+            )
+            # 같은 트랜잭션에서 방금 갱신한(잠근) 행을 다시 읽어 ETag 단위를 넘었는지 확인
+            cur.execute(
+                f"SELECT post_id, `{column}` AS count FROM post_table WHERE post_id IN ({placeholders})",
+                post_ids,
+            )
+            step = _COUNTER_ETAG_STEPS[column]
+            if any(
+                row["count"] // step != (row["count"] - deltas[row["post_id"]]) // step
+                for row in cur.fetchall()
+            ):
+                bump_feed_version(cur)
             conn.commit()
+        return True
+    except Error as e:
+        print(f"MySQL error in flush_counter({column}):", e)
+        return False
 
-            user_sql = """
-                SELECT file_id 
-                FROM user_table 
-                WHERE user_id = %s;
-            """
-            cur.execute(user_sql, (post_result["user_id"],))
-            user_result = cur.fetchone()
+# 모아둔 조회수 증가분 반영
+@db_task
+def flush_hits(deltas: Dict[int, int]) -> bool:
+    return _flush_counter("hits", deltas)
+
+# post_like_table의 행 수로 게시글의 좋아요 수를 다시 세어 post_table.like에 기록 -> 값이 바뀐 게시글 수
+# 증감분을 더하지 않고 덮어쓰므로 여러 번 실행하거나 다른 워커의 반영, 정합성 작업과 겹쳐도 결과가 같음
+def _recount_likes(cur, post_ids: list) -> int:
+    placeholders = ", ".join(["%s"] * len(post_ids))
+    cur.execute(
+        f"""
+        UPDATE post_table AS p
+        SET p.`like` = (SELECT COUNT(*) FROM post_like_table AS l WHERE l.post_id = p.post_id)
+        WHERE p.post_id IN ({placeholders});
+        """,
+        post_ids,
+    )
+    # 접속 옵션에 CLIENT_FOUND_ROWS를 쓰지 않으므로 실제로 값이 바뀐 행 수
+    return cur.rowcount
+
+# 좋아요 수가 바뀐 게시글 반영 (deltas의 값은 쓰지 않고 post_id만 씀)
+# 다른 워커의 좋아요도 목록에 보이도록 값이 바뀐 게시글이 있으면 목록 버전을 올림
+@db_task
+def flush_likes(deltas: Dict[int, int]) -> bool:
+    if not deltas:
+        return True
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            if _recount_likes(cur, list(deltas.keys())):
+                bump_feed_version(cur)
+            conn.commit()
+        return True
+    except Error as e:
+        print("MySQL error in flush_likes:", e)
+        return False
 
-            if user_result and len(user_result) > 0:
-                profile_image_sql = """
-                SELECT file_path FROM file_table 
-                WHERE file_id = %s AND file_category = 1 AND user_id = %s;
+# 좋아요 수 정합성 작업 주기(초), 0이면 시작할 때 한 번만 실행
+LIKES_RECONCILE_INTERVAL = float(os.getenv("LIKES_RECONCILE_INTERVAL", "3600"))
+
+# post_like_table과 어긋난 post_table.like를 다시 셈 -> 고친 post_id 목록, 실패하면 None
+# 비정상 종료로 반영하지 못한 증감분처럼 flush_likes가 다시 보지 않는 게시글을 고침
+# post_like_table 전체를 게시글별로 세므로 시작할 때와 LIKES_RECONCILE_INTERVAL마다만 실행 (main.py)
+async def reconcile_like_counts() -> Optional[list]:
+    post_ids = await _reconcile_like_counts()
+    for post_id in post_ids or ():
+        invalidate_post(post_id)
+    return post_ids
+
+@db_task
+def _reconcile_like_counts() -> Optional[list]:
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT p.post_id
+                FROM post_table AS p
+                LEFT JOIN (
+                    SELECT post_id, COUNT(*) AS like_count FROM post_like_table GROUP BY post_id
+                ) AS l ON l.post_id = p.post_id
+                WHERE p.`like` <> COALESCE(l.like_count, 0);
                 """
-                cur.execute(profile_image_sql, (user_result["file_id"], post_result["user_id"]))
-                profile_image_result = cur.fetchone()
+            )
+            post_ids = [row["post_id"] for row in cur.fetchall()]
+            if post_ids and _recount_likes(cur, post_ids):
+                bump_feed_version(cur)
+            conn.commit()
+    except Error as e:
+        print("MySQL error in reconcile_like_counts:", e)
+        return None
+    return post_ids
 
-                if profile_image_result:
-                    post_result["profileImage"] = profile_image_result["file_path"]
+# 게시글 조회수 write-behind 버퍼
+# HITS_FLUSH_INTERVAL: 반영 주기(초)
+# HITS_FLUSH_MAX_PENDING: 반영 전에 쌓일 수 있는 조회수 증가분 상한 (비정상 종료 시 잃을 수 있는 최대치)
+# 반영이 끝난 증가분은 pending()에서 빠지므로 캐시된 행의 카운트에 더해 둠 (캐시에서 빼지 않음)
+def _apply_flushed(column: str):
+    def apply(deltas: Dict[int, int]):
+        for post_id, delta in deltas.items():
+            post_detail_cache.update(post_id, lambda row: {**row, column: row[column] + delta})
+    return apply
 
-        return post_result
+hit_buffer = CounterBuffer(
+    "post_hits",
+    flush_hits,
+    interval=float(os.getenv("HITS_FLUSH_INTERVAL", "5")),
+    max_pending=int(os.getenv("HITS_FLUSH_MAX_PENDING", "1000")),
+    on_flushed=_apply_flushed("hits"),
+)
 
-    except Exception as e:
-        print("MySQL error in get_post:", e)
-        user_result = None
-    return user_result
\ No newline at end of file
+# 게시글 좋아요 수 write-behind 버퍼
+# 누가 좋아요를 눌렀는지는 post_like_table에 바로 기록하고(사용자별 행이라 경합 없음),
+# post_table.like는 좋아요가 바뀐 게시글을 모았다가 LIKES_FLUSH_INTERVAL마다 한 번의 UPDATE로 다시 셈
+# 인기 게시글에 좋아요가 몰려도 post_table의 한 행 잠금을 요청마다 잡지 않음
+# 비정상 종료로 반영하지 못한 게시글은 reconcile_like_counts가 고침
+like_buffer = CounterBuffer(
+    "post_likes",
+    flush_likes,
+    interval=float(os.getenv("LIKES_FLUSH_INTERVAL", "1")),
+    max_pending=int(os.getenv("LIKES_FLUSH_MAX_PENDING", "1000")),
+    on_flushed=_apply_flushed("like"),
+)
@@ -4,12 +4,46 @@ from pymysql import MySQLError as Error
 from util.constant.httpStatusCode import STATUS_MESSAGE
 from pymysql.cursors import DictCursor
 from database.index import get_connection
-import bcrypt
-
-SALT_ROUNDS = 10
+from database.executor import db_task
+from util.ttlCache import TTLCache
+from util.passwordHasher import password_hasher
+from model.post_model import invalidate_author_posts, bump_author_versions
+from util.imageVariants import variants_json
+from util.bloomFilter import BloomFilter
+from util.metrics import registry as metrics_registry
+import os
+import unicodedata
+from datetime import timedelta
+
+# 세션 검증 캐시 (user_id -> session_id)
+# 로그인 시 채우고 로그아웃/세션 변경/회원 탈퇴 시 무효화
+# 다른 워커에서 일어난 변경은 TTL이 지나야 반영되므로 TTL은 짧게 유지
+session_cache = TTLCache(
+    max_size=int(os.getenv("SESSION_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.getenv("SESSION_CACHE_TTL", "30")),
+)
 
 # 로그인 처리 함수
+# 비밀번호 검증(bcrypt)은 전용 해싱 스레드풀에서 실행하고, 그동안 DB 커넥션을 잡고 있지 않도록 조회와 세션 갱신을 나눔
+# 해싱 대기열이 가득 차면 PasswordHasherBusyError 발생
 async def login_user(email: str, password: str, session_id: str) -> Optional[Dict]:
+    user_row = await _select_login_user(email)
+
+    # 사용자가 없으면 None 반환
+    if not user_row:
+        return None
+
+    # 비밀번호 검증
+    is_match = await password_hasher.verify(password, user_row.get("password"))
+
+    if not is_match:
+        return None
+
+    return await _complete_login(user_row, session_id)
+
+# 로그인 대상 사용자 조회
+@db_task
+def _select_login_user(email: str) -> Optional[Dict]:
     conn = None
     try:
         # 데이터베이스 연결
@@ -19,22 +53,20 @@ async def login_user(email: str, password: str, session_id: str) -> Optional[Dic
         with conn.cursor() as cur:
             user_sql = "SELECT * FROM user_table WHERE email = %s AND deleted_at IS NULL;"
             cur.execute(user_sql, (email,))
-            user_row = cur.fetchone()
-
-
-            # 사용자가 없으면 None 반환
-            if not user_row:
-                return None
-
-            # 비밀번호 검증
-            is_match = bcrypt.checkpw(
-                password.encode('utf-8'),
-                user_row.get("password").encode('utf-8')
-            )
-
-            if not is_match:
-                return None
+            return cur.fetchone()
+    except pymysql.Error as e:
+        return None
+    finally:
+        if conn:
+            conn.close()
 
+# 비밀번호 검증이 끝난 사용자의 프로필 이미지 조회 및 세션 갱신
+@db_task
+def _complete_login(user_row: Dict, session_id: str) -> Optional[Dict]:
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor() as cur:
             # 3. 프로필 이미지 경로 조회
             # profile_image_path 초기화
             profile_image_path = None
@@ -65,6 +97,7 @@ async def login_user(email: str, password: str, session_id: str) -> Optional[Dic
 
             # 모든 DB 작업이 성공했으므로 변경사항을 확정(commit)
             conn.commit()
+            session_cache.set(user_row.get('user_id'), session_id)
 
             # 사용자 정보 반환
             return user
@@ -76,6 +109,7 @@ async def login_user(email: str, password: str, session_id: str) -> Optional[Dic
             conn.close()
 
 # 회원가입 처리 함수
+# 비밀번호 해싱은 전용 해싱 스레드풀에서 실행 (대기열이 가득 차면 PasswordHasherBusyError 발생)
 async def signup_user(
         email: str,
         password: str,
@@ -83,12 +117,21 @@ async def signup_user(
         # 프로필 이미지 경로 (선택 사항)
         profile_image_path: Optional[str] = None,
     # 반환 타입: 성공 시 딕셔너리, 이메일 중복 시 문자열, 실패 시 None
+) -> Union[str, Dict[str, Optional[int]], None]:
+    # 비밀번호 해싱
+    hashed_password = await password_hasher.hash(password)
+    return await _insert_user(email, hashed_password, nickname, profile_image_path)
+
+# 해싱된 비밀번호로 사용자 등록
+@db_task
+def _insert_user(
+        email: str,
+        hashed_password: str,
+        nickname: str,
+        profile_image_path: Optional[str] = None,
 ) -> Union[str, Dict[str, Optional[int]], None]:
     conn = None
     try:
-        # 비밀번호 해싱
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(SALT_ROUNDS))
-
         # 데이터베이스 연결
         conn = get_connection()
         # with 문을 사용하여 커서 자동 관리
@@ -112,10 +155,10 @@ async def signup_user(
             if profile_image_path:
                 cur.execute(
                     """
-                    INSERT INTO file_table (user_id, file_path, file_category)
-                    VALUES (%s, %s, 1);
+                    INSERT INTO file_table (user_id, file_path, variants, file_category)
+                    VALUES (%s, %s, %s, 1);
                     """,
-                    (user_id, profile_image_path),
+                    (user_id, profile_image_path, variants_json(profile_image_path)),
                 )
                 # cur.lastrowid는 마지막으로 삽입된 행의 ID를 반환
                 file_id = cur.lastrowid
@@ -130,6 +173,7 @@ async def signup_user(
                 )
                 conn.commit()
         conn.commit()
+        _remember_user_names(email, nickname)
         return {"userId": user_id, "profileImageId": profile_image_id}
 
     except Exception as e:
@@ -140,7 +184,8 @@ async def signup_user(
             conn.close()
 
 # 프로필 이미지 경로 조회 함수
-async def get_profile_image_path(file_id: int) -> Optional[str]:
+@db_task
+def get_profile_image_path(file_id: int) -> Optional[str]:
     conn = None
     try:
         conn = get_connection()
@@ -165,7 +210,8 @@ async def get_profile_image_path(file_id: int) -> Optional[str]:
         if conn: conn.close()
 
 # 세션 ID 업데이트 함수
-async def update_session_id(user_id: int, session_id: str) -> bool:
+@db_task
+def update_session_id(user_id: int, session_id: str) -> bool:
     conn = None
     try:
         conn = get_connection()
@@ -175,6 +221,7 @@ async def update_session_id(user_id: int, session_id: str) -> bool:
                 (session_id, user_id),
             )
         conn.commit()
+        session_cache.pop(user_id)
         return True
     except Error as e:
         if conn: conn.rollback()
@@ -184,13 +231,15 @@ async def update_session_id(user_id: int, session_id: str) -> bool:
         if conn: conn.close()
 
 # 세션 파기 함수
-async def destroy_user_session(user_id: int) -> bool:
+@db_task
+def destroy_user_session(user_id: int) -> bool:
     conn = None
     try:
         conn = get_connection()
         with conn.cursor() as cur:
             cur.execute("UPDATE user_table SET session_id = NULL WHERE user_id = %s", (user_id,))
             conn.commit()
+            session_cache.pop(user_id)
             return True
     except Error as e:
         if conn: conn.rollback()
@@ -199,8 +248,175 @@ async def destroy_user_session(user_id: int) -> bool:
     finally:
         if conn: conn.close()
 
+# 세션 ID 조회 함수 (인증 검사용)
+# 캐시에 있으면 DB를 거치지 않고 반환, refresh=True면 항상 DB에서 다시 읽음
+@db_task
+def _select_session_id(user_id: int) -> Optional[str]:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT session_id FROM user_table WHERE user_id = %s", (user_id,))
+        row = cur.fetchone()
+    return row["session_id"] if row else None
+
+async def get_session_id(user_id: int, refresh: bool = False) -> Optional[str]:
+    if not refresh:
+        cached = session_cache.get(user_id)
+        if cached is not None:
+            return cached
+    # 조회하는 사이 로그아웃 등으로 무효화되면 오래된 세션을 다시 캐시하지 않음
+    generation = session_cache.generation()
+    session_id = await _select_session_id(user_id)
+    if session_id:
+        session_cache.set(user_id, session_id, generation=generation)
+    return session_id
+
+# 사용 중인 이메일/닉네임 Bloom filter
+# 회원가입 화면에서 입력할 때마다 호출되는 중복 확인이 대부분 DB까지 가지 않도록,
+# 필터에 "없음"이면 바로 사용 가능으로 응답하고 "있을 수 있음"일 때만 DB에서 확인
+# - 시작 시 user_table 전체를 읽어 만들고(load_user_name_filters), 이 프로세스의 회원가입/닉네임 변경은 즉시 추가
+# - 다른 워커의 변경은 USER_NAME_SYNC_INTERVAL마다 새로 가입한 사용자(user_id)와 최근 수정된 사용자(updated_at)만 읽어 추가
+#   user_id(AUTO_INCREMENT)와 updated_at은 커밋보다 먼저 정해지므로, 이미 읽은 위치보다 앞선 값이 나중에 커밋될 수 있음
+#   그래서 updated_at은 USER_NAME_SYNC_MARGIN만큼 앞에서부터 다시 읽고, user_id 위치는 가입한 지 그만큼 지난 사용자까지만 넘김
+#   (가입/닉네임 변경 트랜잭션이 이보다 오래 걸리지 않는다고 봄, 같은 값을 다시 넣어도 필터는 바뀌지 않음)
+#   (그 사이 다른 워커에서 가입/변경한 값은 잠시 사용 가능으로 보일 수 있음, 가입 시 이메일 중복은 DB에서 다시 확인함)
+# - 탈퇴 회원의 이메일/닉네임도 DB 확인에서 사용 중으로 취급하므로 필터에서 빼지 않음 (Bloom filter는 지울 수 없음)
+# - 필터를 아직 만들지 못했으면(DB 장애 등) 항상 DB에서 확인
+USER_NAME_FILTER_ERROR_RATE = float(os.getenv("USER_NAME_FILTER_ERROR_RATE", "0.01"))
+USER_NAME_SYNC_INTERVAL = float(os.getenv("USER_NAME_SYNC_INTERVAL", "5"))
+USER_NAME_SYNC_MARGIN = timedelta(seconds=float(os.getenv("USER_NAME_SYNC_MARGIN", "60")))
+# 필터 최소 용량 (사용자 수가 용량을 넘으면 다음 동기화에서 두 배 용량으로 다시 만듦)
+_MIN_FILTER_CAPACITY = 100_000
+_LOAD_BATCH_SIZE = 10_000
+
+metrics_registry.describe_counter("user_name_checks_total", "Email/nickname availability checks.")
+metrics_registry.describe_counter(
+    "user_name_checks_filtered_total", "Availability checks answered by the Bloom filter without a DB query."
+)
+
+_email_filter: Optional[BloomFilter] = None
+_nickname_filter: Optional[BloomFilter] = None
+# 동기화 위치: 다음에 이어 읽을 user_id (이 값 이하는 모두 커밋되어 읽었음), 다음에 updated_at을 읽기 시작할 시각(DB 시간)
+_filter_sync: Dict[str, Any] = {"last_user_id": 0, "synced_at": None}
+
+# 필터 키: MySQL 비교 규칙(_ci collation)에서 같은 값으로 보는 문자열이 같은 키가 되도록 정규화
+# (대소문자/악센트/호환 문자/끝 공백 무시, 실제보다 더 많이 같게 보는 것은 DB 확인으로 걸러지므로 괜찮음)
+def _name_key(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value.rstrip(" ").casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+def _new_filter(count: int) -> BloomFilter:
+    return BloomFilter(max(_MIN_FILTER_CAPACITY, count * 2), USER_NAME_FILTER_ERROR_RATE)
+
+# 이 프로세스에서 생긴 이메일/닉네임을 필터에 바로 반영
+def _remember_user_names(email: Optional[str] = None, nickname: Optional[str] = None):
+    if email and _email_filter is not None:
+        _email_filter.add(_name_key(email))
+    if nickname and _nickname_filter is not None:
+        _nickname_filter.add(_name_key(nickname))
+
+# 가입한 지 USER_NAME_SYNC_MARGIN이 지난(이보다 작은 user_id가 모두 커밋된) 사용자 중 가장 큰 user_id
+def _settled_user_id(rows: list, started_at, current: int) -> int:
+    cutoff = started_at - USER_NAME_SYNC_MARGIN
+    settled = [user["user_id"] for user in rows if user["created_at"] is None or user["created_at"] <= cutoff]
+    return max([current, *settled])
+
+# 시작 시 user_table 전체로 필터 생성 (user_id 순으로 나눠 읽음), 실패하면 False
+@db_task
+def load_user_name_filters() -> bool:
+    global _email_filter, _nickname_filter
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT NOW() AS now, COUNT(*) AS n FROM user_table")
+            row = cur.fetchone()
+            started_at, count = row["now"], row["n"]
+            email_filter, nickname_filter = _new_filter(count), _new_filter(count)
+            last_user_id = 0
+            settled_user_id = 0
+            while True:
+                cur.execute(
+                    """
+                    SELECT user_id, email, nickname, created_at FROM user_table
+                    WHERE user_id > %s ORDER BY user_id LIMIT %s
+                    """,
+                    (last_user_id, _LOAD_BATCH_SIZE),
+                )
+                rows = cur.fetchall()
+                if not rows:
+                    break
+                for user in rows:
+                    if user["email"]:
+                        email_filter.add(_name_key(user["email"]))
+                    if user["nickname"]:
+                        nickname_filter.add(_name_key(user["nickname"]))
+                last_user_id = rows[-1]["user_id"]
+                settled_user_id = _settled_user_id(rows, started_at, settled_user_id)
+    except Error as e:
+        print("MySQL error in load_user_name_filters:", e)
+        return False
+    _email_filter, _nickname_filter = email_filter, nickname_filter
+    _filter_sync["last_user_id"] = settled_user_id
+    _filter_sync["synced_at"] = started_at - USER_NAME_SYNC_MARGIN
+    return True
+
+# 다른 워커에서 가입/닉네임 변경한 사용자를 필터에 추가 (주기적으로 호출)
+# 필터에 넣은 서로 다른 값이 용량을 넘었으면 더 큰 필터로 다시 만듦
+# (동기화마다 최근 수정된 사용자를 다시 넣지만 이미 있는 값은 개수에 세지 않으므로 수정이 많아도 일찍 다시 만들지 않음)
+async def sync_user_name_filters() -> bool:
+    filters = (_email_filter, _nickname_filter)
+    if any(f is None or len(f) > f.capacity for f in filters):
+        return await load_user_name_filters()
+    return await _sync_user_name_filters()
+
+@db_task
+def _sync_user_name_filters() -> bool:
+    try:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT NOW() AS now")
+            started_at = cur.fetchone()["now"]
+            cur.execute(
+                """
+                SELECT user_id, email, nickname, created_at FROM user_table
+                WHERE user_id > %s OR updated_at >= %s
+                """,
+                (_filter_sync["last_user_id"], _filter_sync["synced_at"]),
+            )
+            rows = cur.fetchall()
+    except Error as e:
+        print("MySQL error in sync_user_name_filters:", e)
+        return False
+    for user in rows:
+        _remember_user_names(user["email"], user["nickname"])
+    # user_id 위치는 가입한 지 USER_NAME_SYNC_MARGIN이 지난 사용자까지만 넘김 (그보다 최근 user_id는 다음에 다시 읽음)
+    _filter_sync["last_user_id"] = _settled_user_id(rows, started_at, _filter_sync["last_user_id"])
+    # 늦게 커밋된 변경을 놓치지 않도록 이번 시작 시각보다 USER_NAME_SYNC_MARGIN만큼 앞에서부터 다시 읽음
+    _filter_sync["synced_at"] = started_at - USER_NAME_SYNC_MARGIN
+    return True
+
+def user_name_filter_stats() -> Dict[str, Any]:
+    return {
+        "email": _email_filter.stats() if _email_filter is not None else None,
+        "nickname": _nickname_filter.stats() if _nickname_filter is not None else None,
+    }
+
 # 이메일 중복 확인 함수
+# 필터에 없으면 DB를 거치지 않고 False
 async def check_email(email: str) -> bool:
+    metrics_registry.inc("user_name_checks_total")
+    if _email_filter is not None and _name_key(email) not in _email_filter:
+        metrics_registry.inc("user_name_checks_filtered_total")
+        return False
+    return await _select_email_exists(email)
+
+# 닉네임 중복 확인 함수
+# 필터에 없으면 DB를 거치지 않고 False
+async def check_nickname(nickname: str) -> bool:
+    metrics_registry.inc("user_name_checks_total")
+    if _nickname_filter is not None and _name_key(nickname) not in _nickname_filter:
+        metrics_registry.inc("user_name_checks_filtered_total")
+        return False
+    return await _select_nickname_exists(nickname)
+
+@db_task
+def _select_email_exists(email: str) -> bool:
     conn = None
     try:
         conn = get_connection()
@@ -218,8 +434,8 @@ async def check_email(email: str) -> bool:
     finally:
         if conn: conn.close()
 
-# 닉네임 중복 확인 함수
-async def check_nickname(nickname: str) -> bool:
+@db_task
+def _select_nickname_exists(nickname: str) -> bool:
     conn = None
     try:
         conn = get_connection()
@@ -238,7 +454,8 @@ async def check_nickname(nickname: str) -> bool:
         if conn: conn.close()
 
 # 사용자 정보 조회 함수
-async def get_user(user_id: int) -> tuple[dict[str, Any], ...] | None:
+@db_task
+def get_user(user_id: int) -> tuple[dict[str, Any], ...] | None:
     conn = get_connection()
     try:
         with conn.cursor(DictCursor) as cur:
@@ -261,7 +478,8 @@ async def get_user(user_id: int) -> tuple[dict[str, Any], ...] | None:
         if conn: conn.close()
 
 # 사용자 정보 업데이트 함수
-async def update_user(payload: dict) -> Union[str, bool]:
+@db_task
+def update_user(payload: dict) -> Union[str, bool]:
     user_id = payload.get("userId")
     nickname = payload.get("nickname")
     profile_image_path = payload.get("profileImagePath")
@@ -274,18 +492,29 @@ async def update_user(payload: dict) -> Union[str, bool]:
         conn = get_connection()
         with conn.cursor() as cur:
             cur.execute(
-                "UPDATE user_table SET nickname = %s "
+                "UPDATE user_table SET nickname = %s, updated_at = NOW() "
                 "WHERE user_id = %s AND deleted_at IS NULL",
                 (nickname, user_id),
             )
 
+            # 업로드 파일은 내용 해시 경로에 저장되므로 같은 경로면 같은 이미지
+            # 이미 등록된 프로필 이미지면 file_table 행을 새로 만들지 않고 재사용
             cur.execute(
-                "INSERT INTO file_table (user_id, file_path, file_category) "
-                "VALUES (%s, %s, %s)",
-                (user_id, profile_image_path, 1),
+                "SELECT file_id FROM file_table "
+                "WHERE file_path = %s AND user_id = %s AND file_category = 1 AND deleted_at IS NULL "
+                "LIMIT 1",
+                (profile_image_path, user_id),
             )
-
-            file_id = getattr(cur, "lastrowid", None)
+            existing = cur.fetchone()
+            if existing:
+                file_id = existing["file_id"]
+            else:
+                cur.execute(
+                    "INSERT INTO file_table (user_id, file_path, variants, file_category) "
+                    "VALUES (%s, %s, %s, %s)",
+                    (user_id, profile_image_path, variants_json(profile_image_path), 1),
+                )
+                file_id = getattr(cur, "lastrowid", None)
             if not file_id:
                 conn.rollback()
                 return STATUS_MESSAGE["UPDATE_PROFILE_IMAGE_FAILED"]
@@ -299,7 +528,13 @@ async def update_user(payload: dict) -> Union[str, bool]:
                 conn.rollback()
                 return STATUS_MESSAGE["UPDATE_PROFILE_IMAGE_FAILED"]
 
+            # 게시글/댓글 목록에 보이는 작성자 프로필 이미지가 바뀌므로 관련 응답의 버전을 올림
+            bump_author_versions(cur, user_id)
             conn.commit()
+            # 바뀐 닉네임을 사용 중으로 등록 (이전 닉네임은 필터에서 뺄 수 없으므로 DB 확인으로 처리)
+            _remember_user_names(nickname=nickname)
+            # 작성자 프로필 이미지가 바뀌었으므로 게시글 상세 캐시 무효화
+            invalidate_author_posts(user_id)
             return True
 
     except Exception as e:
@@ -310,12 +545,17 @@ async def update_user(payload: dict) -> Union[str, bool]:
         if conn: conn.close()
 
 # 비밀번호 변경 함수
+# 비밀번호 해싱은 전용 해싱 스레드풀에서 실행 (대기열이 가득 차면 PasswordHasherBusyError 발생)
 async def change_password(payload: dict) -> bool:
     user_id = payload.get("userId")
     password = payload.get("password")
 
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(SALT_ROUNDS))
+    hashed_password = await password_hasher.hash(password)
+    return await _update_password(user_id, hashed_password)
 
+# 해싱된 비밀번호로 변경
+@db_task
+def _update_password(user_id: int, hashed_password: str) -> bool:
     conn = None
     try:
         conn = get_connection()
@@ -331,13 +571,16 @@ async def change_password(payload: dict) -> bool:
         if conn: conn.close()
 
 # 사용자 삭제 함수
-async def delete_user(user_id: int) -> bool:
+@db_task
+def delete_user(user_id: int) -> bool:
     conn = None
     try:
         conn = get_connection()
         with conn.cursor() as cur:
             cur.execute("UPDATE user_table SET deleted_at = NOW() WHERE user_id = %s", (user_id,))
             conn.commit()
+            session_cache.pop(user_id)
+            # 탈퇴 회원의 이메일/닉네임도 중복 확인에서 계속 사용 중으로 취급하므로 이메일/닉네임 필터는 그대로 둠
             return True
     except Error as e:
         if conn: conn.rollback()
@@ -347,7 +590,8 @@ async def delete_user(user_id: int) -> bool:
         if conn: conn.close()
 
 # 닉네임 조회 함수
-async def get_nickname(user_id: int) -> Optional[str]:
+@db_task
+def get_nickname(user_id: int) -> Optional[str]:
     conn = None
     try:
         conn = get_connection()
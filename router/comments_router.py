@@ -1,7 +1,7 @@
-from typing import Annotated
-from fastapi import APIRouter, Body, Header, Depends, Path
+from typing import Annotated, Optional
+from fastapi import APIRouter, Body, Header, Depends, Path, Query
 from util.authUtil import is_logged_in
-from controller.comments import CommentsController
+from controller.comments import CommentsController, DEFAULT_COMMENT_PAGE_SIZE
 
 # 댓글 관련 라우터 설정
 # Prefix: /posts
@@ -23,9 +23,16 @@ async def write_comment(
     return await _ctl().write_comment(commentContent, userId, pageId)
 
 # 댓글 조회 엔드포인트
+# 작성 순으로 limit개씩 반환, 응답의 nextCursor를 cursor로 넘기면 다음 페이지
+# 응답의 ETag를 If-None-Match로 보내면 댓글이 바뀌지 않았을 때 304
 @router.get("", dependencies=[Depends(is_logged_in)])
-async def get_comments(post_id: int = Path(..., alias="post_id")):
-    return await _ctl().get_comments(post_id)
+async def get_comments(
+    post_id: int = Path(..., alias="post_id"),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_COMMENT_PAGE_SIZE),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+):
+    return await _ctl().get_comments(post_id, cursor=cursor, limit=limit, if_none_match=if_none_match)
 
 # 댓글 수정 엔드포인트
 @router.patch("/{commentId}", dependencies=[Depends(is_logged_in)])
@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from util.metrics import registry
+
+# 메트릭 라우터 설정
+# Prometheus가 수집할 수 있는 텍스트 형식으로 노출
+router = APIRouter()
+
+# 메트릭 조회 엔드포인트
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -23,16 +23,46 @@ async def write_post(
 
 # 게시글 목록 조회 엔드포인트
 # dependencies를 사용하여 is_logged_in 함수로 인증 검사
+# cursor를 넘기면 커서 방식(첫 페이지는 빈 값), 없으면 기존 offset 방식 (offset은 offset 방식에서만 필요)
+# rawCounts=true면 좋아요/댓글/조회수를 축약 문자열 대신 정수로 반환
+# 응답의 ETag를 If-None-Match로 보내면 목록이 바뀌지 않았을 때 304
 @router.get("", dependencies=[Depends(is_logged_in)])
-async def get_post_list(limit: str = Query(10), offset: str = Query(0)):
+async def get_post_list(
+    limit: str = Query("10"),
+    offset: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    raw_counts: bool = Query(False, alias="rawCounts"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+):
+    return await _ctl().get_post_list(
+        offset=offset, limit=limit, cursor=cursor, raw_counts=raw_counts, if_none_match=if_none_match
+    )
 
-    return await _ctl().get_post_list(offset=offset, limit=limit)
+# 게시글 검색 엔드포인트
+# 제목/본문 전문 검색 결과를 관련도 순으로 limit개씩 반환, 응답의 nextCursor를 cursor로 넘기면 다음 페이지
+# /{post_id}보다 먼저 선언해야 "search"가 post_id로 해석되지 않음
+@router.get("/search", dependencies=[Depends(is_logged_in)])
+async def search_posts(
+    q: str = Query(..., description="검색어 (공백으로 구분한 단어가 모두 들어 있는 글)"),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(10),
+    raw_counts: bool = Query(False, alias="rawCounts"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+):
+    return await _ctl().search_posts(
+        q, cursor=cursor, limit=limit, raw_counts=raw_counts, if_none_match=if_none_match
+    )
 
 # 단일 게시글 조회 엔드포인트
 # dependencies를 사용하여 is_logged_in 함수로 인증 검사
+# 응답의 ETag를 If-None-Match로 보내면 게시글이 바뀌지 않았을 때 304
 @router.get("/{post_id}", dependencies=[Depends(is_logged_in)])
-async def get_post(post_id: int = Path(..., gt=0, description="게시글 ID")):
-    return await _ctl().get_post(post_id)
+async def get_post(
+    post_id: int = Path(..., gt=0, description="게시글 ID"),
+    raw_counts: bool = Query(False, alias="rawCounts"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+):
+    return await _ctl().get_post(post_id, raw_counts=raw_counts, if_none_match=if_none_match)
 
 # 게시글 수정 엔드포인트
 # dependencies를 사용하여 is_logged_in 함수로 인증 검사
@@ -46,6 +76,23 @@ async def update_post(
 ):
     return await _ctl().update_post(post_id, user_id, post_title, post_content, attach_file_path)
 
+# 게시글 좋아요 엔드포인트
+# 사용자당 한 번만 반영 (이미 좋아요한 게시글이면 그대로 200)
+@router.post("/{post_id}/like", dependencies=[Depends(is_logged_in)])
+async def like_post(
+    post_id: int = Path(..., gt=0, description="좋아요할 게시글 ID"),
+    user_id: int = Header(..., alias="userId"),
+):
+    return await _ctl().like_post(post_id, user_id)
+
+# 게시글 좋아요 취소 엔드포인트
+@router.delete("/{post_id}/like", dependencies=[Depends(is_logged_in)])
+async def unlike_post(
+    post_id: int = Path(..., gt=0, description="좋아요를 취소할 게시글 ID"),
+    user_id: int = Header(..., alias="userId"),
+):
+    return await _ctl().unlike_post(post_id, user_id)
+
 # 게시글 삭제 엔드포인트
 # dependencies를 사용하여 is_logged_in 함수로 인증 검사
 @router.delete("/{post_id}", dependencies=[Depends(is_logged_in)])
@@ -0,0 +1,99 @@
+import asyncio
+
+from model import user_model
+from util.bloomFilter import BloomFilter
+
+
+def test_no_false_negatives_and_error_rate_near_target():
+    bloom = BloomFilter(10_000, 0.01)
+    items = [f"user{i}@example.com" for i in range(10_000)]
+    bloom.update(items)
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other{i}@example.com" in bloom for i in range(20_000))
+    assert false_positives / 20_000 < 0.02
+
+
+def test_len_counts_distinct_values_only():
+    bloom = BloomFilter(1000)
+    assert bloom.add("a") is True
+    assert bloom.add("a") is False
+    bloom.update(["b", "a", "b"])
+    assert len(bloom) == 2
+
+
+def test_sync_does_not_rebuild_when_rows_are_re_added(monkeypatch):
+    email_filter, nickname_filter = BloomFilter(100), BloomFilter(100)
+    monkeypatch.setattr(user_model, "_email_filter", email_filter)
+    monkeypatch.setattr(user_model, "_nickname_filter", nickname_filter)
+    calls = []
+
+    async def load():
+        calls.append("load")
+        return True
+
+    async def sync():
+        # 매 동기화마다 최근 수정된 같은 사용자들을 다시 넣음
+        for i in range(50):
+            user_model._remember_user_names(f"user{i}@example.com", f"nick{i}")
+        calls.append("sync")
+        return True
+
+    monkeypatch.setattr(user_model, "load_user_name_filters", load)
+    monkeypatch.setattr(user_model, "_sync_user_name_filters", sync)
+    for _ in range(10):
+        asyncio.run(user_model.sync_user_name_filters())
+    assert calls == ["sync"] * 10
+    assert len(email_filter) == 50
+
+    for i in range(60):
+        nickname_filter.add(f"renamed{i}")
+    asyncio.run(user_model.sync_user_name_filters())
+    assert calls[-1] == "load"
+
+
+def test_sync_rereads_rows_that_commit_after_the_last_sync(monkeypatch):
+    from datetime import datetime, timedelta
+
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    monkeypatch.setattr(user_model, "_email_filter", BloomFilter(100))
+    monkeypatch.setattr(user_model, "_nickname_filter", BloomFilter(100))
+    monkeypatch.setattr(user_model, "_filter_sync", {"last_user_id": 0, "synced_at": now - timedelta(hours=1)})
+    # 커밋된 사용자: user_id 1(오래전 가입), 3(방금 가입), 2는 아직 커밋되지 않음
+    users = {
+        1: {"user_id": 1, "email": "a@example.com", "nickname": "a", "created_at": now - timedelta(hours=1)},
+        3: {"user_id": 3, "email": "c@example.com", "nickname": "c", "created_at": now - timedelta(seconds=1)},
+    }
+    queries = []
+
+    class _Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+        def cursor(self):
+            return self
+
+        def execute(self, sql, args=()):
+            self.args = args
+            if "user_id > %s" in sql:
+                queries.append(args)
+
+        def fetchone(self):
+            return {"now": now}
+
+        def fetchall(self):
+            last_user_id, _ = self.args
+            return [user for user_id, user in sorted(users.items()) if user_id > last_user_id]
+
+    monkeypatch.setattr(user_model, "get_connection", _Cursor)
+    assert user_model._sync_user_name_filters.__wrapped__()
+    # 방금 가입한 3은 읽었지만, 그보다 앞선 2가 늦게 커밋될 수 있으므로 user_id 위치는 1에 머무름
+    assert user_model._filter_sync["last_user_id"] == 1
+    assert user_model._filter_sync["synced_at"] == now - user_model.USER_NAME_SYNC_MARGIN
+
+    users[2] = {"user_id": 2, "email": "b@example.com", "nickname": "b", "created_at": now - timedelta(seconds=2)}
+    assert user_model._sync_user_name_filters.__wrapped__()
+    assert queries[-1][0] == 1
+    assert "b@example.com" in user_model._email_filter
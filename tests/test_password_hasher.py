@@ -0,0 +1,39 @@
+import asyncio
+
+from util.passwordHasher import PasswordHasher, PasswordHasherBusyError
+
+
+def test_rejected_jobs_are_not_counted_as_hashes():
+    hasher = PasswordHasher(workers=1, max_pending=1, rounds=4)
+
+    async def run():
+        return await asyncio.gather(
+            hasher.hash("a"), hasher.hash("b"), hasher.verify("c", "x"), return_exceptions=True
+        )
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        hasher.shutdown()
+    assert isinstance(results[0], str)
+    assert all(isinstance(r, PasswordHasherBusyError) for r in results[1:])
+    stats = hasher.stats()
+    assert stats["hash_count"] == 1
+    assert stats["verify_count"] == 0
+    assert stats["rejected_count"] == 2
+    assert stats["pending"] == 0
+
+
+def test_hash_and_verify_round_trip():
+    hasher = PasswordHasher(workers=1, max_pending=4, rounds=4)
+
+    async def run():
+        hashed = await hasher.hash("secret")
+        return await hasher.verify("secret", hashed), await hasher.verify("wrong", hashed)
+
+    try:
+        assert asyncio.run(run()) == (True, False)
+    finally:
+        hasher.shutdown()
+    assert hasher.stats()["hash_count"] == 1
+    assert hasher.stats()["verify_count"] == 2
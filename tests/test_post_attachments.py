@@ -0,0 +1,124 @@
+import re
+
+import pytest
+
+from model import post_model
+
+
+# create_post/update_post가 쓰는 SQL만 흉내 내는 메모리 DB
+class _FakeDB:
+    def __init__(self):
+        self.posts = {}
+        self.files = []
+
+    def connection(self):
+        return _FakeConnection(self)
+
+
+class _FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, *args):
+        return _FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rowcount = 0
+        self.lastrowid = None
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def execute(self, sql, args=()):
+        sql = re.sub(r"\s+", " ", sql).strip()
+        db = self.db
+        self._rows = []
+        if sql.startswith("SELECT nickname FROM user_table"):
+            self._rows = [{"nickname": f"user{args[0]}"}]
+        elif sql.startswith("INSERT INTO post_table"):
+            self.lastrowid = len(db.posts) + 1
+            db.posts[self.lastrowid] = {"user_id": args[0], "file_id": None}
+            self.rowcount = 1
+        elif sql.startswith("INSERT INTO file_table"):
+            self.lastrowid = len(db.files) + 1
+            db.files.append({"file_id": self.lastrowid, "user_id": args[0], "post_id": args[1], "file_path": args[2]})
+            self.rowcount = 1
+        elif sql.startswith("UPDATE post_table SET post_title"):
+            self.rowcount = int(args[2] in db.posts)
+        elif sql.startswith("SELECT ROW_COUNT()"):
+            self._rows = [{"changed": self.rowcount}]
+        elif sql.startswith("SELECT file_id FROM file_table WHERE file_path = %s AND post_id = %s"):
+            self._rows = [
+                {"file_id": f["file_id"]} for f in db.files if f["file_path"] == args[0] and f["post_id"] == args[1]
+            ]
+        elif sql.startswith("SELECT file_id FROM file_table WHERE file_path = %s"):
+            self._rows = [{"file_id": f["file_id"]} for f in db.files if f["file_path"] == args[0]]
+        elif re.match(r"UPDATE post_table SET file_id = (%s|NULL) WHERE post_id = %s", sql):
+            file_id, post_id = (args[0], args[1]) if len(args) == 2 else (None, args[0])
+            db.posts[post_id]["file_id"] = file_id
+        elif "version = version + 1" in sql:
+            pass
+        else:
+            raise AssertionError(f"unexpected SQL: {sql}")
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = _FakeDB()
+    monkeypatch.setattr(post_model, "get_connection", fake.connection)
+    return fake
+
+
+def test_update_post_attaches_path_already_used_by_another_post(db):
+    # 같은 내용의 이미지를 올리면 업로드 중복 제거로 같은 경로가 돌아옴
+    shared_path = "/public/image/posts/ab/cd/abcd.png"
+    post_model.create_post.__wrapped__(1, "first", "body", shared_path)
+    post_model.create_post.__wrapped__(2, "second", "body")
+
+    meta = post_model.update_post.__wrapped__(2, 2, "second", "body", shared_path)
+
+    assert meta["affectedRows"] == 1
+    second_file_id = db.posts[2]["file_id"]
+    assert second_file_id is not None
+    assert second_file_id != db.posts[1]["file_id"]
+    second_file = next(f for f in db.files if f["file_id"] == second_file_id)
+    assert second_file == {"file_id": second_file_id, "user_id": 2, "post_id": 2, "file_path": shared_path}
+
+
+def test_update_post_reuses_its_own_attachment_row(db):
+    path = "/public/image/posts/ab/cd/abcd.png"
+    post_model.create_post.__wrapped__(1, "first", "body", path)
+    file_id = db.posts[1]["file_id"]
+
+    post_model.update_post.__wrapped__(1, 1, "first", "edited", path)
+
+    assert db.posts[1]["file_id"] == file_id
+    assert len(db.files) == 1
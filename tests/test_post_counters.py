@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+
+from model import post_model
+from util.counterBuffer import CounterBuffer
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    post_model.post_detail_cache.clear()
+    yield
+    post_model.post_detail_cache.clear()
+
+
+def _row(post_id, hits=0, like=0, version=1):
+    return {
+        "post_id": post_id, "hits": hits, "like": like, "version": version,
+        "fileVariants": None, "profileImageVariants": None,
+    }
+
+
+def test_flush_adds_deltas_to_cached_row_instead_of_evicting():
+    post_model.post_detail_cache.set(1, _row(1, hits=10, like=2))
+    flushed = []
+
+    async def flush(deltas):
+        flushed.append(deltas)
+        return True
+
+    buffer = CounterBuffer("test_hits", flush, on_flushed=post_model._apply_flushed("hits"))
+    buffer.add(1, 3)
+    buffer.add(2, 1)
+    assert asyncio.run(buffer.flush()) == 2
+
+    assert flushed == [{1: 3, 2: 1}]
+    cached = post_model.post_detail_cache.get(1)
+    assert cached["hits"] == 13
+    assert cached["like"] == 2
+    assert cached["version"] == 1
+    assert buffer.pending(1) == 0
+    assert post_model.post_detail_cache.get(2) is None
+
+
+def test_failed_flush_leaves_cached_row_untouched():
+    post_model.post_detail_cache.set(1, _row(1, hits=10))
+
+    async def flush(deltas):
+        return False
+
+    buffer = CounterBuffer("test_hits", flush, on_flushed=post_model._apply_flushed("hits"))
+    buffer.add(1, 3)
+    asyncio.run(buffer.flush())
+
+    assert post_model.post_detail_cache.get(1)["hits"] == 10
+    assert buffer.pending(1) == 3
+
+
+def _flush_with_counts(monkeypatch, column, deltas, counts):
+    executed = []
+
+    class _Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+        def execute(self, sql, args=()):
+            executed.append(sql)
+
+        def fetchall(self):
+            return [{"post_id": post_id, "count": count} for post_id, count in counts.items()]
+
+    class _Connection(_Cursor):
+        def cursor(self):
+            return _Cursor()
+
+        def commit(self):
+            pass
+
+    monkeypatch.setattr(post_model, "get_connection", _Connection)
+    assert post_model._flush_counter(column, deltas)
+    return executed
+
+
+def test_flush_does_not_bump_post_versions(monkeypatch):
+    executed = _flush_with_counts(monkeypatch, "hits", {1: 2, 5: 1}, {1: 12, 5: 31})
+    assert not any("post_table SET version" in sql for sql in executed)
+    assert not any("content_version" in sql for sql in executed)
+
+
+def test_flush_bumps_feed_when_hits_cross_an_etag_step(monkeypatch):
+    step = post_model.HITS_ETAG_STEP
+    executed = _flush_with_counts(monkeypatch, "hits", {1: 2}, {1: step + 1})
+    assert any("content_version" in sql for sql in executed)
+
+
+class _LikeCursor:
+    def __init__(self, changed, drifted=()):
+        self.executed = []
+        self.changed = changed
+        self.drifted = drifted
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def cursor(self):
+        return self
+
+    def commit(self):
+        pass
+
+    def execute(self, sql, args=()):
+        self.executed.append(sql)
+        self.rowcount = self.changed if "UPDATE post_table" in sql else 0
+
+    def fetchall(self):
+        return [{"post_id": post_id} for post_id in self.drifted]
+
+
+def test_like_flush_recounts_and_bumps_feed_only_on_change(monkeypatch):
+    conn = _LikeCursor(changed=1)
+    monkeypatch.setattr(post_model, "get_connection", lambda: conn)
+    assert post_model.flush_likes.__wrapped__({1: 1, 2: -1})
+    assert "SELECT COUNT(*) FROM post_like_table" in conn.executed[0]
+    assert any("content_version" in sql for sql in conn.executed)
+
+    # 다른 워커가 이미 같은 값으로 다시 셌으면 목록은 그대로
+    conn = _LikeCursor(changed=0)
+    assert post_model.flush_likes.__wrapped__({1: 1})
+    assert not any("content_version" in sql for sql in conn.executed)
+
+
+def test_reconcile_recounts_drifted_posts_and_evicts_them(monkeypatch):
+    post_model.post_detail_cache.set(3, _row(3, like=5))
+    post_model.post_detail_cache.set(4, _row(4, like=1))
+    conn = _LikeCursor(changed=1, drifted=[3])
+    monkeypatch.setattr(post_model, "get_connection", lambda: conn)
+    monkeypatch.setattr(post_model, "_reconcile_like_counts", _run_sync(post_model._reconcile_like_counts.__wrapped__))
+
+    assert asyncio.run(post_model.reconcile_like_counts()) == [3]
+    assert post_model.post_detail_cache.get(3) is None
+    assert post_model.post_detail_cache.get(4) is not None
+    assert any("content_version" in sql for sql in conn.executed)
+
+
+def _run_sync(func):
+    async def run(*args):
+        return func(*args)
+    return run
+
+
+def test_etag_state_includes_pending_counts(monkeypatch):
+    post_model.post_detail_cache.set(1, _row(1, hits=10, like=2, version=3))
+    monkeypatch.setattr(post_model.hit_buffer, "pending", lambda post_id: 4)
+    monkeypatch.setattr(post_model.like_buffer, "pending", lambda post_id: 1)
+    state = asyncio.run(post_model.get_post_etag_state(1))
+    assert (state["version"], state["like"], state["hits"]) == (3, 3, 14)
+
+
+def test_get_post_does_not_cache_rows_read_during_a_flush(monkeypatch):
+    async def select_post(post_id):
+        return _row(post_id, hits=7)
+
+    monkeypatch.setattr(post_model, "_select_post", select_post)
+    monkeypatch.setattr(post_model, "record_hit", lambda post_id: None)
+    monkeypatch.setattr(post_model.hit_buffer, "flushing", lambda post_id: post_id == 1)
+
+    assert asyncio.run(post_model.get_post(1))["hits"] == 7
+    assert post_model.post_detail_cache.get(1) is None
+    asyncio.run(post_model.get_post(2))
+    assert post_model.post_detail_cache.get(2) is not None
+
+
+def test_feed_version_bumps_spread_over_shards():
+    executed = []
+
+    class _Cursor:
+        def execute(self, sql, args=()):
+            executed.append(args)
+
+    for _ in range(200):
+        post_model.bump_feed_version(_Cursor())
+    shards = {args[1] for args in executed}
+    assert all(args[0] == post_model.POST_FEED_VERSION for args in executed)
+    assert shards <= set(range(post_model.FEED_VERSION_SHARDS))
+    assert len(shards) > 1
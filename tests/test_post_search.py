@@ -0,0 +1,19 @@
+from decimal import Decimal
+
+from controller.posts import _search_cursor
+from util.cursorUtil import decode_cursor, encode_cursor
+
+
+def test_search_cursor_round_trips_score_exactly():
+    score = Decimal("0.906890")
+    after = decode_cursor(encode_cursor(str(score), 42), 2)
+    assert _search_cursor(after) == (score, 42)
+
+
+def test_search_cursor_rejects_malformed_values():
+    assert _search_cursor((0.9, 42)) is None
+    assert _search_cursor(("0.9", True)) is None
+    assert _search_cursor(("0.9", "42")) is None
+    assert _search_cursor(("abc", 42)) is None
+    assert _search_cursor(("NaN", 42)) is None
+    assert _search_cursor(("Infinity", 42)) is None
@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from main import RateLimitMiddleware
+from util.rateLimit import InMemoryRateLimitBackend, RateLimitResult, RateLimiter, RateLimitRule, RedisRateLimitBackend
+
+
+def _hits(backend, key, limit, window, times):
+    async def run():
+        return [await backend.hit(key, limit, window, now) for now in times]
+    return asyncio.run(run())
+
+
+def _allowed(results):
+    return [result.allowed for result in results]
+
+
+def test_blocks_after_limit_within_window():
+    results = _hits(InMemoryRateLimitBackend(), "k", 3, 10, [100, 101, 102, 103])
+    assert _allowed(results) == [True, True, True, False]
+    # 현재 윈도우에서 한도를 채웠으므로 다음 윈도우(110)까지 7초 + 이전 몫이 줄어들 때까지 0초
+    assert results[-1].retry_after == pytest.approx(7)
+
+
+def test_window_rollover_weights_previous_window():
+    backend = InMemoryRateLimitBackend()
+    # 100~109 윈도우에서 4회 사용
+    assert _allowed(_hits(backend, "k", 4, 10, [100, 101, 102, 103])) == [True] * 4
+    # 다음 윈도우 시작: 이전 4회가 그대로 반영되어 거절
+    blocked = _hits(backend, "k", 4, 10, [110])[0]
+    assert not blocked.allowed
+    assert blocked.retry_after == pytest.approx(0)
+    # 윈도우의 절반이 지나면 이전 몫은 2 -> 2회 더 허용
+    assert _allowed(_hits(backend, "k", 4, 10, [115, 115, 115])) == [True, True, False]
+    # 두 윈도우가 지나면 이전 카운트는 남지 않음
+    assert _allowed(_hits(backend, "k", 4, 10, [130, 130, 130, 130, 130])) == [True] * 4 + [False]
+
+
+def test_retry_after_matches_when_requests_are_allowed_again():
+    backend = InMemoryRateLimitBackend()
+    _hits(backend, "k", 4, 10, [100, 101, 102, 103])
+    # 112: 이전 몫 3.2 + 현재 1 -> 두 번째 요청부터 거절, 이전 몫이 3 아래로 내려가는 112.5부터 다시 허용
+    blocked = _hits(backend, "k", 4, 10, [112, 112])[1]
+    assert not blocked.allowed
+    assert blocked.retry_after == pytest.approx(0.5)
+    retry_at = 112 + blocked.retry_after
+    assert not _hits(backend, "k", 4, 10, [retry_at - 0.01])[0].allowed
+    assert _hits(backend, "k", 4, 10, [retry_at + 0.01])[0].allowed
+
+
+def test_keys_are_independent():
+    backend = InMemoryRateLimitBackend()
+    assert _allowed(_hits(backend, "a", 1, 10, [100, 100])) == [True, False]
+    assert _allowed(_hits(backend, "b", 1, 10, [100])) == [True]
+
+
+def test_max_keys_evicts_least_recently_used():
+    backend = InMemoryRateLimitBackend(max_keys=3)
+    for key in ("a", "b", "c", "d", "e"):
+        _hits(backend, key, 1, 10, [100])
+    assert len(backend) == 3
+    assert [key for key in "abcde" if key in backend] == ["c", "d", "e"]
+    # 제거된 키는 처음부터 다시 셈
+    assert _allowed(_hits(backend, "a", 1, 10, [100])) == [True]
+    assert len(backend) == 3
+
+
+def test_idle_keys_expire_after_two_windows():
+    backend = InMemoryRateLimitBackend()
+    _hits(backend, "a", 1, 10, [100])
+    _hits(backend, "b", 1, 10, [115])
+    assert len(backend) == 2
+    # a는 120에 만료, b는 130에 만료
+    _hits(backend, "c", 1, 10, [125])
+    assert [key for key in "abc" if key in backend] == ["b", "c"]
+
+
+def test_eviction_follows_expiry_across_window_lengths():
+    backend = InMemoryRateLimitBackend(max_keys=3)
+    # 긴 윈도우 키를 먼저 쓰고 짧은 윈도우 키를 나중에 써도, 먼저 만료되는 것은 짧은 윈도우 키
+    _hits(backend, "long", 1, 600, [100])   # 1200에 만료
+    _hits(backend, "short", 1, 10, [101])   # 120에 만료
+    _hits(backend, "short2", 1, 10, [102])  # 120에 만료
+    # 용량 초과: 가장 오래 쓰지 않은 long이 아니라 가장 먼저 만료될 short가 제거됨
+    _hits(backend, "new", 1, 10, [103])
+    assert [key for key in ("long", "short", "short2", "new") if key in backend] == ["long", "short2", "new"]
+    # 짧은 윈도우 키가 만료되면 긴 윈도우 키는 그대로 남음
+    _hits(backend, "later", 1, 10, [130])
+    assert [key for key in ("long", "short2", "new", "later") if key in backend] == ["long", "later"]
+    assert len(backend) == 2
+
+
+def test_limiter_uses_first_matching_rule():
+    limiter = RateLimiter(
+        InMemoryRateLimitBackend(), 100, 10,
+        rules=[RateLimitRule("login", limit=1, window=60, path_prefix="/users/login", methods=("POST",))],
+    )
+    assert limiter.match("POST", "/users/login").name == "login"
+    assert limiter.match("GET", "/users/login").name == "default"
+
+    async def run():
+        return [await limiter.allow("1.2.3.4", "POST", "/users/login") for _ in range(2)]
+    assert _allowed(asyncio.run(run())) == [True, False]
+
+
+def _client(limit: int, window: int) -> TestClient:
+    app = Starlette(routes=[Route("/", lambda request: PlainTextResponse("ok"))])
+    return TestClient(RateLimitMiddleware(app, requests_limit=limit, time_window=window))
+
+
+def test_middleware_returns_429_with_retry_after():
+    client = _client(2, 60)
+    assert [client.get("/").status_code for _ in range(2)] == [200, 200]
+    response = client.get("/")
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Too Many Requests"}
+    retry_after = int(response.headers["retry-after"])
+    assert 1 <= retry_after <= 120
+
+
+# Redis 백엔드는 fakeredis(Lua 지원)로 같은 시나리오를 확인
+@pytest.fixture
+def redis_backend():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return RedisRateLimitBackend(fakeredis.FakeAsyncRedis(), prefix="test:")
+
+
+def test_redis_backend_matches_in_memory_backend(redis_backend):
+    times = [100, 101, 102, 103, 110, 115, 115, 115, 130, 130, 130, 130, 130]
+    memory = _hits(InMemoryRateLimitBackend(), "k", 4, 10, times)
+    redis = _hits(redis_backend, "k", 4, 10, times)
+    assert _allowed(redis) == _allowed(memory)
+    assert [r.retry_after for r in redis] == pytest.approx([m.retry_after for m in memory])
+
+
+def test_redis_backend_sets_expiry_on_counters(redis_backend):
+    async def run():
+        await redis_backend.hit("k", 4, 10, 100)
+        return await redis_backend.client.pttl("test:k:10")
+    assert 0 < asyncio.run(run()) <= 20_000
+
+
+def test_redis_backend_fails_open():
+    class _BrokenScript:
+        async def __call__(self, keys, args):
+            raise ConnectionError("redis down")
+
+    class _Client:
+        def register_script(self, script):
+            return _BrokenScript()
+
+    result = _hits(RedisRateLimitBackend(_Client()), "k", 1, 10, [100])[0]
+    assert result == RateLimitResult(True)
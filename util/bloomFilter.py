@@ -0,0 +1,76 @@
+# util/bloomFilter.py
+import hashlib
+import math
+import threading
+from typing import Dict, Iterable
+
+
+# Bloom filter (집합 포함 여부를 적은 메모리로 확인하는 확률적 자료구조)
+# - "없음"은 확실함 (add한 값에 대해 False를 돌려주는 일은 없음)
+# - "있을 수 있음"은 error_rate 확률로 틀릴 수 있으므로 정확한 확인이 필요하면 원본(DB)에서 다시 확인
+# - 값을 지울 수 없음 (지워야 하면 새로 만들어서 교체)
+# capacity: 예상 최대 항목 수 (넘으면 오탐률이 올라감), error_rate: capacity개를 넣었을 때의 오탐률
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # 비트 수 m = -n ln p / (ln 2)^2, 해시 함수 수 k = m/n ln 2
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+        # 비트 설정은 읽기-수정-쓰기이므로 동시에 add하면 비트를 잃을 수 있음 -> add만 잠금 (조회는 잠그지 않음)
+        self._lock = threading.Lock()
+
+    # 해시 한 번(blake2b 128비트)으로 두 값을 얻어 k개 위치를 만듦 (Kirsch-Mitzenmacher)
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    # 값 추가, 새로 켜진 비트가 있으면(처음 넣는 값이면) True
+    # 이미 있던 값(또는 오탐으로 있다고 보이는 값)은 개수에 세지 않음
+    def add(self, item: str) -> bool:
+        positions = self._positions(item)
+        with self._lock:
+            bits = self._bits
+            added = False
+            for pos in positions:
+                mask = 1 << (pos & 7)
+                if not bits[pos >> 3] & mask:
+                    bits[pos >> 3] |= mask
+                    added = True
+            if added:
+                self._count += 1
+        return added
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    # 넣은 서로 다른 값의 수 (추정치, 오탐으로 있다고 본 값은 빠지므로 실제보다 조금 적을 수 있음)
+    def __len__(self) -> int:
+        return self._count
+
+    # 현재 항목 수 기준 예상 오탐률
+    def estimated_error_rate(self) -> float:
+        return (1 - math.exp(-self.num_hashes * self._count / self.num_bits)) ** self.num_hashes
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "capacity": self.capacity,
+            "count": self._count,
+            "bits": self.num_bits,
+            "hashes": self.num_hashes,
+            "estimated_error_rate": self.estimated_error_rate(),
+        }
@@ -0,0 +1,191 @@
+# util/compression.py
+import os
+import zlib
+from typing import Iterable, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from util.metrics import registry as metrics_registry
+from util.staticFiles import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+# 이 크기(바이트)보다 작은 응답은 압축하지 않음 (압축 이득보다 헤더/CPU 비용이 큼)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+# gzip 압축 레벨 (1~9), brotli 품질 (0~11)
+# 요청마다 즉석에서 압축하므로 압축률 대비 CPU 비용이 작은 값을 기본으로 사용 (benchmark/compression.py 참고)
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "4"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+# 이 크기(바이트) 이상의 본문(청크)은 스레드풀에서 압축 (zlib/brotli는 압축 중 GIL을 놓으므로 이벤트 루프가 막히지 않음)
+COMPRESSION_OFFLOAD_SIZE = int(os.getenv("COMPRESSION_OFFLOAD_SIZE", str(64 * 1024)))
+# 압축할 Content-Type (이미지/영상처럼 이미 압축된 형식은 제외)
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+    "text/xml",
+)
+
+metrics_registry.describe_counter("http_compressed_responses_total", "Responses compressed by CompressionMiddleware.")
+metrics_registry.describe_counter("http_compression_input_bytes_total", "Response bytes before compression.")
+metrics_registry.describe_counter("http_compression_output_bytes_total", "Response bytes after compression.")
+
+
+# 응답 본문 압축기 (gzip/brotli 공통 인터페이스)
+# 스트리밍 응답은 청크마다 flush해서 받은 만큼 바로 클라이언트로 내보냄
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self._compressor.compress(data)
+        return out + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self._compressor.process(data)
+        return out + (self._compressor.finish() if final else self._compressor.flush())
+
+
+# 응답 압축 미들웨어 (순수 ASGI)
+# - Accept-Encoding에 따라 brotli(설치된 경우) 또는 gzip으로 압축
+# - minimum_size보다 작은 한 번에 끝나는 응답, content_types에 없는 형식, 이미 인코딩된 응답(미리 압축된 정적 파일 등),
+#   Cache-Control: no-transform, 본문이 없는 상태 코드(204/304)와 Range 응답(206)은 그대로 전달
+# - offload_size 이상인 본문(청크)은 스레드풀에서 압축
+# - 스트리밍 응답(more_body=True)은 청크 단위로 압축해서 바로 내보냄 (Content-Length 제거)
+# - 압축한 응답의 ETag는 약한(W/) ETag로 바꿈 (바이트가 달라지므로)
+# - http.response.pathsend(서버가 파일을 직접 전송)는 압축하지 않음
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        gzip_level: int = COMPRESSION_GZIP_LEVEL,
+        brotli_quality: int = COMPRESSION_BROTLI_QUALITY,
+        content_types: Iterable[str] = COMPRESSIBLE_CONTENT_TYPES,
+        offload_size: int = COMPRESSION_OFFLOAD_SIZE,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = frozenset(content_types)
+        self.offload_size = offload_size
+
+    # 클라이언트가 받을 수 있는 인코딩 중 사용할 것 (없으면 None)
+    def _choose_encoding(self, accept_encoding: Optional[str]) -> Optional[str]:
+        accepted = accepted_encodings(accept_encoding)
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _encoder(self, encoding: str):
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+    def _compressible(self, status: int, headers: Headers) -> bool:
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            return False
+        media_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        return media_type in self.content_types
+
+    async def _compress(self, encoder, body: bytes, final: bool) -> bytes:
+        if len(body) >= self.offload_size:
+            return await run_in_threadpool(encoder.compress, body, final)
+        return encoder.compress(body, final)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = self._choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+        encoder = None
+        bytes_in = bytes_out = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, passthrough, encoder, bytes_in, bytes_out
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                if self._compressible(message["status"], Headers(raw=message["headers"])):
+                    # 첫 본문을 보고 압축 여부를 정할 때까지 헤더를 보내지 않음
+                    start_message = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+            if passthrough or start_message is None:
+                await send(message)
+                return
+            if message_type != "http.response.body":
+                # pathsend 등: 압축하지 않고 원래 헤더 그대로 전달
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                encoder = self._encoder(encoding)
+                compressed = await self._compress(encoder, body, final=not more_body)
+                if not more_body and len(compressed) >= len(body):
+                    # 압축해도 줄지 않으면 원본 전달
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag is not None and not etag.startswith("W/"):
+                    headers["etag"] = "W/" + etag
+                if more_body:
+                    del headers["content-length"]
+                else:
+                    headers["content-length"] = str(len(compressed))
+                await send(start_message)
+            else:
+                compressed = await self._compress(encoder, body, final=not more_body)
+
+            bytes_in += len(body)
+            bytes_out += len(compressed)
+            if not more_body:
+                metrics_registry.inc("http_compressed_responses_total")
+                metrics_registry.inc("http_compression_input_bytes_total", bytes_in)
+                metrics_registry.inc("http_compression_output_bytes_total", bytes_out)
+            await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -13,6 +13,7 @@ STATUS_MESSAGE: Mapping[str, str] = MappingProxyType({
     "INVALID_CREDENTIALS": "invalid_credentials",
     "FAILED_TO_UPDATE_SESSION": "failed_to_update_session",
     "TOO_MANY_REQUESTS": "too_many_requests",
+    "SERVER_BUSY": "server_busy",
 
     # 인증/세션
     "LOGIN_SUCCESS": "login_success",
@@ -49,9 +50,18 @@ STATUS_MESSAGE: Mapping[str, str] = MappingProxyType({
     "WRITE_POST_SUCCESS": "write_post_success",
 
     "GET_POST_LIST_FAILED": "get_post_list_failed",
+    "INVALID_OFFSET_OR_LIMIT": "invalid_offset_or_limit",
+    "INVALID_CURSOR": "invalid_cursor",
     "GET_POST_LIST_SUCCESS": "get_post_list_success",
     "GET_POST_FAILED": "get_post_failed",
     "GET_POST_SUCCESS": "get_post_success",
+    "INVALID_SEARCH_QUERY": "invalid_search_query",
+    "SEARCH_POSTS_SUCCESS": "search_posts_success",
+    "SEARCH_POSTS_FAILED": "search_posts_failed",
+    "LIKE_POST_SUCCESS": "like_post_success",
+    "LIKE_POST_FAILED": "like_post_failed",
+    "UNLIKE_POST_SUCCESS": "unlike_post_success",
+    "UNLIKE_POST_FAILED": "unlike_post_failed",
 
     "NOT_FOUND_POST": "not_found_post",
     "NOT_A_SINGLE_POST": "not_a_single_post",
@@ -61,6 +71,8 @@ STATUS_MESSAGE: Mapping[str, str] = MappingProxyType({
     "GET_POSTS_SUCCESS": "get_posts_success",
     "GET_POSTS_FAILED":  "get_posts_failed",
     "FILE_UPLOAD_SUCCESS": "file_upload_success",
+    "INVALID_FILE": "invalid_file",
+    "FILE_TOO_LARGE": "file_too_large",
 
     # 댓글 관련
     "GET_COMMENTS_SUCCESS": "get_comments_success",
@@ -87,6 +99,7 @@ STATUS_CODE: Mapping[str, int] = MappingProxyType({
     "FORBIDDEN": status.HTTP_403_FORBIDDEN,
     "NOT_FOUND": status.HTTP_404_NOT_FOUND,
     "CONFLICT": status.HTTP_409_CONFLICT,
+    "PAYLOAD_TOO_LARGE": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
     # 5xx
     "INTERNAL_SERVER_ERROR": status.HTTP_500_INTERNAL_SERVER_ERROR,
     "NOT_IMPLEMENTED": status.HTTP_501_NOT_IMPLEMENTED,
@@ -0,0 +1,140 @@
+# util/counterBuffer.py
+import asyncio
+import logging
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 카운터 증가분을 메모리에 모았다가 주기적으로 한 번에 DB에 반영하는 버퍼 (write-behind)
+# flush_func: {키: 증가분} 딕셔너리를 받아 DB에 반영하는 코루틴 함수, 실패 시 False 반환 또는 예외 발생
+# interval: 주기적 반영 간격(초)
+# max_pending: 반영되지 않은 증가분 합계가 이 값을 넘으면 주기를 기다리지 않고 바로 반영
+#              (프로세스가 비정상 종료될 때 잃을 수 있는 증가분의 상한)
+# on_flushed: 반영이 끝나고 pending()에서 빠진 뒤 반영된 {키: 증가분}으로 호출 (DB 값을 캐시하는 쪽의 갱신용)
+class CounterBuffer:
+    def __init__(
+        self,
+        name: str,
+        flush_func: Callable[[Dict[Hashable, int]], Awaitable[Optional[bool]]],
+        interval: float = 5.0,
+        max_pending: int = 1000,
+        on_flushed: Optional[Callable[[Dict[Hashable, int]], None]] = None,
+    ):
+        self.name = name
+        self.interval = interval
+        self.max_pending = max_pending
+        self._flush_func = flush_func
+        self._on_flushed = on_flushed
+        self._lock = threading.Lock()
+        self._deltas: Dict[Hashable, int] = {}
+        # DB에 반영 중인 증가분 (반영이 끝날 때까지 pending()에 포함)
+        self._inflight: Dict[Hashable, int] = {}
+        self._pending_total = 0
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_count = 0
+        self._flush_failures = 0
+        self._last_flush_failed = False
+
+    # 증가분 기록 (어느 스레드에서 호출해도 안전)
+    def add(self, key: Hashable, delta: int = 1):
+        with self._lock:
+            value = self._deltas.get(key, 0) + delta
+            if value:
+                self._deltas[key] = value
+            else:
+                self._deltas.pop(key, None)
+            self._pending_total += abs(delta)
+            over = self._pending_total >= self.max_pending
+        if over and self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # 아직 DB에 반영되지 않은 증가분
+    def pending(self, key: Hashable) -> int:
+        with self._lock:
+            return self._deltas.get(key, 0) + self._inflight.get(key, 0)
+
+    # 키의 증가분을 DB에 반영하는 중인지 (이 사이에 읽은 DB 값은 증가분이 들어 있는지 알 수 없음)
+    def flushing(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._inflight
+
+    # 모아둔 증가분을 DB에 반영
+    async def flush(self) -> int:
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            with self._lock:
+                if not self._deltas:
+                    return 0
+                deltas, self._deltas = self._deltas, {}
+                self._inflight = deltas
+                self._pending_total = 0
+
+            ok = False
+            try:
+                ok = await self._flush_func(dict(deltas)) is not False
+            except Exception as e:
+                logger.warning("%s flush failed: %r", self.name, e)
+
+            with self._lock:
+                self._inflight = {}
+                self._last_flush_failed = not ok
+                if not ok:
+                    # 실패한 증가분은 다음 주기에 다시 반영
+                    self._flush_failures += 1
+                    for key, delta in deltas.items():
+                        self._deltas[key] = self._deltas.get(key, 0) + delta
+                        self._pending_total += abs(delta)
+                    return 0
+                self._flush_count += 1
+            if self._on_flushed is not None:
+                self._on_flushed(deltas)
+            return len(deltas)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            # 종료 시 취소되더라도 진행 중인 반영은 끝까지 마치도록 보호
+            await asyncio.shield(self.flush())
+            if self._last_flush_failed:
+                # DB 장애 중에는 max_pending을 넘겨도 곧바로 재시도하지 않고 주기만큼 쉼
+                await asyncio.sleep(self.interval)
+
+    # 백그라운드 반영 작업 시작 (이벤트 루프 안에서 호출)
+    def start(self):
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run(), name=f"{self.name}-flusher")
+
+    # 백그라운드 작업을 멈추고 남은 증가분을 마지막으로 반영
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        self._loop = None
+        self._wakeup = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "keys": len(self._deltas),
+                "pending": self._pending_total,
+                "flush_count": self._flush_count,
+                "flush_failures": self._flush_failures,
+            }
@@ -0,0 +1,46 @@
+# util/cursorUtil.py
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+
+# 커서가 잘못되었을 때 발생 (컨트롤러에서 400으로 변환)
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _to_json(v: Any) -> Any:
+    if isinstance(v, datetime):
+        return {"dt": v.isoformat()}
+    return v
+
+
+def _from_json(v: Any) -> Any:
+    if isinstance(v, dict) and "dt" in v:
+        return datetime.fromisoformat(v["dt"])
+    return v
+
+
+# 정렬 키 값들을 클라이언트에 넘겨줄 불투명한(opaque) 커서 문자열로 인코딩
+# 예: encode_cursor(created_at, post_id)
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+# 커서 문자열을 정렬 키 값 튜플로 디코딩
+# size: 기대하는 값의 개수 (다르면 InvalidCursorError)
+def decode_cursor(cursor: Optional[str], size: int) -> tuple:
+    if not cursor:
+        raise InvalidCursorError("empty cursor")
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != size:
+            raise InvalidCursorError("unexpected cursor shape")
+        return tuple(_from_json(v) for v in values)
+    except InvalidCursorError:
+        raise
+    except Exception as e:
+        raise InvalidCursorError(str(e)) from e
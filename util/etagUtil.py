@@ -0,0 +1,48 @@
+# util/etagUtil.py
+from typing import Optional
+
+from starlette.responses import Response
+
+from util.metrics import registry as metrics_registry
+
+# 로그인한 사용자에게만 보여주는 응답이므로 공유 캐시(CDN/프록시)에는 저장하지 않고,
+# 브라우저는 저장하되 쓸 때마다 If-None-Match로 재검증
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+metrics_registry.describe_counter("conditional_not_modified_total", "Conditional GETs answered with 304 Not Modified.")
+
+
+# 리소스 버전으로 만든 ETag
+# 조회수처럼 반영 대기 중인 값은 같은 버전에서도 본문이 조금 다를 수 있으므로 약한(W/) ETag 사용
+# 예: make_etag("post", 12, 7) -> W/"post-12-7"
+def make_etag(*parts) -> str:
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+# If-None-Match 헤더 값이 etag와 일치하는지 (약한 비교, 여러 값/"*" 지원)
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    target = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == target:
+            return True
+    return False
+
+
+# 304 응답 (본문 없음)
+def not_modified(etag: str) -> Response:
+    metrics_registry.inc("conditional_not_modified_total")
+    return Response(status_code=304, headers={"etag": etag, "cache-control": CONDITIONAL_CACHE_CONTROL})
+
+
+# 200 응답에 ETag/캐시 헤더 추가
+def with_etag(response: Response, etag: str) -> Response:
+    response.headers["etag"] = etag
+    response.headers["cache-control"] = CONDITIONAL_CACHE_CONTROL
+    return response
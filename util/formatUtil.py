@@ -0,0 +1,20 @@
+# util/formatUtil.py
+
+# 1000 미만 숫자는 미리 만들어 둔 문자열 재사용
+_SMALL_COUNTS = tuple(str(i) for i in range(1000))
+
+# 좋아요/댓글/조회수를 화면 표시용 축약 문자열로 변환
+# 1000 미만은 그대로, 1000 이상은 K, 1000000 이상은 M (소수점 첫째 자리에서 반올림)
+# 예: 999 -> "999", 1500 -> "1.5K", 1250000 -> "1.3M"
+# 기존 SQL의 CONCAT(ROUND(x / 1000, 1), 'K')와 같은 결과를 정수 연산만으로 계산
+def compact_count(value) -> str:
+    n = int(value or 0)
+    if 0 <= n < 1000:
+        return _SMALL_COUNTS[n]
+    if n >= 1_000_000:
+        tenths = (n + 50_000) // 100_000
+        return f"{tenths // 10}.{tenths % 10}M"
+    if n >= 1000:
+        tenths = (n + 50) // 100
+        return f"{tenths // 10}.{tenths % 10}K"
+    return str(n)
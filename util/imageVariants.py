@@ -0,0 +1,183 @@
+# util/imageVariants.py
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path as FSPath
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from util.metrics import registry as metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# 크기별 변형 이미지 (이름 -> (최대 가로, 최대 세로, 정사각형으로 자를지 여부))
+# avatar: 목록/댓글의 작성자 프로필, thumb: 게시글 목록 썸네일, detail: 게시글 상세
+VARIANT_SIZES = {
+    "avatar": (96, 96, True),
+    "thumb": (320, 320, False),
+    "detail": (1280, 1280, False),
+}
+# 변형 이미지 포맷 (webp/jpeg/png)
+IMAGE_VARIANT_FORMAT = os.getenv("IMAGE_VARIANT_FORMAT", "webp").lower()
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+# 이 크기(픽셀 수)를 넘는 이미지는 변형을 만들지 않음 (압축 폭탄 방지)
+MAX_IMAGE_PIXELS = 50_000_000
+
+_FORMATS = {"webp": ("WEBP", ".webp"), "jpeg": ("JPEG", ".jpg"), "png": ("PNG", ".png")}
+
+metrics_registry.describe_counter("image_variant_jobs_total", "Uploaded images processed into size variants.")
+metrics_registry.describe_counter("image_variant_failures_total", "Image variant jobs that failed.")
+
+
+# 원본 경로에서 정해지는 변형 이미지 경로
+# 예: ab/cd/<sha256>.png -> ab/cd/<sha256>-thumb.webp
+def variant_path(original_path: str, name: str, suffix: str) -> str:
+    path = FSPath(original_path)
+    return str(path.with_name(f"{path.stem}-{name}{suffix}")).replace(os.sep, "/")
+
+
+def _pillow_available() -> bool:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# 변형 이미지 생성 (프로세스 풀의 작업 프로세스에서 실행)
+# original: 디스크 상의 원본 경로, 반환값: {변형 이름: 원본과 같은 기준의 상대 경로}
+# avatar는 정사각형으로 잘라 맞추고 나머지는 원본보다 크게 늘리지 않음, 이미 만들어진 변형은 다시 만들지 않음
+def _render_variants(original: str, image_format: str) -> Dict[str, str]:
+    from PIL import Image, ImageOps
+
+    Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+    pil_format, suffix = _FORMATS.get(image_format, _FORMATS["webp"])
+    result: Dict[str, str] = {}
+    with Image.open(original) as source:
+        # EXIF 회전 정보 반영
+        image = ImageOps.exif_transpose(source)
+        if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA")
+
+        for name, (width, height, crop) in VARIANT_SIZES.items():
+            dest = variant_path(original, name, suffix)
+            result[name] = dest
+            if os.path.exists(dest):
+                continue
+            if crop:
+                variant = ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+            else:
+                variant = image.copy()
+                variant.thumbnail((width, height), Image.Resampling.LANCZOS)
+            # 같은 원본을 동시에 처리하는 작업끼리 임시 파일이 겹치지 않도록 고유한 이름을 씀
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), prefix=".variant-")
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    variant.save(out, format=pil_format, quality=82, optimize=True)
+                os.chmod(tmp, 0o644)
+                os.replace(tmp, dest)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except FileNotFoundError:
+                    pass
+                raise
+    return result
+
+
+# 업로드 이미지의 변형 생성 파이프라인
+# 요청 경로에서는 예약만 하고 바로 돌아가며, 실제 리사이즈는 프로세스 풀에서 수행
+# 완료되면 on_done(원본 공개 경로, {변형 이름: 공개 경로})을 호출해 file_table에 기록
+# Pillow가 설치되어 있지 않으면 아무것도 하지 않음
+class ImageVariantPipeline:
+    def __init__(self, workers: int = IMAGE_WORKERS, image_format: str = IMAGE_VARIANT_FORMAT):
+        self.workers = workers
+        self.image_format = image_format if image_format in _FORMATS else "webp"
+        self.enabled = _pillow_available()
+        self.on_done: Optional[Callable[[str, Dict[str, str]], Awaitable[object]]] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+        if not self.enabled:
+            logger.warning("Pillow is not installed; image variants are disabled")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    # 변형 생성 예약
+    # disk_path: 원본 파일의 디스크 경로, public_path: 클라이언트에 내려주는 원본 경로 (/public/...)
+    def schedule(self, disk_path: str, public_path: str):
+        if not self.enabled:
+            return
+        task = asyncio.get_running_loop().create_task(self._process(disk_path, public_path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, disk_path: str, public_path: str):
+        loop = asyncio.get_running_loop()
+        try:
+            rendered = await loop.run_in_executor(
+                self._get_executor(), _render_variants, disk_path, self.image_format
+            )
+        except Exception as e:
+            # 이미지가 아니거나 손상된 파일이면 원본만 사용
+            metrics_registry.inc("image_variant_failures_total")
+            logger.warning("image variant generation failed for %s: %r", public_path, e)
+            return
+        metrics_registry.inc("image_variant_jobs_total")
+        public_dir = public_path.rsplit("/", 1)[0]
+        variants = {name: f"{public_dir}/{FSPath(path).name}" for name, path in rendered.items()}
+        if self.on_done is not None:
+            await self.on_done(public_path, variants)
+
+    # 애플리케이션 종료 시 진행 중인 작업을 마치고 프로세스 풀 정리
+    async def stop(self):
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, "workers": self.workers, "pending": len(self._tasks)}
+
+
+# file_table.variants(JSON) 값을 {변형 이름: 공개 경로} 딕셔너리로 변환
+def parse_variants(value) -> Dict[str, str]:
+    if not value:
+        return {}
+    if isinstance(value, dict):
+        return value
+    try:
+        parsed = json.loads(value)
+    except (TypeError, ValueError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+# 이미 만들어진 변형 이미지의 공개 경로 (디스크에 있는 것만)
+# public_path: /public/... 형식의 원본 경로, file_table에 행을 넣을 때 variants 값을 채우는 데 사용
+def existing_variants(public_path: Optional[str]) -> Dict[str, str]:
+    if not public_path or not public_path.startswith("/public/"):
+        return {}
+    _, suffix = _FORMATS.get(image_pipeline.image_format, _FORMATS["webp"])
+    result = {}
+    for name in VARIANT_SIZES:
+        path = variant_path(public_path, name, suffix)
+        if os.path.exists("." + path):
+            result[name] = path
+    return result
+
+
+# file_table.variants 컬럼에 넣을 JSON 문자열 (변형이 없으면 None)
+def variants_json(public_path: Optional[str]) -> Optional[str]:
+    variants = existing_variants(public_path)
+    return json.dumps(variants, separators=(",", ":")) if variants else None
+
+
+image_pipeline = ImageVariantPipeline()
@@ -0,0 +1,52 @@
+# util/jsonResponse.py
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈 사용
+    orjson = None
+
+
+# 표준 JSON 타입이 아닌 값 변환 (jsonable_encoder와 같은 결과가 되도록 맞춤)
+# - datetime/date/time: ISO 8601 문자열
+# - Decimal: 소수부가 없으면 int, 있으면 float
+# - timedelta: 초(float)
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    # orjson은 dict/list/datetime을 C 코드에서 한 번에 직렬화하고, 나머지(Decimal 등)만 _default로 넘김
+    def dumps(content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+else:
+    _encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default)
+
+    def dumps(content: Any) -> bytes:
+        return _encoder.encode(content).encode("utf-8")
+
+
+# DB 행(dict)을 그대로 넘겨도 되는 JSON 응답
+# 엔드포인트가 dict를 반환하면 FastAPI가 jsonable_encoder로 한 번 훑은 뒤 다시 직렬화하지만,
+# 이 응답 객체를 반환하면 그 단계 없이 datetime/Decimal까지 한 번에 직렬화함
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,202 @@
+# util/metrics.py
+from bisect import bisect_left
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from database.instrumentation import current_request_stats
+
+# 요청 처리 시간 히스토그램 구간 (초)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 DB 시간 히스토그램 구간 (초)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# 히스토그램 한 시리즈 (구간별 건수는 누적하지 않고 저장, 출력할 때 누적)
+class _HistogramSeries:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+# 요청 경로(route 템플릿)와 메서드별 시리즈 묶음
+# 한 번 만들어진 뒤에는 관측할 때 새 객체를 만들지 않음
+class _RouteSeries:
+    __slots__ = ("labels", "latency", "db_time", "db_queries", "statuses")
+
+    def __init__(self, method: str, route: str):
+        self.labels = (("method", method), ("route", route))
+        self.latency = _HistogramSeries(REQUEST_BUCKETS)
+        self.db_time = _HistogramSeries(DB_BUCKETS)
+        self.db_queries = 0
+        self.statuses: Dict[int, int] = {}
+
+
+# 메트릭 저장소
+# 기록은 모두 이벤트 루프 스레드의 미들웨어에서 일어나므로 락 없이 정수 덧셈만 수행
+# 다른 모듈의 상태(커넥션 풀 등)는 수집 함수(collector)로 등록해 두고 /metrics 조회 시에만 읽음
+class MetricsRegistry:
+    def __init__(self):
+        self._routes: Dict[str, Dict[str, _RouteSeries]] = {}
+        self._counters: Dict[str, int] = {}
+        self._help: Dict[str, str] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, Iterable[Tuple[dict, float]]]]]] = []
+        self.in_flight = 0
+
+    def route_series(self, method: str, route: str) -> _RouteSeries:
+        by_method = self._routes.get(route)
+        if by_method is None:
+            by_method = self._routes[route] = {}
+        series = by_method.get(method)
+        if series is None:
+            series = by_method[method] = _RouteSeries(method, route)
+        return series
+
+    # 이름 하나짜리 단순 카운터
+    def describe_counter(self, name: str, help_text: str):
+        self._counters.setdefault(name, 0)
+        self._help[name] = help_text
+
+    def inc(self, name: str, amount: int = 1):
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    # 조회 시점에 값을 읽는 수집 함수 등록
+    # collector는 (이름, 타입, 설명, [(라벨 dict, 값), ...]) 튜플들을 반환
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, Iterable[Tuple[dict, float]]]]]):
+        self._collectors.append(collector)
+
+    # Prometheus 텍스트 형식으로 출력
+    def render(self) -> str:
+        lines: List[str] = []
+        routes = [s for by_method in list(self._routes.values()) for s in list(by_method.values())]
+
+        lines.append("# HELP http_request_duration_seconds Request latency by route template.")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for s in routes:
+            self._render_histogram(lines, "http_request_duration_seconds", s.labels, s.latency)
+
+        lines.append("# HELP http_requests_total Requests by route template and status code.")
+        lines.append("# TYPE http_requests_total counter")
+        for s in routes:
+            for status, n in sorted(s.statuses.items()):
+                labels = s.labels + (("status", str(status)),)
+                lines.append(f"http_requests_total{_format_labels(labels)} {n}")
+
+        lines.append("# HELP http_requests_in_flight Requests currently being processed.")
+        lines.append("# TYPE http_requests_in_flight gauge")
+        lines.append(f"http_requests_in_flight {self.in_flight}")
+
+        lines.append("# HELP http_request_db_duration_seconds Database time spent per request by route template.")
+        lines.append("# TYPE http_request_db_duration_seconds histogram")
+        for s in routes:
+            self._render_histogram(lines, "http_request_db_duration_seconds", s.labels, s.db_time)
+
+        lines.append("# HELP http_request_db_queries_total Database queries run by route template.")
+        lines.append("# TYPE http_request_db_queries_total counter")
+        for s in routes:
+            lines.append(f"http_request_db_queries_total{_format_labels(s.labels)} {s.db_queries}")
+
+        for name, value in list(self._counters.items()):
+            lines.append(f"# HELP {name} {self._help.get(name, name)}")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+
+        for collector in self._collectors:
+            for name, kind, help_text, samples in collector():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(tuple(labels.items()))} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(lines: List[str], name: str, labels, series: _HistogramSeries):
+        cumulative = 0
+        for bound, n in zip(series.bounds + (float("inf"),), series.counts):
+            cumulative += n
+            le = labels + (("le", _format_value(bound)),)
+            lines.append(f"{name}_bucket{_format_labels(le)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(series.sum)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {series.count}")
+
+
+registry = MetricsRegistry()
+registry.describe_counter("http_rate_limited_total", "Requests rejected with 429 by the rate limiter.")
+registry.describe_counter("http_timeouts_total", "Requests answered with 504 by the timeout middleware.")
+
+
+# 요청 템플릿 경로 (/posts/{post_id} 등)
+# 정적 파일처럼 마운트된 앱은 마운트 경로, 매칭되는 라우트가 없으면 "<unmatched>"로 묶어 라벨 수를 제한
+def _route_template(scope: Scope, root_path: str) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return getattr(route, "path_format", None) or getattr(route, "path", "<unmatched>")
+    mounted = scope.get("root_path", "")
+    if mounted and mounted != root_path:
+        return mounted + "/{path}"
+    return "<unmatched>"
+
+
+# 요청 메트릭 수집 미들웨어 (순수 ASGI)
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics: Optional[MetricsRegistry] = None):
+        self.app = app
+        self.metrics = metrics or registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        root_path = scope.get("root_path", "")
+        status_code = 500
+        start = perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.in_flight -= 1
+            series = metrics.route_series(scope["method"], _route_template(scope, root_path))
+            series.latency.observe(perf_counter() - start)
+            series.statuses[status_code] = series.statuses.get(status_code, 0) + 1
+            request_stats = current_request_stats.get()
+            if request_stats is not None:
+                series.db_time.observe(request_stats.db_ms / 1000)
+                series.db_queries += request_stats.count
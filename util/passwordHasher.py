@@ -0,0 +1,86 @@
+# util/passwordHasher.py
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+import bcrypt
+
+SALT_ROUNDS = 10
+
+
+# 해싱 대기열이 가득 찼을 때 발생 (호출하는 쪽에서 503으로 응답)
+class PasswordHasherBusyError(Exception):
+    pass
+
+
+# bcrypt 해싱/검증 전용 실행기
+# - 이벤트 루프나 DB 스레드풀이 아닌 별도 스레드풀에서 실행 (bcrypt는 계산 중 GIL을 놓으므로 스레드로도 코어를 나눠 씀)
+# - 실행 중이거나 기다리는 작업이 max_pending개를 넘으면 큐에 쌓지 않고 바로 거절 (로그인 폭주가 다른 요청을 밀어내지 않게 함)
+class PasswordHasher:
+    def __init__(self, workers: int, max_pending: int, rounds: int = SALT_ROUNDS):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 아래 값들은 이벤트 루프 스레드에서만 갱신
+        self._pending = 0
+        # 실행을 받아들인 작업 수 (거절된 작업은 _rejected_count로만 셈)
+        self._counts = {"hash": 0, "verify": 0}
+        self._rejected_count = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, kind: str, func, *args):
+        if self._pending >= self.max_pending:
+            self._rejected_count += 1
+            raise PasswordHasherBusyError(f"password hasher queue is full ({self._pending} pending)")
+        loop = asyncio.get_running_loop()
+        self._counts[kind] += 1
+        self._pending += 1
+        try:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+
+    # 비밀번호 해싱 (저장용 문자열 반환)
+    async def hash(self, password: str) -> str:
+        hashed = await self._run("hash", self._hashpw, password.encode("utf-8"), self.rounds)
+        return hashed.decode("utf-8")
+
+    # 비밀번호 검증
+    async def verify(self, password: str, hashed: Union[str, bytes]) -> bool:
+        if isinstance(hashed, str):
+            hashed = hashed.encode("utf-8")
+        return await self._run("verify", bcrypt.checkpw, password.encode("utf-8"), hashed)
+
+    @staticmethod
+    def _hashpw(password: bytes, rounds: int) -> bytes:
+        return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+    # 애플리케이션 종료 시 스레드풀 정리
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "hash_count": self._counts["hash"],
+            "verify_count": self._counts["verify"],
+            "rejected_count": self._rejected_count,
+        }
+
+
+# 기본 스레드 수는 CPU 코어 수, 대기 한도는 스레드 수의 8배
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+password_hasher = PasswordHasher(
+    workers=PASSWORD_HASH_WORKERS,
+    max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 8))),
+)
@@ -0,0 +1,68 @@
+# util/queryBudget.py
+import logging
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from database.instrumentation import RequestQueryStats, current_request_stats
+
+logger = logging.getLogger(__name__)
+
+
+# 요청 템플릿 경로 (/posts/{post_id} 등), 라우팅 전이거나 매칭되지 않으면 실제 경로
+def _route_path(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope.get("path", "")
+
+
+# 요청별 DB 쿼리 계측 미들웨어 (순수 ASGI)
+# - 요청마다 쿼리 수와 DB 시간을 모아 Server-Timing 헤더(db/app/total)로 내보냄
+# - 쿼리 수가 budget을 넘으면 경고 로그
+# - 같은 형태의 쿼리가 n_plus_one_threshold번 이상 반복되면 N+1 의심 경고 로그
+class QueryBudgetMiddleware:
+    def __init__(self, app: ASGIApp, budget: int = 8, n_plus_one_threshold: int = 3, server_timing: bool = True):
+        self.app = app
+        self.budget = budget
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_request_stats.set(stats)
+        start = perf_counter()
+
+        async def send_wrapper(message: Message):
+            if self.server_timing and message["type"] == "http.response.start":
+                total_ms = (perf_counter() - start) * 1000
+                db_ms = stats.db_ms
+                value = (
+                    f'db;dur={db_ms:.1f};desc="{stats.count} queries", '
+                    f"app;dur={max(total_ms - db_ms, 0.0):.1f}, "
+                    f"total;dur={total_ms:.1f}"
+                )
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", value.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_stats.reset(token)
+            self._report(scope, stats)
+
+    def _report(self, scope: Scope, stats: RequestQueryStats):
+        if stats.count == 0:
+            return
+        route = _route_path(scope)
+        if stats.count > self.budget:
+            logger.warning(
+                "query budget exceeded: %s %s ran %d queries (budget %d, db %.1f ms)",
+                scope.get("method"), route, stats.count, self.budget, stats.db_ms,
+            )
+        repeated = stats.repeated_shapes(self.n_plus_one_threshold)
+        for shape, n in repeated:
+            logger.warning("possible N+1: %s %s ran %dx: %s", scope.get("method"), route, n, shape)
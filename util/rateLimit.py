@@ -0,0 +1,187 @@
+# util/rateLimit.py
+import logging
+from collections import OrderedDict
+from time import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 경로별 속도 제한 규칙
+# name: 카운터 키 접두사 (규칙마다 따로 센다)
+# limit/window: window초 동안 허용 요청 수
+# path_prefix: 이 경로로 시작하는 요청에 적용
+# methods: 적용할 HTTP 메서드 (None이면 전체)
+class RateLimitRule(NamedTuple):
+    name: str
+    limit: int
+    window: float
+    path_prefix: str = "/"
+    methods: Optional[Tuple[str, ...]] = None
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return path.startswith(self.path_prefix)
+
+
+# 요청 허용 여부
+# retry_after: 거절된 경우 더 요청하지 않으면 다시 허용되기까지 남은 시간(초)
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    retry_after: float = 0.0
+
+
+_ALLOWED = RateLimitResult(True)
+
+
+# 슬라이딩 윈도우 카운터 계산
+# 이전 윈도우 카운트를 현재 윈도우에서 지난 비율만큼 줄여서 더함 -> 키마다 정수 두 개만 유지
+def _estimate(prev: int, cur: int, now: float, window: float) -> float:
+    elapsed = (now % window) / window
+    return prev * (1.0 - elapsed) + cur
+
+
+# 거절된 키가 다시 허용되기까지 남은 시간(초)
+# - 현재 윈도우 카운트가 한도 미만: 이전 윈도우 몫이 줄어들어 추정치가 한도 아래로 내려가는 시점
+# - 현재 윈도우에서 이미 한도를 채움: 다음 윈도우에서 (이전 윈도우가 된) 현재 카운트 몫이 줄어드는 시점
+def _retry_after(prev: int, cur: int, limit: int, now: float, window: float) -> float:
+    offset = now % window
+    if limit <= 0:
+        return window - offset
+    if cur < limit:
+        return max(0.0, (1.0 - (limit - cur) / prev) * window - offset)
+    return (window - offset) + (1.0 - limit / cur) * window
+
+
+# 프로세스 메모리 기반 백엔드 (워커마다 따로 셈)
+# 키마다 [윈도우 번호, 이전 윈도우 카운트, 현재 윈도우 카운트, 만료 시각]만 저장
+# 만료 시각은 마지막 사용 윈도우 + 2윈도우이므로 윈도우 길이가 같은 키끼리는 마지막 사용 순서 = 만료 순서
+# -> 윈도우 길이별로 사용 순서(OrderedDict)를 따로 두고, 각 순서의 앞에서부터 만료된 키를 정리
+#    max_keys를 넘으면 가장 먼저 만료될 키부터 제거 (경로별 윈도우가 달라도 살아 있는 키가 만료된 키보다 먼저 지워지지 않음)
+class InMemoryRateLimitBackend:
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._windows: "Dict[float, OrderedDict[str, list]]" = {}
+        self._size = 0
+
+    async def hit(self, key: str, limit: int, window: float, now: float) -> RateLimitResult:
+        self._evict(now)
+        entries = self._windows.get(window)
+        if entries is None:
+            entries = self._windows[window] = OrderedDict()
+        index = int(now // window)
+        entry = entries.get(key)
+        if entry is None:
+            entry = [index, 0, 0, 0.0]
+            entries[key] = entry
+            self._size += 1
+        else:
+            entries.move_to_end(key)
+            if entry[0] != index:
+                # 바로 이전 윈도우면 현재 카운트를 이전으로 넘기고, 더 오래됐으면 초기화
+                entry[1] = entry[2] if entry[0] == index - 1 else 0
+                entry[2] = 0
+                entry[0] = index
+        # 두 윈도우가 지나면 더 이상 계산에 쓰이지 않음
+        entry[3] = (index + 2) * window
+
+        if _estimate(entry[1], entry[2], now, window) >= limit:
+            return RateLimitResult(False, _retry_after(entry[1], entry[2], limit, now, window))
+        entry[2] += 1
+        return _ALLOWED
+
+    def _evict(self, now: float):
+        for window, entries in list(self._windows.items()):
+            while entries:
+                key, entry = next(iter(entries.items()))
+                if entry[3] > now:
+                    break
+                del entries[key]
+                self._size -= 1
+            if not entries:
+                del self._windows[window]
+        while self._size >= self.max_keys:
+            # 윈도우 길이별 순서의 맨 앞 중 가장 먼저 만료되는 키 제거
+            entries = min(self._windows.values(), key=lambda e: next(iter(e.values()))[3])
+            entries.popitem(last=False)
+            self._size -= 1
+            if not entries:
+                self._windows = {w: e for w, e in self._windows.items() if e}
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in entries for entries in self._windows.values())
+
+    def __len__(self) -> int:
+        return self._size
+
+
+# Redis 기반 백엔드 (모든 워커가 같은 카운터를 공유)
+# 확인과 증가를 Lua 스크립트로 원자적으로 처리
+# 허용되면 {1}, 거절되면 Retry-After 계산용으로 {0, 현재 윈도우 카운트, 이전 윈도우 카운트}
+_SLIDING_WINDOW_LUA = """
+local cur = tonumber(redis.call('GET', KEYS[1]) or '0')
+local prev = tonumber(redis.call('GET', KEYS[2]) or '0')
+if prev * tonumber(ARGV[1]) + cur >= tonumber(ARGV[2]) then
+    return {0, cur, prev}
+end
+redis.call('INCR', KEYS[1])
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return {1}
+"""
+
+
+class RedisRateLimitBackend:
+    def __init__(self, client, prefix: str = "rate_limit:"):
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(_SLIDING_WINDOW_LUA)
+
+    async def hit(self, key: str, limit: int, window: float, now: float) -> RateLimitResult:
+        index = int(now // window)
+        weight = 1.0 - (now % window) / window
+        keys = [f"{self.prefix}{key}:{index}", f"{self.prefix}{key}:{index - 1}"]
+        try:
+            result = await self._script(keys=keys, args=[repr(weight), limit, int(window * 2000)])
+        except Exception as e:
+            # Redis 장애 시에는 서비스를 막지 않고 통과시킴
+            logger.warning("rate limit backend error: %r", e)
+            return _ALLOWED
+        if int(result[0]):
+            return _ALLOWED
+        return RateLimitResult(False, _retry_after(int(result[2]), int(result[1]), limit, now, window))
+
+
+# 속도 제한 엔진
+# 요청 경로에 맞는 첫 번째 규칙을 적용하고, 맞는 규칙이 없으면 기본 한도(default_limit/default_window)를 적용
+class RateLimiter:
+    def __init__(
+        self,
+        backend,
+        default_limit: int,
+        default_window: float,
+        rules: Iterable[RateLimitRule] = (),
+    ):
+        self.backend = backend
+        self.rules = tuple(rules)
+        self.default_rule = RateLimitRule("default", default_limit, default_window)
+
+    def match(self, method: str, path: str) -> RateLimitRule:
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule
+        return self.default_rule
+
+    # 요청 허용 여부 (허용되면 카운트 증가, 거절되면 다시 허용되기까지 남은 시간 포함)
+    async def allow(self, client_id: str, method: str, path: str) -> RateLimitResult:
+        rule = self.match(method, path)
+        return await self.backend.hit(f"{rule.name}:{client_id}", rule.limit, rule.window, time())
+
+
+# 환경 설정에 맞는 백엔드 생성
+# RATE_LIMIT_BACKEND=redis 이면 REDIS_URL의 Redis를 사용, 그 외에는 메모리 백엔드
+def create_backend(kind: Optional[str], redis_url: Optional[str] = None, max_keys: int = 100_000):
+    if (kind or "memory").lower() == "redis":
+        from redis import asyncio as redis_asyncio
+        return RedisRateLimitBackend(redis_asyncio.Redis.from_url(redis_url or "redis://localhost:6379/0"))
+    return InMemoryRateLimitBackend(max_keys=max_keys)
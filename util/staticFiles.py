@@ -0,0 +1,107 @@
+# util/staticFiles.py
+import os
+import re
+from mimetypes import guess_type
+from typing import Optional, Tuple, Union
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# 내용 해시로 이름 붙인 파일 경로 (util.uploadUtil.blob_path 형식: ab/cd/abcd...89.png)
+# 변형 이미지(ab/cd/abcd...89-thumb.webp)도 원본 해시에서 정해지므로 포함
+_BLOB_PATH_RE = re.compile(r"(?:^|/)([0-9a-f]{2})/([0-9a-f]{2})/(\1\2[0-9a-f]{60}(?:-[a-z]+)?)(?:\.[a-z0-9]{1,8})?$")
+
+# 내용이 바뀌지 않는 파일의 캐시 정책 (1년, 재검증 없음)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 이름이 내용과 무관한 기존 파일은 같은 이름으로 덮어쓸 수 있으므로 매번 ETag로 재검증
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# 미리 압축해 둔 파일(.br/.gz)을 찾아볼 확장자 (이미 압축된 이미지 포맷은 제외)
+PRECOMPRESSED_SUFFIXES = frozenset((".svg", ".txt", ".json", ".css", ".js", ".html"))
+# 선호 순서
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+# 정적 파일 응답
+# 큰 파일을 읽어 보낼 때 청크 수를 줄이도록 청크 크기를 키움
+# 서버가 http.response.pathsend 확장을 지원하면 Starlette가 파일 경로만 넘겨 서버가 sendfile로 전송
+class StaticFileResponse(FileResponse):
+    chunk_size = 256 * 1024
+
+
+# Accept-Encoding 헤더에서 허용된 인코딩 (q=0은 제외)
+def accepted_encodings(value: Optional[str]) -> frozenset:
+    if not value:
+        return frozenset()
+    accepted = set()
+    for item in value.split(","):
+        token, _, params = item.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=") and params[2:] in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(token.strip().lower())
+    return frozenset(accepted)
+
+
+# 업로드 파일 서빙용 StaticFiles
+# - 내용 해시 경로의 파일: 파일 이름의 해시를 강한 ETag로 쓰고 immutable 캐시 헤더를 붙임
+#   (같은 경로의 내용은 절대 바뀌지 않으므로 브라우저/CDN이 재검증 없이 캐시해도 됨)
+# - 그 외 기존 파일: mtime/크기 기반 ETag로 매번 재검증 (no-cache)
+# - 압축이 잘 되는 형식은 옆에 .br/.gz 파일이 있으면 Accept-Encoding에 맞춰 그 파일을 보냄
+# - Range 요청(206)과 If-None-Match(304)는 Starlette FileResponse/StaticFiles 동작 그대로
+class ImmutableStaticFiles(StaticFiles):
+    def file_response(
+        self,
+        full_path: Union[str, "os.PathLike[str]"],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        path = os.fspath(full_path)
+        media_type = guess_type(path)[0] or "text/plain"
+        headers = {}
+
+        encoding = None
+        _, suffix = os.path.splitext(path)
+        if suffix.lower() in PRECOMPRESSED_SUFFIXES:
+            encoded = self._precompressed(path, request_headers.get("accept-encoding"))
+            if encoded is not None:
+                headers["vary"] = "Accept-Encoding"
+                encoding, encoded_path, encoded_stat = encoded
+                if encoding is not None:
+                    headers["content-encoding"] = encoding
+                    path, stat_result = encoded_path, encoded_stat
+
+        blob = _BLOB_PATH_RE.search(os.fspath(full_path).replace(os.sep, "/"))
+        if blob is not None:
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+            # 인코딩이 다르면 바이트가 다르므로 ETag도 구분
+            headers["etag"] = f'"{blob.group(3)}{"-" + encoding if encoding else ""}"'
+        else:
+            headers["cache-control"] = REVALIDATE_CACHE_CONTROL
+
+        response = StaticFileResponse(
+            path, status_code=status_code, headers=headers, media_type=media_type, stat_result=stat_result
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    # 미리 압축된 파일 찾기
+    # 압축 파일이 하나라도 있으면 (사용할 인코딩 또는 None, 경로, stat) 반환, 없으면 None
+    @staticmethod
+    def _precompressed(path: str, accept_encoding: Optional[str]) -> Optional[Tuple[Optional[str], str, Optional[os.stat_result]]]:
+        accepted = accepted_encodings(accept_encoding)
+        found = False
+        for encoding, extension in _ENCODINGS:
+            try:
+                encoded_stat = os.stat(path + extension)
+            except OSError:
+                continue
+            found = True
+            if encoding in accepted:
+                return encoding, path + extension, encoded_stat
+        return (None, path, None) if found else None
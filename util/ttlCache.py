@@ -0,0 +1,110 @@
+# util/ttlCache.py
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+# 크기 제한(LRU)과 만료 시간(TTL)이 있는 스레드 안전한 메모리 캐시
+# max_size: 최대 항목 수 (넘치면 가장 오래 사용하지 않은 항목부터 제거)
+# ttl: 항목 유효 시간(초)
+class TTLCache:
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        # 무효화(pop/clear)나 갱신(update)이 일어날 때마다 증가
+        # 조회 전 값을 기억해 두었다가 set(generation=...)에 넘기면
+        # 조회하는 사이에 무효화된 오래된 값이 다시 저장되는 것을 막을 수 있음
+        self._generation = 0
+
+    # 캐시 조회 (없거나 만료되었으면 default 반환)
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                self._misses += 1
+                return default
+            expires_at, value = item
+            if expires_at <= monotonic():
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    # 현재 무효화 세대
+    def generation(self) -> int:
+        return self._generation
+
+    # 캐시 저장
+    # generation을 넘기면 그 이후 무효화가 있었을 때 저장하지 않고 False 반환
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, generation: Optional[int] = None) -> bool:
+        expires_at = monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+        return True
+
+    # 캐시 무효화
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            self._generation += 1
+            item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    # 항목 값을 제자리에서 갱신 (있으면 func(값)으로 바꾸고 True, 없거나 만료되었으면 False)
+    # 만료 시각과 LRU 순서는 그대로 두고, 갱신 전에 조회한 값이 이후 저장되지 않도록 세대는 올림
+    def update(self, key: Hashable, func: Callable[[Any], Any]) -> bool:
+        with self._lock:
+            self._generation += 1
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING or item[0] <= monotonic():
+                return False
+            self._data[key] = (item[0], func(item[1]))
+        return True
+
+    # 조건에 맞는 항목을 모두 무효화하고 제거한 개수 반환 (전체를 훑으므로 드물게 일어나는 변경에만 사용)
+    def pop_if(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        with self._lock:
+            self._generation += 1
+            keys = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # 캐시 적중/실패/제거 통계
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
@@ -0,0 +1,208 @@
+# util/uploadUtil.py
+import gzip
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path as FSPath
+from time import perf_counter
+from typing import Iterable, NamedTuple, Optional
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from util.constant.httpStatusCode import STATUS_CODE, STATUS_MESSAGE
+from util.metrics import registry as metrics_registry
+from util.staticFiles import PRECOMPRESSED_SUFFIXES
+
+logger = logging.getLogger(__name__)
+
+# 업로드 파일 최대 크기 (바이트)
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+# 최종 위치로 옮길 때 한 번에 읽고 쓰는 크기
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# multipart 경계/헤더 등 파일 외 본문에 허용하는 여유분
+_MULTIPART_OVERHEAD = 64 * 1024
+# 저장 파일명에 붙일 수 있는 확장자
+_SUFFIX_RE = re.compile(r"\.[a-z0-9]{1,8}")
+
+metrics_registry.describe_counter("upload_bytes_total", "Bytes written by accepted uploads.")
+metrics_registry.describe_counter("uploads_total", "Uploads saved.")
+metrics_registry.describe_counter("uploads_deduplicated_total", "Uploads whose content was already stored.")
+metrics_registry.describe_counter("uploads_rejected_total", "Uploads rejected with 413 for exceeding UPLOAD_MAX_BYTES.")
+
+
+def _too_large() -> HTTPException:
+    metrics_registry.inc("uploads_rejected_total")
+    return HTTPException(status_code=STATUS_CODE["PAYLOAD_TOO_LARGE"], detail=STATUS_MESSAGE["FILE_TOO_LARGE"])
+
+
+# 업로드 본문 크기 제한 미들웨어 (순수 ASGI)
+# - Content-Length가 한도를 넘으면 본문을 읽기 전에 바로 413 응답
+# - Content-Length가 없거나(chunked) 거짓이면 읽는 도중 누적 크기가 한도를 넘는 순간 413 (나머지는 읽지 않음)
+class UploadLimitMiddleware:
+    def __init__(self, app: ASGIApp, max_bytes: int = UPLOAD_MAX_BYTES, paths: Iterable[str] = ()):
+        self.app = app
+        self.max_body = max_bytes + _MULTIPART_OVERHEAD
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    too_large = int(value) > self.max_body
+                except ValueError:
+                    too_large = False
+                if too_large:
+                    exc = _too_large()
+                    response = JSONResponse(
+                        {"detail": exc.detail},
+                        status_code=exc.status_code,
+                        headers={"connection": "close"},
+                    )
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+        max_body = self.max_body
+
+        async def receive_wrapper() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_body:
+                    # 폼 파싱 중 발생한 HTTPException은 FastAPI가 그대로 전달하므로 413 응답이 됨
+                    raise _too_large()
+            return message
+
+        await self.app(scope, receive_wrapper, send)
+
+
+# 복사 중 한도 초과 (스레드풀 안에서 발생, save_upload에서 413으로 변환)
+class _UploadTooLarge(Exception):
+    pass
+
+
+# 저장된 업로드 정보
+# relative_path: base_dir 기준 경로 (공개 URL 경로에 그대로 붙임)
+# deduplicated: 같은 내용의 파일이 이미 있어서 새로 쓰지 않았는지 여부
+class SavedUpload(NamedTuple):
+    path: str
+    relative_path: str
+    size: int
+    sha256: str
+    deduplicated: bool
+    elapsed: float
+
+
+# 내용 해시(sha256)로 정한 저장 경로 (base_dir 기준)
+# 앞 두 글자씩 두 단계 하위 디렉토리로 나눠 한 디렉토리에 파일이 몰리지 않게 함
+# 예: ab/cd/abcd...89.png
+def blob_path(digest: str, suffix: str = "") -> str:
+    return f"{digest[:2]}/{digest[2:4]}/{digest}{suffix}"
+
+
+# 클라이언트 파일명의 확장자 (정적 파일 서빙 시 Content-Type 판단용), 이상한 값이면 빈 문자열
+def _safe_suffix(filename: Optional[str]) -> str:
+    suffix = FSPath(filename or "").suffix.lower()
+    return suffix if _SUFFIX_RE.fullmatch(suffix) else ""
+
+
+# SVG 같은 텍스트 형식은 gzip으로 미리 압축한 파일(<경로>.gz)을 옆에 둠 (정적 파일 서빙 시 Accept-Encoding에 맞춰 사용)
+# 압축해도 10% 이상 줄지 않으면 두지 않음
+def _precompress(src_path: str, dest: FSPath):
+    with open(src_path, "rb") as f:
+        data = f.read()
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(compressed) > len(data) * 0.9:
+        return
+    fd, tmp_path = tempfile.mkstemp(dir=dest.parent, prefix=".upload-")
+    with os.fdopen(fd, "wb") as out:
+        out.write(compressed)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, f"{dest}.gz")
+
+
+# 스풀된 업로드 파일을 내용 해시 경로로 청크 단위 복사 (스레드풀에서 실행)
+# 복사하면서 sha256을 계산해 임시 파일에 쓴 뒤 해시 경로로 이름을 바꿈
+# 같은 내용의 파일이 이미 있으면 임시 파일을 지우고 기존 파일을 그대로 사용 (중복 제거)
+# 실패하거나 한도를 넘으면 반쯤 쓰인 파일이 남지 않음
+def _store_blob(src, base_dir: FSPath, suffix: str, max_bytes: int) -> tuple:
+    src.seek(0)
+    fd, tmp_path = tempfile.mkstemp(dir=base_dir, prefix=".upload-")
+    size = 0
+    digest = hashlib.sha256()
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = src.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise _UploadTooLarge()
+                digest.update(chunk)
+                out.write(chunk)
+        hex_digest = digest.hexdigest()
+        relative_path = blob_path(hex_digest, suffix)
+        dest = base_dir / relative_path
+        if dest.exists():
+            os.unlink(tmp_path)
+            return relative_path, size, hex_digest, True
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp는 소유자만 읽을 수 있는 권한으로 만들므로 정적 파일 서빙용 권한으로 맞춤
+        os.chmod(tmp_path, 0o644)
+        if suffix in PRECOMPRESSED_SUFFIXES:
+            _precompress(tmp_path, dest)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return relative_path, size, hex_digest, False
+
+
+# 업로드 파일 저장
+# python-multipart가 이미 임시 파일(메모리/디스크)에 받아 둔 내용을 이벤트 루프 밖에서 내용 해시 경로로 옮김
+# 파일 이름이 내용으로 정해지므로 같은 이름의 다른 파일이 덮어쓰이지 않고, 한 번 쓴 경로의 내용은 바뀌지 않음
+# 저장 크기/시간을 로그와 /metrics(upload_bytes_total)로 남김
+async def save_upload(upfile: UploadFile, base_dir: str, max_bytes: int = UPLOAD_MAX_BYTES) -> SavedUpload:
+    if upfile.size is not None and upfile.size > max_bytes:
+        raise _too_large()
+
+    save_dir = FSPath(base_dir)
+    save_dir.mkdir(parents=True, exist_ok=True)
+
+    start = perf_counter()
+    try:
+        relative_path, size, digest, deduplicated = await run_in_threadpool(
+            _store_blob, upfile.file, save_dir, _safe_suffix(upfile.filename), max_bytes
+        )
+    except _UploadTooLarge:
+        raise _too_large()
+    elapsed = perf_counter() - start
+
+    file_path = save_dir / relative_path
+    metrics_registry.inc("uploads_total")
+    if deduplicated:
+        metrics_registry.inc("uploads_deduplicated_total")
+    else:
+        metrics_registry.inc("upload_bytes_total", size)
+    logger.info(
+        "upload saved: %s (%d bytes in %.1f ms, %.1f MB/s%s)",
+        file_path, size, elapsed * 1000, size / elapsed / 1e6 if elapsed > 0 else 0.0,
+        ", deduplicated" if deduplicated else "",
+    )
+    return SavedUpload(str(file_path), relative_path, size, digest, deduplicated, elapsed)